@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Parse backlog_questions.md into a queryable index and cache it per repository.
+
+Each checklist item becomes a record with its status, priority, related slugs
+and the section header it sits under. The index is cached next to the backlog in
+<root>/.backlog_index and reused while the file's size, mtime and content hash
+are unchanged, so querying many repositories only re-reads the ones that changed.
+
+Usage:
+  python3 scripts/backlog_index.py --root /career
+  python3 scripts/backlog_index.py --root /career --priority HIGH --status open
+  python3 scripts/backlog_index.py --root /tenants/a --root /tenants/b --related demo-project --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from index_cache import is_fresh, load_cached_index, save_cached_index
+
+BACKLOG_NAME = "backlog_questions.md"
+BACKLOG_INDEX_NAME = ".backlog_index"
+BACKLOG_INDEX_VERSION = 1
+CHECKBOX = re.compile(r"- \[([ xX])\]")
+HEADER = re.compile(r"#+\s*(.*?)\s*#*$")
+PRIORITY_TAG = re.compile(r"priority:\s*([a-z]+)", re.IGNORECASE)
+RELATED_TAG = re.compile(r"\(related:\s*([^)]*)\)", re.IGNORECASE)
+TAG = re.compile(r"\((?:priority|related):[^)]*\)", re.IGNORECASE)
+
+# Indexes already loaded by this process, keyed by backlog path.
+LOADED_INDEXES: dict[str, dict[str, Any]] = {}
+
+
+def item_tags(line: str) -> tuple[str, str | None, list[str]]:
+    priority = PRIORITY_TAG.search(line)
+    related = [slug.strip() for tag in RELATED_TAG.findall(line) for slug in tag.split(",") if slug.strip()]
+    return (
+        "open" if line[3] == " " else "done",
+        priority.group(1).upper() if priority else None,
+        list(dict.fromkeys(related)),
+    )
+
+
+def index_backlog(text: str) -> dict[str, Any]:
+    # Columnar so the cached form decodes quickly: only the raw item lines, their
+    # positions and the postings are stored; full records are rebuilt on demand
+    # for the items a query actually returns (see backlog_item).
+    index: dict[str, Any] = {
+        "lines": [],
+        "raw": [],
+        "section_of": [],
+        "sections": [""],
+        "by_status": {},
+        "by_priority": {},
+        "by_related": {},
+    }
+    lines, raw, section_of, sections = index["lines"], index["raw"], index["section_of"], index["sections"]
+    by_status, by_priority, by_related = index["by_status"], index["by_priority"], index["by_related"]
+    for line_no, raw_line in enumerate(text.splitlines(), start=1):
+        line = raw_line.strip()
+        if line.startswith("#"):
+            sections.append(HEADER.match(line).group(1))
+            continue
+        if not CHECKBOX.match(line):
+            continue
+        position = len(raw)
+        lines.append(line_no)
+        raw.append(line)
+        section_of.append(len(sections) - 1)
+        status, priority, related = item_tags(line)
+        by_status.setdefault(status, []).append(position)
+        if priority is not None:
+            by_priority.setdefault(priority, []).append(position)
+        for slug in related:
+            by_related.setdefault(slug, []).append(position)
+    return index
+
+
+def backlog_item(index: dict[str, Any], position: int) -> dict[str, Any]:
+    line = index["raw"][position]
+    status, priority, related = item_tags(line)
+    return {
+        "line": index["lines"][position],
+        "raw": line,
+        "question": " ".join(TAG.sub(" ", line[5:]).split()),
+        "status": status,
+        "priority": priority,
+        "related": related,
+        "section": index["sections"][index["section_of"][position]],
+    }
+
+
+def parse_backlog(text: str) -> list[dict[str, Any]]:
+    index = index_backlog(text)
+    return [backlog_item(index, position) for position in range(len(index["raw"]))]
+
+
+def load_backlog_index(backlog_path: Path, use_cache: bool = True) -> dict[str, Any]:
+    try:
+        stat = backlog_path.stat()
+    except FileNotFoundError:
+        return index_backlog("")
+    key = str(backlog_path)
+    memo = LOADED_INDEXES.get(key)
+    if use_cache and is_fresh(memo, stat.st_size, stat.st_mtime_ns):
+        return memo["index"]
+
+    cache_path = backlog_path.with_name(BACKLOG_INDEX_NAME)
+    cache = load_cached_index(cache_path, BACKLOG_INDEX_VERSION) if use_cache else None
+    if cache is not None and is_fresh(cache, stat.st_size, stat.st_mtime_ns):
+        LOADED_INDEXES[key] = cache
+        return cache["index"]
+
+    content = backlog_path.read_bytes()
+    recorded_ns = time.time_ns()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    if cache is not None and cache.get("digest") == digest:
+        index = cache["index"]
+    else:
+        # Same newline handling as Path.read_text.
+        index = index_backlog(content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"))
+    entry = {
+        "version": BACKLOG_INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "recorded_ns": recorded_ns,
+        "digest": digest,
+        "index": index,
+    }
+    if use_cache:
+        LOADED_INDEXES[key] = entry
+        save_cached_index(cache_path, entry)
+    return index
+
+
+def query_positions(
+    index: dict[str, Any],
+    status: str | None = None,
+    priority: str | None = None,
+    related: str | None = None,
+) -> list[int]:
+    filters = [("by_status", status), ("by_priority", priority.upper() if priority else None), ("by_related", related)]
+    positions: list[int] | None = None
+    for postings, value in filters:
+        if value is None:
+            continue
+        matches = index[postings].get(value, [])
+        if positions is None:
+            positions = matches
+        else:
+            wanted = set(matches)
+            positions = [position for position in positions if position in wanted]
+    if positions is None:
+        return list(range(len(index["raw"])))
+    return positions
+
+
+def query_backlog(index: dict[str, Any], **filters: str | None) -> list[dict[str, Any]]:
+    return [backlog_item(index, position) for position in query_positions(index, **filters)]
+
+
+def high_priority_questions(index: dict[str, Any]) -> list[str]:
+    return [item["question"] for item in query_backlog(index, status="open", priority="HIGH")]
+
+
+def query_repositories(
+    roots: Iterable[Path], use_cache: bool = True, **filters: str | None
+) -> Iterator[tuple[Path, dict[str, Any]]]:
+    for root in roots:
+        index = load_backlog_index(root / BACKLOG_NAME, use_cache)
+        for item in query_backlog(index, **filters):
+            yield root, item
+
+
+def format_item(backlog_label: str, item: dict[str, Any]) -> str:
+    related = f" (related: {', '.join(item['related'])})" if item["related"] else ""
+    section = f" [{item['section']}]" if item["section"] else ""
+    priority = item["priority"] or "-"
+    return f"{backlog_label}:{item['line']}: {item['status']} {priority}{section} {item['question']}{related}"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query backlog_questions.md across one or more /career repositories.")
+    parser.add_argument("--root", action="append", required=True, help="Path to /career (repeat for several)")
+    parser.add_argument("--status", choices=["open", "done"], help="Only items with this checkbox state.")
+    parser.add_argument("--priority", help="Only items tagged with this priority, e.g. HIGH.")
+    parser.add_argument("--related", help="Only items related to this project slug.")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format.")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update {BACKLOG_INDEX_NAME}.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    roots = [Path(root).expanduser().resolve() for root in args.root]
+    for root in roots:
+        if not root.exists():
+            raise SystemExit(f"Missing root path: {root}")
+
+    results = query_repositories(
+        roots, not args.no_cache, status=args.status, priority=args.priority, related=args.related
+    )
+    if args.format == "json":
+        print(json.dumps([{"root": str(root), **item} for root, item in results], indent=2))
+        return
+    labels = {root: str(root / BACKLOG_NAME) for root in roots}
+    count = 0
+    for root, item in results:
+        print(format_item(labels[root], item))
+        count += 1
+    print(f"Backlog items: {count}")
+
+
+if __name__ == "__main__":
+    main()
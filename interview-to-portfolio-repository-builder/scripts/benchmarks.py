@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmarks for the publish scripts, each checked against a reference implementation.
+
+The reference implementations are the straightforward versions the optimized
+code replaced. Every benchmark first verifies that both produce the same result
+on its synthetic input, then times them.
+
+Usage:
+  python3 scripts/benchmarks.py patterns --size-mb 8
+  python3 scripts/benchmarks.py handoff --sizes 1000,10000,100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from build_handoff import collect_project_payloads, order_project_payloads
+from publish_patterns import (
+    BLOCKED_RULES,
+    PRIVATE_LINE_RULES,
+    blocked_tokens,
+    has_private_marker,
+    strip_metadata,
+    strip_metadata_sequential,
+)
+
+BLOCKED_PATTERNS = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern, _ in BLOCKED_RULES]
+PRIVATE_LINE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for _, pattern, _ in PRIVATE_LINE_RULES]
+
+
+def legacy_blocked_tokens(value: str) -> list[str]:
+    return [name for name, pattern in BLOCKED_PATTERNS if pattern.search(value)]
+
+
+def legacy_has_private_marker(value: str) -> bool:
+    return any(pattern.search(value) for pattern in PRIVATE_LINE_PATTERNS)
+
+
+def build_corpus(size_bytes: int, dirty_ratio: float, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    clean = [
+        "Designed and shipped the ingestion pipeline for partner data feeds.",
+        "Reduced p95 latency across the scoring service after a staged rollout.",
+        "Led a team of four engineers through quarterly planning and delivery.",
+        "Built internal tooling for evaluating ranking models offline.",
+    ]
+    dirty = [
+        "NEEDS_CLARIFICATION scope of the migration",
+        "Cut cost 30% (Confidence: HIGH, Evidence: MISSING)",
+        "See /Users/me/notes/launch.md for details",
+        "Evidence: PRIVATE_UNSHARED deck (publication-safe phrasing approved)",
+    ]
+    lines: list[str] = []
+    total = 0
+    while total < size_bytes:
+        line = rng.choice(dirty) if rng.random() < dirty_ratio else rng.choice(clean)
+        lines.append(line)
+        total += len(line) + 1
+    return lines
+
+
+def time_pass(label: str, func: Callable[[str], object], lines: list[str]) -> float:
+    started = time.perf_counter()
+    for line in lines:
+        func(line)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def run_patterns_benchmark(args: argparse.Namespace) -> None:
+    lines = build_corpus(int(args.size_mb * 1024 * 1024), args.dirty_ratio, args.seed)
+    for line in lines:
+        if legacy_blocked_tokens(line) != blocked_tokens(line):
+            raise SystemExit(f"Blocked-token mismatch on: {line}")
+        if legacy_has_private_marker(line) != has_private_marker(line):
+            raise SystemExit(f"Private-marker mismatch on: {line}")
+        if strip_metadata_sequential(line) != strip_metadata(line):
+            raise SystemExit(f"Metadata-strip mismatch on: {line}")
+
+    print(f"Corpus: {len(lines)} lines, {args.size_mb:g} MB, dirty ratio {args.dirty_ratio:g}")
+    for title, legacy, combined in [
+        ("blocked tokens", legacy_blocked_tokens, blocked_tokens),
+        ("private markers", legacy_has_private_marker, has_private_marker),
+        ("metadata strip", strip_metadata_sequential, strip_metadata),
+    ]:
+        print(f"{title}:")
+        legacy_time = time_pass("per-rule loop", legacy, lines)
+        combined_time = time_pass("combined alternation", combined, lines)
+        print(f"  speedup: {legacy_time / combined_time:.2f}x")
+
+
+def legacy_order_project_payloads(payload: list[dict[str, Any]], featured_order: list[str]) -> list[dict[str, Any]]:
+    featured = [item for slug in featured_order for item in payload if item["slug"] == slug]
+    remainder = [item for item in payload if item["slug"] not in featured_order]
+    return featured + remainder
+
+
+def synthetic_payload(count: int) -> tuple[list[dict[str, Any]], list[str]]:
+    payload = [{"slug": f"project-{index:06d}"} for index in range(count)]
+    # Every tenth project is featured, in reverse order, so both orderings do real work.
+    featured_order = [item["slug"] for item in payload[::-10]]
+    return payload, featured_order
+
+
+def write_synthetic_tree(root: Path, count: int) -> None:
+    website = json.dumps({"structured_fields": {"public_summary": "Built a thing.", "highlights": ["Shipped it"]}})
+    for index in range(count):
+        project_dir = root / "projects" / f"project-{index:06d}"
+        project_dir.mkdir(parents=True)
+        (project_dir / "website.json").write_text(website, encoding="utf-8")
+
+
+def run_handoff_benchmark(args: argparse.Namespace) -> None:
+    print(f"{'projects':>9} {'order (ms)':>11} {'legacy order (ms)':>18} {'collect (ms)':>13} {'us/project':>11}")
+    for count in [int(size) for size in args.sizes.split(",")]:
+        payload, featured_order = synthetic_payload(count)
+        started = time.perf_counter()
+        ordered = order_project_payloads(payload, featured_order)
+        order_ms = (time.perf_counter() - started) * 1000
+        legacy = "skipped"
+        if count <= args.legacy_limit:
+            started = time.perf_counter()
+            if legacy_order_project_payloads(payload, featured_order) != ordered:
+                raise SystemExit(f"Ordering mismatch at {count} projects")
+            legacy = f"{(time.perf_counter() - started) * 1000:.1f}"
+        with tempfile.TemporaryDirectory() as scratch:
+            root = Path(scratch)
+            write_synthetic_tree(root, count)
+            started = time.perf_counter()
+            collect_project_payloads(root, featured_order)
+            collect_ms = (time.perf_counter() - started) * 1000
+        print(f"{count:>9} {order_ms:>11.1f} {legacy:>18} {collect_ms:>13.1f} {collect_ms * 1000 / count:>11.1f}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark optimized publish code against reference versions.")
+    benchmarks = parser.add_subparsers(dest="benchmark", required=True)
+
+    patterns = benchmarks.add_parser("patterns", help="Combined publish-safety matcher vs one regex per rule.")
+    patterns.add_argument("--size-mb", type=float, default=8.0, help="Synthetic corpus size in MB")
+    patterns.add_argument("--dirty-ratio", type=float, default=0.05, help="Fraction of lines carrying blocked tokens")
+    patterns.add_argument("--seed", type=int, default=7, help="Random seed for corpus generation")
+    patterns.set_defaults(run=run_patterns_benchmark)
+
+    handoff = benchmarks.add_parser("handoff", help="Slug-indexed project ordering and collection in build_handoff.")
+    handoff.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated project counts to time.")
+    handoff.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=20000,
+        help="Largest size at which the old quadratic ordering is also timed.",
+    )
+    handoff.set_defaults(run=run_handoff_benchmark)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
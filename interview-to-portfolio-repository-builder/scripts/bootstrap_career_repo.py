@@ -6,13 +6,25 @@ and role-targeted resume tailoring.
 Usage examples:
   python3 scripts/bootstrap_career_repo.py --root /career
   python3 scripts/bootstrap_career_repo.py --root /career --project-slug fraud-detection-v2
+  python3 scripts/bootstrap_career_repo.py --manifest cohort.csv --jobs 8
+
+A manifest bootstraps many roots in one process. CSV manifests have a header row
+with `root` and `project_slug` columns (one row per project; leave project_slug
+empty for a bare root). JSON manifests are a list of
+{"root": "...", "project_slugs": ["..."]} objects. Relative roots are resolved
+against the manifest's directory.
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
+
+from profiling import add_profile_arguments, profile_session
 
 
 CAREER_TEMPLATE = {
@@ -159,85 +171,151 @@ evidence:
 """
 
 
-def write_if_missing(path: Path, content: str) -> None:
-    if path.exists():
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+# Rendered once per process; a manifest run reuses them for every root.
+CAREER_JSON = json.dumps(CAREER_TEMPLATE, indent=2) + "\n"
+FACTS_INDEX_JSON = json.dumps(FACTS_INDEX_TEMPLATE, indent=2) + "\n"
+ROOT_TEMPLATES = (
+    ("claims.md", CLAIMS_TEMPLATE),
+    ("backlog_questions.md", BACKLOG_TEMPLATE),
+    ("README.md", README_TEMPLATE),
+)
+
+
+def write_if_missing(path: Path, content: str) -> bool:
+    # Exclusive create checks for and creates the file in one step; the parent is
+    # only created when the first attempt shows it is missing.
+    try:
+        with path.open("x", encoding="utf-8") as handle:
+            handle.write(content)
+    except FileExistsError:
+        return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return write_if_missing(path, content)
+    return True
 
 
-def ensure_career_json(path: Path) -> None:
-    if not path.exists():
-        path.write_text(json.dumps(CAREER_TEMPLATE, indent=2) + "\n", encoding="utf-8")
-        return
+def ensure_json_file(path: Path, template: dict[str, Any], rendered: str) -> str | None:
+    if write_if_missing(path, rendered):
+        return "created"
 
-    raw = path.read_text(encoding="utf-8").strip()
+    try:
+        raw = path.read_text(encoding="utf-8").strip()
+    except UnicodeDecodeError as error:
+        raise ValueError(f"{path.name} is not UTF-8 text ({error.reason} at byte {error.start})") from error
     if not raw:
-        path.write_text(json.dumps(CAREER_TEMPLATE, indent=2) + "\n", encoding="utf-8")
-        return
+        path.write_text(rendered, encoding="utf-8")
+        return "updated"
 
     try:
         existing = json.loads(raw)
     except json.JSONDecodeError:
         backup = path.with_suffix(".json.bak")
         backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
-        path.write_text(json.dumps(CAREER_TEMPLATE, indent=2) + "\n", encoding="utf-8")
-        return
+        path.write_text(rendered, encoding="utf-8")
+        return "updated"
+    if not isinstance(existing, dict):
+        # Valid JSON of another shape is left alone rather than backed up and replaced.
+        raise ValueError(f"{path.name} holds a JSON {type(existing).__name__}, not an object")
 
     changed = False
-    for key, default_value in CAREER_TEMPLATE.items():
+    for key, default_value in template.items():
         if key not in existing:
             existing[key] = default_value
             changed = True
 
     if changed:
         path.write_text(json.dumps(existing, indent=2) + "\n", encoding="utf-8")
+        return "updated"
+    return None
 
 
-def ensure_project(root: Path, slug: str) -> None:
-    project_dir = root / "projects" / slug
-    write_if_missing(
-        project_dir / "project.md",
-        PROJECT_MD_TEMPLATE.format(project_name=slug.replace("-", " ").title()),
-    )
-    write_if_missing(
-        project_dir / "evidence.yml",
-        EVIDENCE_YML_TEMPLATE.format(project_name=slug.replace("-", " ").title()),
-    )
+def ensure_career_json(path: Path) -> str | None:
+    return ensure_json_file(path, CAREER_TEMPLATE, CAREER_JSON)
 
-def ensure_facts_index(path: Path) -> None:
-    if not path.exists():
-        path.write_text(json.dumps(FACTS_INDEX_TEMPLATE, indent=2) + "\n", encoding="utf-8")
-        return
 
-    raw = path.read_text(encoding="utf-8").strip()
-    if not raw:
-        path.write_text(json.dumps(FACTS_INDEX_TEMPLATE, indent=2) + "\n", encoding="utf-8")
-        return
+def ensure_project(root: Path, slug: str) -> list[str]:
+    project_dir = root / "projects" / slug
+    project_dir.mkdir(parents=True, exist_ok=True)
+    project_name = slug.replace("-", " ").title()
+    created = []
+    for name, template in (("project.md", PROJECT_MD_TEMPLATE), ("evidence.yml", EVIDENCE_YML_TEMPLATE)):
+        if write_if_missing(project_dir / name, template.format(project_name=project_name)):
+            created.append(f"projects/{slug}/{name}")
+    return created
 
-    try:
-        existing = json.loads(raw)
-    except json.JSONDecodeError:
-        backup = path.with_suffix(".json.bak")
-        backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
-        path.write_text(json.dumps(FACTS_INDEX_TEMPLATE, indent=2) + "\n", encoding="utf-8")
-        return
 
-    changed = False
-    for key, default_value in FACTS_INDEX_TEMPLATE.items():
-        if key not in existing:
-            existing[key] = default_value
-            changed = True
+def ensure_facts_index(path: Path) -> str | None:
+    return ensure_json_file(path, FACTS_INDEX_TEMPLATE, FACTS_INDEX_JSON)
 
-    if changed:
-        path.write_text(json.dumps(existing, indent=2) + "\n", encoding="utf-8")
+
+def bootstrap_root(root: Path, slugs: list[str]) -> dict[str, Any]:
+    result: dict[str, Any] = {"root": str(root), "created": [], "updated": [], "error": None}
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        for name, ensure in (("career.json", ensure_career_json), ("facts_index.json", ensure_facts_index)):
+            status = ensure(root / name)
+            if status:
+                result[status].append(name)
+        for name, template in ROOT_TEMPLATES:
+            if write_if_missing(root / name, template):
+                result["created"].append(name)
+        for slug in dict.fromkeys(slug.strip() for slug in slugs):
+            if slug:
+                result["created"].extend(ensure_project(root, slug))
+    except (OSError, ValueError) as error:
+        # One unwritable or malformed root must not stop the rest of a manifest run.
+        result["error"] = str(error)
+    return result
+
+
+def load_manifest(path: Path) -> dict[Path, list[str]]:
+    entries: dict[Path, list[str]] = {}
+    try:
+        if path.suffix.lower() == ".csv":
+            with path.open(newline="", encoding="utf-8") as handle:
+                rows = [(row.get("root"), [row.get("project_slug") or ""]) for row in csv.DictReader(handle)]
+        else:
+            rows = [
+                (item.get("root"), item.get("project_slugs") or []) if isinstance(item, dict) else (item, [])
+                for item in json.loads(path.read_text(encoding="utf-8"))
+            ]
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError, AttributeError, TypeError) as error:
+        raise SystemExit(f"Unreadable manifest {path}: {error}")
+
+    for root, slugs in rows:
+        if not isinstance(root, str) or not root.strip():
+            raise SystemExit(f"Manifest {path} has an entry without a root")
+        if not isinstance(slugs, list) or not all(isinstance(slug, str) for slug in slugs):
+            raise SystemExit(f"Manifest {path}: project_slugs for {root} must be a list of strings")
+        resolved = (path.parent / Path(root.strip()).expanduser()).resolve()
+        entries.setdefault(resolved, []).extend(slugs)
+    return entries
+
+
+def bootstrap_roots(entries: dict[Path, list[str]], jobs: int) -> list[dict[str, Any]]:
+    roots = list(entries)
+    if jobs <= 1 or len(roots) <= 1:
+        return [bootstrap_root(root, entries[root]) for root in roots]
+    workers = min(jobs, len(roots))
+    chunksize = max(1, len(roots) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(bootstrap_root, roots, [entries[root] for root in roots], chunksize=chunksize))
+
+
+def format_result(result: dict[str, Any]) -> str:
+    if result["error"]:
+        return f"Failed to bootstrap {result['root']}: {result['error']}"
+    return (
+        f"Career repository ensured at: {result['root']} "
+        f"(created {len(result['created'])}, updated {len(result['updated'])})"
+    )
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Bootstrap or extend a /career repository.")
     parser.add_argument(
         "--root",
-        required=True,
         help="Target career directory path, e.g. /career or ./career",
     )
     parser.add_argument(
@@ -246,26 +324,40 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Optional project slug to precreate under projects/<slug>/",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--manifest",
+        help="JSON or CSV file listing many roots and their project slugs to bootstrap in one process.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for manifest runs (default: 1, bootstraps roots serially).",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    if not args.root and not args.manifest:
+        parser.error("--root or --manifest is required")
+    return args
 
 
 def main() -> None:
     args = parse_args()
-    root = Path(args.root).expanduser().resolve()
-    root.mkdir(parents=True, exist_ok=True)
-
-    ensure_career_json(root / "career.json")
-    ensure_facts_index(root / "facts_index.json")
-    write_if_missing(root / "claims.md", CLAIMS_TEMPLATE)
-    write_if_missing(root / "backlog_questions.md", BACKLOG_TEMPLATE)
-    write_if_missing(root / "README.md", README_TEMPLATE)
-
-    for slug in args.project_slug:
-        if not slug.strip():
-            continue
-        ensure_project(root, slug.strip())
-
-    print(f"Career repository ensured at: {root}")
+    with profile_session("bootstrap_career_repo", args):
+        entries: dict[Path, list[str]] = {}
+        if args.manifest:
+            entries = load_manifest(Path(args.manifest).expanduser().resolve())
+        if args.root:
+            entries.setdefault(Path(args.root).expanduser().resolve(), []).extend(args.project_slug)
+
+        results = bootstrap_roots(entries, args.jobs)
+        for result in results:
+            print(format_result(result))
+        failed = sum(1 for result in results if result["error"])
+        if args.manifest:
+            print(f"Bootstrapped {len(results) - failed} of {len(results)} career repositories.")
+        if failed:
+            raise SystemExit(1)
 
 
 if __name__ == "__main__":
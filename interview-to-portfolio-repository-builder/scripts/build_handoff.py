@@ -3,88 +3,84 @@
 
 Usage:
   python3 scripts/build_handoff.py --root /career
+  python3 scripts/build_handoff.py --root /career --compact
+  python3 scripts/build_handoff.py --root /career --from-exports
+
+With --from-exports, project readiness comes from the records the last export
+stored in public_site/.publish_export_manifest. Each is computed from the
+project's private website.json and reused while that file's size and mtime are
+unchanged; other projects read website.json as usual.
+
+high_priority_backlog lists the open HIGH items of backlog_questions.md as
+plain questions (checkbox, tags and confidence/evidence metadata removed).
+Questions that would fail publish lint are left out and only counted, in
+high_priority_backlog_withheld.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
 
+from backlog_index import high_priority_questions, load_backlog_index
+from evidence_index import evidence_gaps, load_evidence_index
+from profiling import add_profile_arguments, profile_session
+from publish_output import (
+    EXPORT_MANIFEST_NAME,
+    open_atomic,
+    output_lock,
+    recover_output,
+    write_buffered,
+    write_json,
+)
+from publish_patterns import blocked_tokens, strip_metadata
+from repo_records import discover_project_dirs, handoff_entry, handoff_record, load_json, record_entry
 
-def load_json(path: Path, fallback: dict[str, Any] | None = None) -> dict[str, Any]:
-    if not path.exists():
-        return fallback or {}
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return fallback or {}
 
+def public_backlog(questions: list[str]) -> dict[str, Any]:
+    # Questions that still name a placeholder (the bootstrap template's "Add
+    # missing resume fields" item, NEEDS_CLARIFICATION notes) would fail publish
+    # lint, so only their count reaches the handoff.
+    kept = [cleaned for cleaned in map(strip_metadata, questions) if cleaned and not blocked_tokens(cleaned)]
+    return {"high_priority_backlog": kept, "high_priority_backlog_withheld": len(questions) - len(kept)}
 
-def slug_to_title(slug: str) -> str:
-    return " ".join(part.capitalize() for part in slug.split("-"))
 
+def parse_backlog_high_priority(backlog_path: Path) -> dict[str, Any]:
+    return public_backlog(high_priority_questions(load_backlog_index(backlog_path)))
 
-def parse_backlog_high_priority(backlog_path: Path) -> list[str]:
-    if not backlog_path.exists():
-        return []
 
-    items: list[str] = []
-    for raw_line in backlog_path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if line.startswith("- [ ]") and "priority: HIGH" in line.upper():
-            items.append(line)
-    return items
+def project_handoff_entry(project_dir: Path, featured_set: set[str]) -> dict[str, Any]:
+    return handoff_entry(project_dir.name, load_json(project_dir / "website.json", fallback={}), featured_set)
 
 
-def collect_project_payloads(root: Path, featured_order: list[str]) -> list[dict[str, Any]]:
-    projects_dir = root / "projects"
-    if not projects_dir.exists():
-        return []
-
+def order_project_payloads(payload: list[dict[str, Any]], featured_order: list[str]) -> list[dict[str, Any]]:
+    by_slug = {item["slug"]: item for item in payload}
     featured_set = set(featured_order)
-    payload: list[dict[str, Any]] = []
-
-    for project_dir in sorted([path for path in projects_dir.iterdir() if path.is_dir()]):
-        slug = project_dir.name
-        website = load_json(project_dir / "website.json", fallback={})
-        structured = website.get("structured_fields") if isinstance(website.get("structured_fields"), dict) else {}
-        display = website.get("display") if isinstance(website.get("display"), dict) else {}
-
-        title = str(display.get("title") or slug_to_title(slug))
-        summary = str(structured.get("public_summary") or "").strip()
-        highlights = [item for item in structured.get("highlights", []) if isinstance(item, str)]
-        outcomes = [item for item in structured.get("outcomes", []) if isinstance(item, str)]
-        if not highlights:
-            highlights = [item for item in structured.get("what_i_built", []) if isinstance(item, str)]
-        if not outcomes:
-            outcomes = [item for item in structured.get("impact_highlights", []) if isinstance(item, str)]
-
-        has_placeholder = any(
-            marker in (title + " " + summary).upper() for marker in ["NEEDS_CLARIFICATION", "MISSING"]
-        )
-
-        payload.append(
-            {
-                "slug": slug,
-                "title": title,
-                "bucket": "featured" if slug in featured_set else "archive",
-                "timeline_display": str(display.get("timeline_display") or "hide"),
-                "public_summary": summary,
-                "highlights_count": len(highlights),
-                "outcomes_count": len(outcomes),
-                "ready_for_site": bool((summary or highlights or outcomes) and not has_placeholder),
-            }
-        )
-
-    featured = [item for slug in featured_order for item in payload if item["slug"] == slug]
-    remainder = [item for item in payload if item["slug"] not in featured_order]
+    featured = [by_slug[slug] for slug in featured_order if slug in by_slug]
+    remainder = [item for item in payload if item["slug"] not in featured_set]
     return featured + remainder
 
 
-def build_handoff(root: Path) -> dict[str, Any]:
+def collect_project_payloads(
+    root: Path, featured_order: list[str], export_manifest: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    featured_set = set(featured_order)
+    records = export_manifest.get("projects") if isinstance(export_manifest, dict) else None
+    records = records if isinstance(records, dict) else {}
+    payload = []
+    for project_dir in discover_project_dirs(root / "projects"):
+        previous = records.get(project_dir.name)
+        record = previous.get("handoff") if isinstance(previous, dict) else None
+        if record is not None:
+            payload.append(record_entry(handoff_record(project_dir, record), featured_set))
+        else:
+            payload.append(project_handoff_entry(project_dir, featured_set))
+    return order_project_payloads(payload, featured_order)
+
+
+def build_handoff(root: Path, export_manifest: dict[str, Any] | None = None) -> dict[str, Any]:
     career = load_json(root / "career.json", fallback={})
     display_name = str(career.get("name") or "The candidate").strip()
     publication = career.get("publication_preferences") if isinstance(career.get("publication_preferences"), dict) else {}
@@ -93,8 +89,10 @@ def build_handoff(root: Path) -> dict[str, Any]:
     dimensions = career.get("assessment_dimensions") if isinstance(career.get("assessment_dimensions"), list) else []
 
     featured_order = [item for item in career.get("featured_projects", []) if isinstance(item, str)]
-    projects = collect_project_payloads(root, featured_order)
-    high_priority_backlog = parse_backlog_high_priority(root / "backlog_questions.md")
+    projects = collect_project_payloads(root, featured_order, export_manifest)
+    backlog_fields = parse_backlog_high_priority(root / "backlog_questions.md")
+    # Counts and statuses only: evidence links and paths never reach the handoff.
+    evidence = evidence_gaps(load_evidence_index(root, [item["slug"] for item in projects]))
     enable_chatbot = bool(hints.get("enable_chatbot", False))
     enabled_dimensions = [
         str(item.get("id"))
@@ -155,109 +153,145 @@ def build_handoff(root: Path) -> dict[str, Any]:
             "Do not expose local file paths, private evidence links, or confidence/evidence metadata in public copy.",
             "If dates are incomplete, hide them.",
         ],
-        "high_priority_backlog": high_priority_backlog,
+        "evidence_gaps": evidence,
+        **backlog_fields,
     }
 
 
-def render_markdown(payload: dict[str, Any]) -> str:
-    lines: list[str] = []
-    lines.append("# Website Build Handoff")
-    lines.append("")
-    lines.append("## Defaults")
+def iter_markdown_lines(payload: dict[str, Any]) -> Iterator[str]:
+    yield "# Website Build Handoff"
+    yield ""
+    yield "## Defaults"
     defaults = payload.get("defaults", {})
     for key in ["public_voice", "anonymize_clients", "show_evidence_on_site", "show_project_dates"]:
-        lines.append(f"- {key}: `{defaults.get(key)}`")
+        yield f"- {key}: `{defaults.get(key)}`"
 
-    lines.append("")
-    lines.append("## Site Profile")
+    yield ""
+    yield "## Site Profile"
     profile = payload.get("site_profile", {})
     for key in ["tone", "home_style", "archive_strategy", "project_detail_layout", "enable_chatbot", "chat_audience"]:
-        lines.append(f"- {key}: `{profile.get(key)}`")
+        yield f"- {key}: `{profile.get(key)}`"
 
-    lines.append("")
-    lines.append("## Enabled Dimensions")
+    yield ""
+    yield "## Enabled Dimensions"
     dimensions = payload.get("enabled_dimensions", [])
     if dimensions:
         for item in dimensions:
-            lines.append(f"- `{item}`")
+            yield f"- `{item}`"
     else:
-        lines.append("- technical_delivery (default)")
+        yield "- technical_delivery (default)"
 
-    lines.append("")
-    lines.append("## Navigation")
+    yield ""
+    yield "## Navigation"
     for item in payload.get("navigation", []):
-        lines.append(f"- `{item}`")
+        yield f"- `{item}`"
 
-    lines.append("")
-    lines.append("## Featured Project Order")
+    yield ""
+    yield "## Featured Project Order"
     featured = payload.get("featured_project_order", [])
     if featured:
         for slug in featured:
-            lines.append(f"- `{slug}`")
+            yield f"- `{slug}`"
     else:
-        lines.append("- NONE")
+        yield "- NONE"
 
-    lines.append("")
-    lines.append("## Project Readiness")
+    yield ""
+    yield "## Project Readiness"
     for project in payload.get("projects", []):
-        lines.append(
+        yield (
             f"- `{project['slug']}` ({project['bucket']}): "
             f"summary={bool(project['public_summary'])}, "
             f"highlights={project['highlights_count']}, outcomes={project['outcomes_count']}, "
             f"timeline_display={project['timeline_display']}, ready={project['ready_for_site']}"
         )
 
-    lines.append("")
-    lines.append("## Public Safety Rules")
+    yield ""
+    yield "## Public Safety Rules"
     for rule in payload.get("public_safety_rules", []):
-        lines.append(f"- {rule}")
+        yield f"- {rule}"
 
     chat = payload.get("chat_requirements")
-    lines.append("")
-    lines.append("## Chat Requirements")
+    yield ""
+    yield "## Chat Requirements"
     if chat:
-        lines.append(f"- strict_grounding: `{chat.get('strict_grounding')}`")
-        lines.append(f"- fallback_text: `{chat.get('fallback_text')}`")
-        lines.append(f"- open_with_phrase: `{chat.get('open_with_phrase')}`")
+        yield f"- strict_grounding: `{chat.get('strict_grounding')}`"
+        yield f"- fallback_text: `{chat.get('fallback_text')}`"
+        yield f"- open_with_phrase: `{chat.get('open_with_phrase')}`"
     else:
-        lines.append("- chatbot disabled")
+        yield "- chatbot disabled"
+
+    yield ""
+    yield "## Evidence Gaps"
+    gaps = payload.get("evidence_gaps", [])
+    if gaps:
+        for gap in gaps:
+            yield (
+                f"- `{gap['slug']}`: status={gap['status']}, items={gap['items']}, "
+                f"placeholders={gap['placeholders']}, public={gap['public']}"
+            )
+    else:
+        yield "- NONE"
 
-    lines.append("")
-    lines.append("## High Priority Backlog")
+    yield ""
+    yield "## High Priority Backlog"
     backlog = payload.get("high_priority_backlog", [])
-    if backlog:
-        for item in backlog:
-            lines.append(f"- {item}")
-    else:
-        lines.append("- NONE")
+    for item in backlog:
+        yield f"- {item}"
+    withheld = payload.get("high_priority_backlog_withheld", 0)
+    if withheld:
+        yield f"- {withheld} more item(s) withheld from this handoff; see backlog_questions.md"
+    elif not backlog:
+        yield "- NONE"
 
-    return "\n".join(lines) + "\n"
+
+def render_markdown(payload: dict[str, Any]) -> str:
+    return "".join(f"{line}\n" for line in iter_markdown_lines(payload))
+
+
+def write_markdown(handle: TextIO, payload: dict[str, Any]) -> None:
+    write_buffered(handle, (f"{line}\n" for line in iter_markdown_lines(payload)))
+
+
+def write_handoff(out_dir: Path, handoff: dict[str, Any], compact: bool) -> None:
+    # Two files do not justify restaging all of public_site: each is replaced
+    # atomically under the lock exports hold while they swap the tree. Both are
+    # encoded straight into their files, so memory beyond the payload stays flat.
+    with output_lock(out_dir):
+        recover_output(out_dir)
+        with open_atomic(out_dir / "website_handoff.json") as handle:
+            write_json(handle, handoff, compact)
+        with open_atomic(out_dir / "website_handoff.md") as handle:
+            write_markdown(handle, handoff)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate build handoff artifacts from /career.")
     parser.add_argument("--root", required=True, help="Path to /career")
+    parser.add_argument("--compact", action="store_true", help="Write minified website_handoff.json.")
+    parser.add_argument(
+        "--from-exports",
+        action="store_true",
+        help="Reuse project readiness recorded by the last export while website.json is unchanged.",
+    )
+    add_profile_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    root = Path(args.root).expanduser().resolve()
-    if not root.exists():
-        raise SystemExit(f"Missing root path: {root}")
-
-    handoff = build_handoff(root)
-    out_dir = root / "public_site"
-    out_dir.mkdir(parents=True, exist_ok=True)
+    with profile_session("build_handoff", args):
+        root = Path(args.root).expanduser().resolve()
+        if not root.exists():
+            raise SystemExit(f"Missing root path: {root}")
 
-    json_path = out_dir / "website_handoff.json"
-    md_path = out_dir / "website_handoff.md"
+        out_dir = root / "public_site"
+        export_manifest = load_json(out_dir / EXPORT_MANIFEST_NAME) if args.from_exports else None
+        handoff = build_handoff(root, export_manifest=export_manifest)
 
-    json_path.write_text(json.dumps(handoff, indent=2) + "\n", encoding="utf-8")
-    md_path.write_text(render_markdown(handoff), encoding="utf-8")
+        write_handoff(out_dir, handoff, args.compact)
 
-    print(f"Wrote: {json_path}")
-    print(f"Wrote: {md_path}")
+        print(f"Wrote: {out_dir / 'website_handoff.json'}")
+        print(f"Wrote: {out_dir / 'website_handoff.md'}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Parse claims.md into an index keyed by related project, confidence and evidence.
+
+Each "- Claim:" record with its indented Confidence / Evidence / Related lines
+becomes one entry. Postings by related slug, confidence, evidence status
+(missing, url or path) and by related + confidence together make a lookup such
+as "HIGH claims for project X" a single dictionary access.
+
+The index is cached in <root>/.claims_index. When everything before the last
+claim is unchanged (new claims appended, the last claim edited), just the tail
+from the last record onward is parsed again; any other edit rebuilds the index.
+
+Usage:
+  python3 scripts/claims_index.py --root /career --related fraud-detection-v2 --confidence HIGH
+  python3 scripts/claims_index.py --root /career --related general --confidence HIGH --confidence MEDIUM
+  python3 scripts/claims_index.py --root /career --evidence missing --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from index_cache import is_fresh, load_cached_index, save_cached_index
+from publish_patterns import MISSING_EVIDENCE
+
+CLAIMS_NAME = "claims.md"
+CLAIMS_INDEX_NAME = ".claims_index"
+CLAIMS_INDEX_VERSION = 2
+CLAIM_START = re.compile(r"-\s+claim:\s*(.*)", re.IGNORECASE)
+CLAIM_FIELD = re.compile(r"(confidence|evidence|related):\s*(.*)", re.IGNORECASE)
+CONFIDENCE_ALIASES = {"MED": "MEDIUM"}
+EVIDENCE_STATUSES = ("missing", "url", "path")
+COLUMNS = ("lines", "claims", "confidence", "evidence", "evidence_status", "related")
+POSTINGS = ("by_related", "by_confidence", "by_evidence", "by_related_confidence")
+
+# Indexes already loaded by this process, keyed by claims.md path.
+LOADED_INDEXES: dict[str, dict[str, Any]] = {}
+
+
+def empty_index() -> dict[str, Any]:
+    index: dict[str, Any] = {name: [] for name in COLUMNS}
+    index.update({name: {} for name in POSTINGS})
+    # Where the last record starts; an append-only change is re-parsed from here.
+    index["tail_offset"] = 0
+    index["tail_line"] = 1
+    return index
+
+
+def normalize_confidence(value: str) -> str:
+    value = value.strip().upper()
+    return CONFIDENCE_ALIASES.get(value, value)
+
+
+def evidence_status(value: str) -> str:
+    if value.strip().upper() in MISSING_EVIDENCE:
+        return "missing"
+    if value.strip().lower().startswith(("http://", "https://")):
+        return "url"
+    return "path"
+
+
+def record_keys(index: dict[str, Any], position: int) -> list[tuple[str, str]]:
+    confidence = index["confidence"][position]
+    keys = [("by_evidence", index["evidence_status"][position])]
+    if confidence:
+        keys.append(("by_confidence", confidence))
+    for related in index["related"][position]:
+        keys.append(("by_related", related))
+        if confidence:
+            keys.append(("by_related_confidence", f"{related}|{confidence}"))
+    return keys
+
+
+def add_record(index: dict[str, Any], record: dict[str, Any]) -> None:
+    position = len(index["claims"])
+    record["evidence_status"] = evidence_status(record["evidence"])
+    for name in COLUMNS:
+        index[name].append(record[name])
+    for postings, key in record_keys(index, position):
+        index[postings].setdefault(key, []).append(position)
+
+
+def drop_last_record(index: dict[str, Any]) -> None:
+    # The last record always holds the highest position, so it is the final
+    # entry of every postings list it appears in.
+    position = len(index["claims"]) - 1
+    for postings, key in record_keys(index, position):
+        entries = index[postings][key]
+        entries.pop()
+        if not entries:
+            del index[postings][key]
+    for name in COLUMNS:
+        index[name].pop()
+
+
+def parse_claims(content: bytes, index: dict[str, Any], offset: int = 0, line_no: int = 1) -> dict[str, Any]:
+    record: dict[str, Any] | None = None
+    for raw_line in content[offset:].splitlines(keepends=True):
+        line = raw_line.decode("utf-8", "replace").strip()
+        start = CLAIM_START.match(line)
+        if start:
+            if record is not None:
+                add_record(index, record)
+            index["tail_offset"], index["tail_line"] = offset, line_no
+            claim = start.group(1).strip()
+            if len(claim) >= 2 and claim[0] == claim[-1] == '"':
+                claim = claim[1:-1]
+            record = {"lines": line_no, "claims": claim, "confidence": "", "evidence": "", "related": []}
+        elif record is not None and line:
+            field = CLAIM_FIELD.match(line) if raw_line[:1] in (b" ", b"\t") else None
+            if field is None:
+                # An unindented line that is not a field (a heading, prose) ends the record.
+                add_record(index, record)
+                record = None
+            elif field.group(1).lower() == "confidence":
+                record["confidence"] = normalize_confidence(field.group(2))
+            elif field.group(1).lower() == "evidence":
+                record["evidence"] = field.group(2).strip()
+            else:
+                related = [slug.strip() for slug in field.group(2).split(",") if slug.strip()]
+                record["related"] = list(dict.fromkeys(record["related"] + related))
+        offset += len(raw_line)
+        line_no += 1
+    if record is not None:
+        add_record(index, record)
+    return index
+
+
+def prefix_digest(content: bytes, length: int) -> str:
+    return hashlib.blake2b(memoryview(content)[:length], digest_size=16).hexdigest()
+
+
+def starts_record(content: bytes, offset: int) -> bool:
+    lines = content[offset:].splitlines()
+    return bool(lines) and CLAIM_START.match(lines[0].decode("utf-8", "replace").strip()) is not None
+
+
+def update_index(content: bytes, cache: dict[str, Any] | None) -> dict[str, Any]:
+    index = cache["index"] if cache is not None else None
+    if (
+        index is not None
+        and index["claims"]
+        and prefix_digest(content, index["tail_offset"]) == cache.get("prefix_digest")
+        and starts_record(content, index["tail_offset"])
+    ):
+        # Everything before the last record is unchanged and a claim still starts
+        # where it did, so the records before it end exactly as before: re-parse
+        # only from there. Otherwise (the last record was deleted, the file was cut
+        # back to the prefix) tail_offset would no longer mark the last record.
+        drop_last_record(index)
+        return parse_claims(content, index, index["tail_offset"], index["tail_line"])
+    return parse_claims(content, empty_index())
+
+
+def load_claims_index(claims_path: Path, use_cache: bool = True) -> dict[str, Any]:
+    try:
+        stat = claims_path.stat()
+    except FileNotFoundError:
+        return empty_index()
+    key = str(claims_path)
+    memo = LOADED_INDEXES.get(key)
+    if use_cache and is_fresh(memo, stat.st_size, stat.st_mtime_ns):
+        return memo["index"]
+
+    cache_path = claims_path.with_name(CLAIMS_INDEX_NAME)
+    # Always a fresh copy from disk: an incremental update edits the index in place.
+    cache = load_cached_index(cache_path, CLAIMS_INDEX_VERSION) if use_cache else None
+    if cache is not None and is_fresh(cache, stat.st_size, stat.st_mtime_ns):
+        LOADED_INDEXES[key] = cache
+        return cache["index"]
+
+    content = claims_path.read_bytes()
+    recorded_ns = time.time_ns()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    index = cache["index"] if cache is not None and cache.get("digest") == digest else update_index(content, cache)
+    entry = {
+        "version": CLAIMS_INDEX_VERSION,
+        "size": len(content),
+        "mtime_ns": stat.st_mtime_ns,
+        "recorded_ns": recorded_ns,
+        "digest": digest,
+        "prefix_digest": prefix_digest(content, index["tail_offset"]),
+        "index": index,
+    }
+    if use_cache:
+        LOADED_INDEXES[key] = entry
+        save_cached_index(cache_path, entry)
+    return index
+
+
+def query_positions(
+    index: dict[str, Any],
+    related: str | None = None,
+    confidences: Iterable[str] | None = None,
+    evidence: str | None = None,
+) -> list[int]:
+    levels = list(dict.fromkeys(normalize_confidence(level) for level in confidences or []))
+    if related is not None and levels:
+        lists = [index["by_related_confidence"].get(f"{related}|{level}", []) for level in levels]
+    elif related is not None:
+        lists = [index["by_related"].get(related, [])]
+    elif levels:
+        lists = [index["by_confidence"].get(level, []) for level in levels]
+    elif evidence is not None:
+        return list(index["by_evidence"].get(evidence, []))
+    else:
+        lists = [range(len(index["claims"]))]
+    positions = lists[0] if len(lists) == 1 else list(heapq.merge(*lists))
+    if evidence is not None:
+        # A per-position column, so the filter costs one lookup per candidate.
+        statuses = index["evidence_status"]
+        positions = [position for position in positions if statuses[position] == evidence]
+    return list(positions)
+
+
+def claim_record(index: dict[str, Any], position: int) -> dict[str, Any]:
+    return {
+        "line": index["lines"][position],
+        "claim": index["claims"][position],
+        "confidence": index["confidence"][position],
+        "evidence": index["evidence"][position],
+        "evidence_status": index["evidence_status"][position],
+        "related": index["related"][position],
+    }
+
+
+def query_claims(index: dict[str, Any], **filters: Any) -> list[dict[str, Any]]:
+    return [claim_record(index, position) for position in query_positions(index, **filters)]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Query claims.md by related project, confidence and evidence.")
+    parser.add_argument("--root", required=True, help="Path to /career")
+    parser.add_argument("--related", help="Only claims related to this project slug (or 'general').")
+    parser.add_argument(
+        "--confidence",
+        action="append",
+        default=[],
+        help="Only claims with this confidence (repeat to allow several, e.g. HIGH and MEDIUM).",
+    )
+    parser.add_argument("--evidence", choices=EVIDENCE_STATUSES, help="Only claims with this evidence status.")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format.")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update {CLAIMS_INDEX_NAME}.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    root = Path(args.root).expanduser().resolve()
+    if not root.exists():
+        raise SystemExit(f"Missing root path: {root}")
+
+    index = load_claims_index(root / CLAIMS_NAME, not args.no_cache)
+    claims = query_claims(index, related=args.related, confidences=args.confidence, evidence=args.evidence)
+    if args.format == "json":
+        print(json.dumps(claims, indent=2))
+        return
+    label = str(root / CLAIMS_NAME)
+    for claim in claims:
+        related = ", ".join(claim["related"]) or "-"
+        confidence = claim["confidence"] or "-"
+        evidence = claim["evidence_status"]
+        print(f"{label}:{claim['line']}: {confidence} [{related}] {claim['claim']} (evidence: {evidence})")
+    print(f"Claims: {len(claims)}")
+
+
+if __name__ == "__main__":
+    main()
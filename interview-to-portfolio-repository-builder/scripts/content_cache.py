@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Content-addressed on-disk cache for derived data such as parsed project.md files.
+
+Entries are keyed by a hash of the input bytes, not by path, so the same content
+parsed in another project or another tenant's /career is a hit too. Each kind of
+entry lives in its own namespace directory named after its version and the
+marshal format version; bumping either simply stops old entries from matching,
+and prune_cache removes them. Values are stored with marshal (plain dicts,
+lists and strings only), which loads several times faster than JSON.
+
+The cache lives in $CAREER_REPO_CACHE_DIR, else $XDG_CACHE_HOME/career-repo-builder,
+else ~/.cache/career-repo-builder. Setting CAREER_REPO_CACHE_DIR to an empty
+string disables it. Its size is bounded by evicting the least recently used
+entries (hits refresh an entry's mtime).
+
+Usage:
+  python3 scripts/content_cache.py --stats
+  python3 scripts/content_cache.py --prune --max-mb 64
+  python3 scripts/content_cache.py --clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import marshal
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE_DIR_ENV = "CAREER_REPO_CACHE_DIR"
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def default_cache_dir() -> Path | None:
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured is not None:
+        return Path(configured).expanduser() if configured else None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "career-repo-builder"
+
+
+# Resolved once per process; worker processes resolve it the same way.
+CACHE_DIR = default_cache_dir()
+
+
+def namespace_dir(cache_dir: Path, namespace: str, version: str) -> Path:
+    return cache_dir / f"{namespace}-v{version}-m{marshal.version}"
+
+
+def cached_value(
+    namespace: str,
+    version: str,
+    content: bytes,
+    build: Callable[[], Any],
+    stats: dict[str, int] | None = None,
+    cache_dir: Path | None = CACHE_DIR,
+) -> Any:
+    if cache_dir is None:
+        if stats is not None:
+            stats["misses"] += 1
+        return build()
+    digest = hashlib.blake2b(content, digest_size=20).hexdigest()
+    path = namespace_dir(cache_dir, namespace, version) / digest[:2] / digest
+    try:
+        value = marshal.loads(path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError):
+        # Unreadable or truncated entry: rebuilt and overwritten below.
+        pass
+    else:
+        if stats is not None:
+            stats["hits"] += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    value = build()
+    if stats is not None:
+        stats["misses"] += 1
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A per-process scratch name: workers may store the same content at once.
+        scratch = path.with_name(f".{digest}.{os.getpid()}.tmp")
+        scratch.write_bytes(marshal.dumps(value))
+        os.replace(scratch, path)
+    except (OSError, ValueError):
+        # Read-only cache directory or a value marshal cannot store: just uncached.
+        pass
+    return value
+
+
+def cache_entries(cache_dir: Path) -> list[tuple[float, int, Path]]:
+    # Only namespace directories (see namespace_dir): the cache directory itself
+    # may be shared with unrelated files.
+    entries = []
+    for path in cache_dir.glob("*-v*-m*/*/*"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def prune_cache(
+    cache_dir: Path | None = CACHE_DIR,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    current: dict[str, str] | None = None,
+) -> int:
+    # current maps namespace -> version; other versions of those namespaces are
+    # dropped outright. Then the oldest entries go until the cache fits max_bytes.
+    if cache_dir is None or not cache_dir.exists():
+        return 0
+    removed = 0
+    for namespace, version in (current or {}).items():
+        keep = namespace_dir(cache_dir, namespace, version).name
+        for stale in cache_dir.glob(f"{namespace}-v*-m*"):
+            if stale.name != keep and stale.is_dir():
+                removed += sum(1 for _ in stale.glob("*/*"))
+                shutil.rmtree(stale, ignore_errors=True)
+    entries = cache_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Not removable here (permissions, a directory): keep evicting others.
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect, prune or clear the shared content cache.")
+    parser.add_argument("--cache-dir", help=f"Cache directory (default: {CACHE_DIR}).")
+    parser.add_argument("--stats", action="store_true", help="Print entry count and size per namespace.")
+    parser.add_argument("--prune", action="store_true", help="Evict least recently used entries down to --max-mb.")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / (1 << 20), help="Size bound for --prune.")
+    parser.add_argument("--clear", action="store_true", help="Delete every cache entry.")
+    args = parser.parse_args()
+    if not (args.stats or args.prune or args.clear):
+        parser.error("one of --stats, --prune or --clear is required")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else CACHE_DIR
+    if cache_dir is None:
+        raise SystemExit(f"Content cache is disabled ({CACHE_DIR_ENV} is empty).")
+    if args.clear:
+        # Only namespace directories: the cache directory itself may be shared.
+        for namespace in cache_dir.glob("*-v*-m*") if cache_dir.exists() else []:
+            shutil.rmtree(namespace, ignore_errors=True)
+        print(f"Cleared: {cache_dir}")
+        return
+    if args.prune:
+        removed = prune_cache(cache_dir, int(args.max_mb * (1 << 20)))
+        print(f"Evicted {removed} entries from {cache_dir}")
+    if args.stats:
+        namespaces: dict[str, list[int]] = {}
+        for _, size, path in cache_entries(cache_dir) if cache_dir.exists() else []:
+            counts = namespaces.setdefault(path.parent.parent.name, [0, 0])
+            counts[0] += 1
+            counts[1] += size
+        for name, (count, size) in sorted(namespaces.items()):
+            print(f"{name}: {count} entries, {size / 1024:.1f} KiB")
+        print(f"Cache directory: {cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
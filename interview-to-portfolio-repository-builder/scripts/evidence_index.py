@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Aggregate every projects/<slug>/evidence.yml into a cached evidence index.
+
+evidence.yml is read line by line with a small parser for the YAML subset the
+bootstrap template uses: top-level "key: value" scalars and a top-level key
+holding a block sequence of flat mappings ("- type: repo" plus indented
+"key: value" lines). Scalars may be plain, single- or double-quoted; comments,
+blank lines and anything outside the subset are ignored.
+
+Each project is summarized as evidence counts by type and visibility, how many
+entries are still placeholders (url_or_path MISSING), and a status: absent (no
+evidence.yml), placeholder (no usable entry), partial or complete. These names
+avoid the MISSING marker so the summary passes publish lint in the handoff.
+
+Summaries are cached per file in <root>/.evidence_index against size, mtime and
+content hash, so only changed evidence.yml files are parsed again.
+
+Usage:
+  python3 scripts/evidence_index.py --root /career
+  python3 scripts/evidence_index.py --root /tenants/a --root /tenants/b --status placeholder --status absent
+  python3 scripts/evidence_index.py --root /career --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
+
+from index_cache import is_fresh, load_cached_index, save_cached_index
+from publish_patterns import MISSING_EVIDENCE
+
+EVIDENCE_NAME = "evidence.yml"
+EVIDENCE_INDEX_NAME = ".evidence_index"
+EVIDENCE_INDEX_VERSION = 1
+DIGEST_CHUNK_BYTES = 1 << 16
+EVIDENCE_STATUSES = ("absent", "placeholder", "partial", "complete")
+YAML_KEY = re.compile(r"([^\s#:'\"][^:#]*?)\s*:(?:\s+(.*))?$")
+DOUBLE_QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"')
+SINGLE_QUOTED = re.compile(r"'((?:[^']|'')*)'")
+PLAIN_COMMENT = re.compile(r"\s+#.*$")
+
+# Evidence caches already loaded by this process, keyed by root.
+LOADED_INDEXES: dict[str, dict[str, Any]] = {}
+
+
+def parse_scalar(text: str) -> Any:
+    text = text.strip()
+    if text.startswith('"'):
+        quoted = DOUBLE_QUOTED.match(text)
+        if quoted:
+            try:
+                return json.loads(f'"{quoted.group(1)}"')
+            except json.JSONDecodeError:
+                return quoted.group(1)
+    if text.startswith("'"):
+        quoted = SINGLE_QUOTED.match(text)
+        if quoted:
+            return quoted.group(1).replace("''", "'")
+    text = PLAIN_COMMENT.sub("", text)
+    if text == "[]":
+        return []
+    if text == "{}":
+        return {}
+    return None if text in ("", "~", "null") else text
+
+
+def parse_evidence_yml(lines: Iterable[str]) -> dict[str, Any]:
+    document: dict[str, Any] = {}
+    block_key: str | None = None
+    item: dict[str, Any] | None = None
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or stripped == "---":
+            continue
+        is_entry = stripped == "-" or stripped.startswith("- ")
+        # A sequence may sit at the same indent as its key ("evidence:" then "- type: repo").
+        if not line[0].isspace() and not (is_entry and block_key is not None):
+            field = YAML_KEY.match(stripped)
+            item = None
+            block_key = None
+            if field is None:
+                continue
+            if field.group(2) is None or not field.group(2).strip():
+                # Its indented block decides whether this is a sequence or a mapping.
+                document[field.group(1)] = None
+                block_key = field.group(1)
+            else:
+                document[field.group(1)] = parse_scalar(field.group(2))
+            continue
+        if block_key is None:
+            continue
+        block = document[block_key]
+        if is_entry:
+            if not isinstance(block, list):
+                block = document[block_key] = []
+            body = stripped[1:].strip()
+            field = YAML_KEY.match(body) if body else None
+            if field is not None:
+                item = {field.group(1): parse_scalar(field.group(2) or "")}
+                block.append(item)
+            elif body:
+                item = None
+                block.append(parse_scalar(body))
+            else:
+                item = {}
+                block.append(item)
+            continue
+        field = YAML_KEY.match(stripped)
+        if field is None:
+            continue
+        if item is not None:
+            item[field.group(1)] = parse_scalar(field.group(2) or "")
+        elif block is None or isinstance(block, dict):
+            if block is None:
+                block = document[block_key] = {}
+            block[field.group(1)] = parse_scalar(field.group(2) or "")
+    return document
+
+
+def is_placeholder_item(item: dict[str, Any]) -> bool:
+    return str(item.get("url_or_path") or "").strip().upper() in MISSING_EVIDENCE
+
+
+def absent_summary() -> dict[str, Any]:
+    return {"status": "absent", "items": 0, "placeholders": 0, "public": 0, "types": {}, "visibility": {}}
+
+
+def summarize_evidence(document: dict[str, Any]) -> dict[str, Any]:
+    entries = document.get("evidence") if isinstance(document.get("evidence"), list) else []
+    items = [item for item in entries if isinstance(item, dict)]
+    types = Counter(str(item.get("type") or "other").strip().lower() for item in items)
+    visibility = Counter(str(item.get("visibility") or "local").strip().lower() for item in items)
+    placeholders = sum(1 for item in items if is_placeholder_item(item))
+    public = sum(
+        1
+        for item in items
+        if str(item.get("visibility") or "").strip().lower() == "public" and not is_placeholder_item(item)
+    )
+    if placeholders == len(items):
+        status = "placeholder"
+    else:
+        status = "partial" if placeholders else "complete"
+    return {
+        "status": status,
+        "items": len(items),
+        "placeholders": placeholders,
+        "public": public,
+        "types": dict(sorted(types.items())),
+        "visibility": dict(sorted(visibility.items())),
+    }
+
+
+def stream_digest(handle: BinaryIO) -> tuple[str, int]:
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    for chunk in iter(lambda: handle.read(DIGEST_CHUNK_BYTES), b""):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def load_evidence_index(root: Path, slugs: Iterable[str], use_cache: bool = True) -> dict[str, dict[str, Any]]:
+    # slugs is the full project list: cache entries for any other slug are dropped.
+    key = str(root)
+    cache_path = root / EVIDENCE_INDEX_NAME
+    cache = None
+    if use_cache:
+        cache = LOADED_INDEXES.get(key) or load_cached_index(cache_path, EVIDENCE_INDEX_VERSION, "projects")
+    entries = cache["projects"] if cache is not None else {}
+    kept: dict[str, dict[str, Any]] = {}
+    summaries: dict[str, dict[str, Any]] = {}
+    changed = False
+    for slug in slugs:
+        path = root / "projects" / slug / EVIDENCE_NAME
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            summaries[slug] = absent_summary()
+            continue
+        entry = entries.get(slug)
+        if not is_fresh(entry, stat.st_size, stat.st_mtime_ns):
+            with path.open("rb") as handle:
+                recorded_ns = time.time_ns()
+                digest, size = stream_digest(handle)
+                if isinstance(entry, dict) and entry.get("digest") == digest and isinstance(entry.get("summary"), dict):
+                    summary = entry["summary"]
+                else:
+                    # Parsed from the same handle, line by line, so the summary
+                    # always matches the bytes behind the digest.
+                    handle.seek(0)
+                    lines = io.TextIOWrapper(handle, encoding="utf-8", errors="replace")
+                    summary = summarize_evidence(parse_evidence_yml(lines))
+            entry = {
+                "size": size,
+                "mtime_ns": stat.st_mtime_ns,
+                "recorded_ns": recorded_ns,
+                "digest": digest,
+                "summary": summary,
+            }
+            changed = True
+        kept[slug] = entry
+        summaries[slug] = entry["summary"]
+    if use_cache:
+        changed = changed or kept.keys() != entries.keys()
+        LOADED_INDEXES[key] = {"version": EVIDENCE_INDEX_VERSION, "projects": kept}
+        if changed:
+            save_cached_index(cache_path, LOADED_INDEXES[key])
+    return summaries
+
+
+def evidence_gaps(summaries: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "slug": slug,
+            "status": summary["status"],
+            "items": summary["items"],
+            "placeholders": summary["placeholders"],
+            "public": summary["public"],
+        }
+        for slug, summary in sorted(summaries.items())
+        if summary["status"] != "complete"
+    ]
+
+
+def format_gap_counts(summaries: dict[str, dict[str, Any]]) -> str:
+    statuses = Counter(summary["status"] for summary in summaries.values())
+    return (
+        f"Evidence: {len(summaries)} projects, {statuses['complete']} complete, {statuses['partial']} partial, "
+        f"{statuses['placeholder']} placeholder only, {statuses['absent']} without {EVIDENCE_NAME}"
+    )
+
+
+def project_slugs(root: Path) -> list[str]:
+    projects_dir = root / "projects"
+    if not projects_dir.exists():
+        return []
+    return sorted(path.name for path in projects_dir.iterdir() if path.is_dir())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report evidence coverage across one or more /career repositories.")
+    parser.add_argument("--root", action="append", required=True, help="Path to /career (repeat for several)")
+    parser.add_argument(
+        "--status",
+        action="append",
+        choices=EVIDENCE_STATUSES,
+        default=[],
+        help="Only projects with this evidence status (repeat to allow several).",
+    )
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format.")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update {EVIDENCE_INDEX_NAME}.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    roots = [Path(root).expanduser().resolve() for root in args.root]
+    for root in roots:
+        if not root.exists():
+            raise SystemExit(f"Missing root path: {root}")
+
+    report = []
+    for root in roots:
+        summaries = load_evidence_index(root, project_slugs(root), not args.no_cache)
+        for slug, summary in summaries.items():
+            if not args.status or summary["status"] in args.status:
+                report.append({"root": str(root), "slug": slug, **summary})
+        if args.format == "text":
+            print(f"{root}: {format_gap_counts(summaries)}")
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+        return
+    for entry in report:
+        types = ", ".join(f"{name}={count}" for name, count in entry["types"].items()) or "-"
+        visibility = ", ".join(f"{name}={count}" for name, count in entry["visibility"].items()) or "-"
+        print(
+            f"{entry['root']}/projects/{entry['slug']}/{EVIDENCE_NAME}: {entry['status']} "
+            f"items={entry['items']} placeholders={entry['placeholders']} types[{types}] visibility[{visibility}]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""BM25 retrieval over facts_index.json for grounded chat answers.
+
+Facts and project cards are tokenized into postings of term frequencies, with
+idf per term and a length norm per document precomputed, so a query only visits
+the postings of its own terms. The index is cached in <root>/.facts_search_index
+and rebuilt only when the content of facts_index.json changes.
+
+Only grounded content is indexed: facts marked public_safe: false and any text
+still carrying a blocked marker (NEEDS_CLARIFICATION, MISSING, ...) are skipped.
+
+Usage:
+  python3 scripts/facts_search.py --root /career --query "kubernetes migration impact"
+  python3 scripts/facts_search.py --root /career --query "leadership" --top-k 3 --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterator
+
+from index_cache import is_fresh, load_cached_index, save_cached_index
+from publish_patterns import blocked_tokens
+
+FACTS_NAME = "facts_index.json"
+SEARCH_INDEX_NAME = ".facts_search_index"
+SEARCH_INDEX_VERSION = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+TOKEN = re.compile(r"\w+")
+CARD_FIELDS = ("highlights", "outcomes", "stack")
+
+# Indexes already loaded by this process, keyed by facts_index.json path.
+LOADED_INDEXES: dict[str, dict[str, Any]] = {}
+
+
+def tokenize(text: str) -> list[str]:
+    # casefold rather than lower so that, e.g., "Straße" and "STRASSE" share a term.
+    return TOKEN.findall(text.casefold())
+
+
+def grounded(values: Any) -> list[str]:
+    if not isinstance(values, list):
+        return []
+    return [value.strip() for value in values if isinstance(value, str) and value.strip() and not blocked_tokens(value)]
+
+
+def fact_documents(facts_index: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    # Pairs of (text to index, document returned by search).
+    documents: list[tuple[str, dict[str, Any]]] = []
+    facts = facts_index.get("facts") if isinstance(facts_index.get("facts"), list) else []
+    for position, fact in enumerate(facts):
+        if not isinstance(fact, dict) or fact.get("public_safe") is False:
+            continue
+        statement = str(fact.get("statement") or "").strip()
+        if not statement or blocked_tokens(statement):
+            continue
+        subject = str(fact.get("subject") or "")
+        document = {
+            "id": str(fact.get("id") or f"fact-{position + 1:03d}"),
+            "kind": "fact",
+            "text": statement,
+            "subject": subject,
+            "type": str(fact.get("type") or ""),
+            "confidence": str(fact.get("confidence") or ""),
+        }
+        documents.append((" ".join([statement, subject, *grounded(fact.get("tags"))]), document))
+    cards = facts_index.get("project_cards") if isinstance(facts_index.get("project_cards"), list) else []
+    for card in cards:
+        if not isinstance(card, dict) or not str(card.get("slug") or "").strip():
+            continue
+        slug = str(card["slug"]).strip()
+        fields = {field: grounded(card.get(field)) for field in CARD_FIELDS}
+        text = "; ".join(fields["highlights"] + fields["outcomes"])
+        if not text:
+            continue
+        document = {"id": f"card:{slug}", "kind": "project_card", "text": text, "subject": slug, "type": "project"}
+        documents.append((" ".join([text, slug.replace("-", " "), *fields["stack"]]), {**document, "confidence": ""}))
+    return documents
+
+
+def pairs(entries: list[int]) -> Iterator[tuple[int, int]]:
+    values = iter(entries)
+    return zip(values, values)
+
+
+def build_search_index(documents: list[tuple[str, dict[str, Any]]]) -> dict[str, Any]:
+    # Postings store raw term frequencies; corpus statistics (idf per term, length
+    # norm per document) are precomputed beside them and combined at query time.
+    # Each postings list is flat, [position, tf, position, tf, ...]: it decodes
+    # about twice as fast as a list of pairs when the cache is loaded.
+    docs: list[dict[str, Any]] = []
+    postings: dict[str, list[int]] = {}
+    for position, (terms_text, document) in enumerate(documents):
+        tf = Counter(tokenize(terms_text))
+        for term, count in tf.items():
+            postings.setdefault(term, []).extend((position, count))
+        docs.append({**document, "length": sum(tf.values())})
+
+    count = len(docs)
+    average_length = sum(doc["length"] for doc in docs) / count if count else 0.0
+    idf = {
+        term: math.log(1 + (count - len(entries) / 2 + 0.5) / (len(entries) / 2 + 0.5))
+        for term, entries in postings.items()
+    }
+    # Documents with no terms at all leave average_length at 0; their norm is unused.
+    norms = [BM25_K1 * (1 - BM25_B + BM25_B * doc["length"] / (average_length or 1)) for doc in docs]
+    return {
+        "k1": BM25_K1,
+        "b": BM25_B,
+        "average_length": average_length,
+        "docs": docs,
+        "norms": norms,
+        "idf": idf,
+        "postings": postings,
+    }
+
+
+def load_search_index(facts_path: Path, use_cache: bool = True) -> dict[str, Any]:
+    try:
+        stat = facts_path.stat()
+    except FileNotFoundError:
+        return build_search_index([])
+    key = str(facts_path)
+    memo = LOADED_INDEXES.get(key)
+    if use_cache and is_fresh(memo, stat.st_size, stat.st_mtime_ns):
+        return memo["index"]
+
+    cache_path = facts_path.with_name(SEARCH_INDEX_NAME)
+    cache = load_cached_index(cache_path, SEARCH_INDEX_VERSION) if use_cache else None
+    if cache is not None and is_fresh(cache, stat.st_size, stat.st_mtime_ns):
+        LOADED_INDEXES[key] = cache
+        return cache["index"]
+
+    content = facts_path.read_bytes()
+    recorded_ns = time.time_ns()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    if cache is not None and cache.get("digest") == digest:
+        index = cache["index"]
+    else:
+        try:
+            facts_index = json.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            facts_index = {}
+        index = build_search_index(fact_documents(facts_index if isinstance(facts_index, dict) else {}))
+    entry = {
+        "version": SEARCH_INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "recorded_ns": recorded_ns,
+        "digest": digest,
+        "index": index,
+    }
+    if use_cache:
+        LOADED_INDEXES[key] = entry
+        save_cached_index(cache_path, entry)
+    return index
+
+
+def search(index: dict[str, Any], query: str, top_k: int = 5, kind: str | None = None) -> list[dict[str, Any]]:
+    postings, idf, norms, docs = index["postings"], index["idf"], index["norms"], index["docs"]
+    boost = index["k1"] + 1
+    scores: dict[int, float] = {}
+    for term in set(tokenize(query)):
+        weight = idf.get(term, 0.0) * boost
+        for position, tf in pairs(postings.get(term, [])):
+            scores[position] = scores.get(position, 0.0) + weight * tf / (tf + norms[position])
+    if kind is not None:
+        scores = {position: score for position, score in scores.items() if docs[position]["kind"] == kind}
+    best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+    return [
+        {
+            "id": docs[position]["id"],
+            "kind": docs[position]["kind"],
+            "score": round(score, 4),
+            "text": docs[position]["text"],
+            "subject": docs[position]["subject"],
+            "type": docs[position]["type"],
+            "confidence": docs[position]["confidence"],
+        }
+        for position, score in best
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Retrieve grounded facts from facts_index.json with BM25.")
+    parser.add_argument("--root", required=True, help="Path to /career")
+    parser.add_argument("--query", required=True, help="Question or keywords to retrieve facts for.")
+    parser.add_argument("--top-k", type=int, default=5, help="Number of results to return (default: 5).")
+    parser.add_argument("--kind", choices=["fact", "project_card"], help="Only return facts or only project cards.")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format.")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update {SEARCH_INDEX_NAME}.")
+    args = parser.parse_args()
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    root = Path(args.root).expanduser().resolve()
+    if not root.exists():
+        raise SystemExit(f"Missing root path: {root}")
+
+    index = load_search_index(root / FACTS_NAME, not args.no_cache)
+    results = search(index, args.query, args.top_k, args.kind)
+    if args.format == "json":
+        print(json.dumps({"query": args.query, "results": results}, indent=2))
+        return
+    if not results:
+        print("No grounded facts matched.")
+    for result in results:
+        print(f"{result['score']:>8.3f}  {result['id']}  {result['text']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Shared helpers for the per-repository index caches.
+
+backlog_index, claims_index, evidence_index and facts_search each keep a
+versioned JSON dotfile next to the file they index. An entry records the
+source's size and mtime_ns plus when it was recorded, and is reused only while
+is_fresh holds; otherwise the source is re-read and its content digest decides
+whether the cached index still applies.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from publish_output import write_atomic
+
+
+def is_fresh(entry: Any, size: int, mtime_ns: int) -> bool:
+    # Like git's racy-clean check: a file modified after the entry was recorded
+    # may have changed within the same mtime tick, so it is hashed again.
+    return (
+        isinstance(entry, dict)
+        and entry.get("size") == size
+        and entry.get("mtime_ns") == mtime_ns
+        and mtime_ns < entry.get("recorded_ns", 0)
+    )
+
+
+def load_cached_index(cache_path: Path, version: int, field: str = "index") -> dict[str, Any] | None:
+    # None for a missing, unreadable, outdated or malformed cache file.
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != version:
+        return None
+    if not isinstance(cache.get(field), dict):
+        return None
+    return cache
+
+
+def save_cached_index(cache_path: Path, cache: dict[str, Any]) -> None:
+    try:
+        write_atomic(cache_path, json.dumps(cache, separators=(",", ":")))
+    except OSError:
+        # Read-only repositories still get an index, just not a persisted one.
+        pass
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Incremental JSON tokenizer that yields string values with their pointers.
+
+The document is read in fixed-size chunks and nesting is tracked on an explicit
+stack, so memory stays bounded by the chunk size plus the longest single string,
+and arbitrarily deep payloads never touch Python's recursion limit. Containers
+that fit inside the current chunk are handed to the C decoder in one call.
+
+Usage:
+  python3 scripts/json_stream.py --path /career/public_site/projects/demo.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+CHUNK_SIZE = 1 << 20
+# Containers opened above this depth are first offered to the C decoder whole;
+# deeper ones are always tokenized so nesting never reaches the recursion limit.
+DECODE_MAX_DEPTH = 32
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+SCALAR = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null|NaN|Infinity|-Infinity")
+# Characters a number or literal can be made of; a scalar is only complete once
+# its extent ends before the end of the buffer (or the input is exhausted).
+SCALAR_EXTENT = re.compile(r"[-+.0-9A-Za-z]*")
+
+VALUE = "value"
+VALUE_OR_CLOSE = "value_or_close"
+KEY = "key"
+KEY_OR_CLOSE = "key_or_close"
+COLON = "colon"
+COMMA_OR_CLOSE = "comma_or_close"
+
+
+def iter_value_strings(value: Any, pointer: str = "$") -> Iterator[tuple[str, str]]:
+    stack: list[tuple[str, Any]] = [(pointer, value)]
+    while stack:
+        pointer, value = stack.pop()
+        if isinstance(value, str):
+            yield pointer, value
+        elif isinstance(value, list):
+            stack.extend((f"{pointer}[{index}]", value[index]) for index in range(len(value) - 1, -1, -1))
+        elif isinstance(value, dict):
+            stack.extend((f"{pointer}.{key}", item) for key, item in reversed(value.items()))
+
+
+def iter_json_strings(handle: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, str]]:
+    buf = ""
+    pos = 0
+    eof = False
+    # Position of buf[0] within the whole document, for json-style error messages.
+    offset_base = 0
+    line_base = 0
+    column_base = 0
+    stack: list[str] = []
+    parts: list[str] = []
+    counts: list[int] = []
+    expect: str | None = VALUE
+    decoder = JSONDecoder()
+
+    def fill(grow: bool = False) -> None:
+        nonlocal buf, pos, eof, offset_base, line_base, column_base
+        newline = buf.rfind("\n", 0, pos)
+        column_base = pos - newline - 1 if newline >= 0 else column_base + pos
+        line_base += buf.count("\n", 0, pos)
+        offset_base += pos
+        # A token split across chunks is re-scanned after each read; growing the
+        # read geometrically keeps that linear for very long strings.
+        size = max(chunk_size, len(buf) - pos) if grow else chunk_size
+        more = handle.read(size)
+        if not more:
+            eof = True
+        buf = buf[pos:] + more
+        pos = 0
+
+    def fail(message: str, at: int) -> JSONDecodeError:
+        lines = buf.count("\n", 0, at)
+        lineno = line_base + lines + 1
+        colno = at - buf.rfind("\n", 0, at) if lines else column_base + at + 1
+        error = JSONDecodeError(message, buf, at)
+        error.pos, error.lineno, error.colno = offset_base + at, lineno, colno
+        error.args = (f"{message}: line {lineno} column {colno} (char {error.pos})",)
+        return error
+
+    def unexpected() -> JSONDecodeError:
+        if expect is None:
+            return fail("Extra data", pos)
+        if expect in (KEY, KEY_OR_CLOSE):
+            return fail("Expecting property name enclosed in double quotes", pos)
+        if expect == COLON:
+            return fail("Expecting ':' delimiter", pos)
+        if expect == COMMA_OR_CLOSE:
+            return fail("Expecting ',' delimiter", pos)
+        return fail("Expecting value", pos)
+
+    def value_done() -> str | None:
+        return COMMA_OR_CLOSE if stack else None
+
+    while True:
+        pos = WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                break
+            fill()
+            continue
+
+        char = buf[pos]
+        if char == '"':
+            if expect not in (VALUE, VALUE_OR_CLOSE, KEY, KEY_OR_CLOSE):
+                raise unexpected()
+            try:
+                value, end = scanstring(buf, pos + 1)
+            except JSONDecodeError as exc:
+                if eof:
+                    raise fail(exc.msg, exc.pos) from None
+                fill(grow=True)
+                continue
+            pos = end
+            if expect in (KEY, KEY_OR_CLOSE):
+                parts[-1] = f".{value}"
+                expect = COLON
+                continue
+            yield "$" + "".join(parts), value
+            expect = value_done()
+        elif char in "{[":
+            if expect not in (VALUE, VALUE_OR_CLOSE):
+                raise unexpected()
+            if len(stack) < DECODE_MAX_DEPTH:
+                # Most containers fit in the buffer; decoding those in C and walking
+                # the result is far faster than tokenizing them in Python. A failure
+                # here (incomplete or invalid input) just falls through to the tokenizer.
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except (JSONDecodeError, RecursionError):
+                    pass
+                else:
+                    yield from iter_value_strings(value, "$" + "".join(parts))
+                    pos = end
+                    expect = value_done()
+                    continue
+            stack.append(char)
+            counts.append(0)
+            parts.append("" if char == "{" else "[0]")
+            expect = KEY_OR_CLOSE if char == "{" else VALUE_OR_CLOSE
+            pos += 1
+        elif char in "}]":
+            opener = "{" if char == "}" else "["
+            allowed = (KEY_OR_CLOSE if char == "}" else VALUE_OR_CLOSE, COMMA_OR_CLOSE)
+            if not stack or stack[-1] != opener or expect not in allowed:
+                raise unexpected()
+            stack.pop()
+            counts.pop()
+            parts.pop()
+            pos += 1
+            expect = value_done()
+        elif char == ",":
+            if expect != COMMA_OR_CLOSE:
+                raise unexpected()
+            if stack[-1] == "{":
+                expect = KEY
+            else:
+                counts[-1] += 1
+                parts[-1] = f"[{counts[-1]}]"
+                expect = VALUE
+            pos += 1
+        elif char == ":":
+            if expect != COLON:
+                raise unexpected()
+            expect = VALUE
+            pos += 1
+        else:
+            if char == "\ufeff" and offset_base + pos == 0:
+                raise fail("Unexpected UTF-8 BOM (decode using utf-8-sig)", pos)
+            if expect not in (VALUE, VALUE_OR_CLOSE):
+                raise unexpected()
+            extent = SCALAR_EXTENT.match(buf, pos).end()
+            if extent == len(buf) and not eof:
+                fill(grow=True)
+                continue
+            match = SCALAR.match(buf, pos, extent)
+            if match is None:
+                raise unexpected()
+            pos = match.end()
+            expect = value_done()
+
+    if expect is not None:
+        raise unexpected()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Print every string value in a JSON file with its pointer.")
+    parser.add_argument("--path", required=True, help="JSON file to tokenize")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    path = Path(args.path).expanduser().resolve()
+    with path.open(encoding="utf-8", newline="") as handle:
+        for pointer, value in iter_json_strings(handle):
+            print(f"{pointer}: {value}")
+
+
+if __name__ == "__main__":
+    main()
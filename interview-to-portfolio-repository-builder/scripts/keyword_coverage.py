@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""Score keyword coverage of target job postings against every project.
+
+Keywords come from career.json targeting_profile: the keyword_bank (must_have
+and nice_to_have) and each job posting. A posting may list its own "keywords",
+"must_have" and "nice_to_have"; otherwise bank keywords found in its role_title,
+url_or_text_ref or "text" are used. Each project's parsed project.md sections and
+website.json structured fields form its text ("Keyword gaps" lines excluded).
+
+Keywords and projects form a sparse keyword x project matrix, and all postings
+are scored against it in one batched sparse product: NumPy when it is installed,
+an equivalent pure-Python loop otherwise (both give identical results).
+
+Usage:
+  python3 scripts/keyword_coverage.py --root /career
+  python3 scripts/keyword_coverage.py --root /career --postings postings.ndjson --engine python
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from publish_output import dump_json, write_atomic
+from publish_safe_export import cached_parse_project_markdown, prune_parse_cache
+from repo_records import discover_project_dirs, load_json
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python engine gives the same scores.
+    np = None
+
+COVERAGE_NAME = "keyword_coverage.json"
+# Any Unicode word characters, plus "+" and "#" so "C++" and "C#" stay keywords.
+KEYWORD_TOKEN = re.compile(r"[\w+#]+")
+MUST_HAVE_WEIGHT = 1.0
+NICE_TO_HAVE_WEIGHT = 0.5
+BANK_POSTING_ID = "keyword_bank"
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize_phrase(text: str) -> str:
+    # Postings repeat the same keywords many times over; each spelling is normalized once.
+    return " ".join(KEYWORD_TOKEN.findall(text.casefold()))
+
+
+def string_values(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from string_values(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from string_values(item)
+
+
+def project_fragments(markdown: str | None, website: dict[str, Any]) -> list[str]:
+    # Fragments are matched separately so a phrase never spans two bullets.
+    fragments: list[str] = []
+    if markdown is not None:
+        parsed = cached_parse_project_markdown(markdown)
+        fragments.extend([parsed["title"], parsed["context"], parsed["my_role"], *parsed["stack"]])
+        for section in parsed["sections"]:
+            fragments.append(section["heading"])
+            fragments.extend(section["body"].splitlines())
+            fragments.extend(bullet for bullet in section["bullets"] if not bullet.lower().startswith("keyword gaps"))
+    structured = website.get("structured_fields") if isinstance(website.get("structured_fields"), dict) else {}
+    fragments.extend(string_values(structured))
+    return fragments
+
+
+def phrase_grams(fragments: Iterable[str], max_tokens: int) -> set[str]:
+    grams: set[str] = set()
+    for fragment in fragments:
+        tokens = KEYWORD_TOKEN.findall(fragment.casefold())
+        for size in range(1, min(max_tokens, len(tokens)) + 1):
+            grams.update(" ".join(tokens[start : start + size]) for start in range(len(tokens) - size + 1))
+    return grams
+
+
+def keyword_list(value: Any) -> list[str]:
+    return [item for item in value if isinstance(item, str) and item.strip()] if isinstance(value, list) else []
+
+
+def phrase_length(phrases: Iterable[str]) -> int:
+    return max((phrase.count(" ") + 1 for phrase in phrases), default=1)
+
+
+def posting_keywords(posting: dict[str, Any], bank: dict[str, float], bank_length: int) -> dict[str, float]:
+    weights: dict[str, float] = {}
+    listed = [
+        (keyword_list(posting.get("keywords")), MUST_HAVE_WEIGHT),
+        (keyword_list(posting.get("must_have")), MUST_HAVE_WEIGHT),
+        (keyword_list(posting.get("nice_to_have")), NICE_TO_HAVE_WEIGHT),
+    ]
+    for keywords, weight in listed:
+        for keyword in keywords:
+            phrase = normalize_phrase(keyword)
+            if phrase:
+                weights[phrase] = max(weight, weights.get(phrase, 0.0))
+    if weights:
+        return weights
+    text = " ".join(str(posting.get(field) or "") for field in ("role_title", "url_or_text_ref", "text"))
+    grams = phrase_grams([text], bank_length)
+    return {phrase: weight for phrase, weight in bank.items() if phrase in grams}
+
+
+def collect_postings(
+    career: dict[str, Any], extra: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    targeting = career.get("targeting_profile") if isinstance(career.get("targeting_profile"), dict) else {}
+    keyword_bank = targeting.get("keyword_bank") if isinstance(targeting.get("keyword_bank"), dict) else {}
+    postings = targeting.get("job_postings") if isinstance(targeting.get("job_postings"), list) else []
+
+    labels: dict[str, str] = {}
+    bank: dict[str, float] = {}
+    for keywords, weight in (
+        (keyword_list(keyword_bank.get("must_have")), MUST_HAVE_WEIGHT),
+        (keyword_list(keyword_bank.get("nice_to_have")), NICE_TO_HAVE_WEIGHT),
+    ):
+        for keyword in keywords:
+            phrase = normalize_phrase(keyword)
+            if phrase:
+                labels.setdefault(phrase, keyword.strip())
+                bank[phrase] = max(weight, bank.get(phrase, 0.0))
+
+    bank_length = phrase_length(bank)
+    seen: set[str] = set()
+    scored = [{"id": BANK_POSTING_ID, "company": "", "role_title": "keyword_bank", "keywords": bank}]
+    for position, posting in enumerate([*postings, *extra]):
+        if not isinstance(posting, dict):
+            continue
+        for field in ("keywords", "must_have", "nice_to_have"):
+            for keyword in keyword_list(posting.get(field)):
+                if keyword not in seen:
+                    seen.add(keyword)
+                    labels.setdefault(normalize_phrase(keyword), keyword.strip())
+        scored.append(
+            {
+                "id": str(posting.get("id") or f"posting-{position + 1}"),
+                "company": str(posting.get("company") or ""),
+                "role_title": str(posting.get("role_title") or ""),
+                "keywords": posting_keywords(posting, bank, bank_length),
+            }
+        )
+    return scored, labels
+
+
+def keyword_matrix(vocabulary: dict[str, int], project_grams: list[set[str]]) -> list[list[int]]:
+    # Sparse keyword x project matrix stored by keyword: the projects containing it.
+    columns: list[list[int]] = [[] for _ in vocabulary]
+    for project, grams in enumerate(project_grams):
+        for phrase in vocabulary.keys() & grams:
+            columns[vocabulary[phrase]].append(project)
+    return columns
+
+
+def top_python(
+    rows: list[list[tuple[int, float]]], columns: list[list[int]], project_count: int, top: int
+) -> list[list[tuple[int, float]]]:
+    best = []
+    for row in rows:
+        covered = [0.0] * project_count
+        total = 0.0
+        for keyword, weight in row:
+            total += weight
+            for project in columns[keyword]:
+                covered[project] += weight
+        order = sorted(range(project_count), key=lambda project: -covered[project])[:top]
+        best.append([(project, covered[project] / total) for project in order])
+    return best
+
+
+def top_numpy(
+    rows: list[list[tuple[int, float]]], columns: list[list[int]], project_count: int, top: int
+) -> list[list[tuple[int, float]]]:
+    # Both operands are sparse: postings x keywords (the rows) and keywords x
+    # projects (the columns). Every (posting, keyword) entry is expanded over the
+    # projects containing that keyword and one bincount sums the products, giving
+    # the dense postings x projects coverage in a single batched operation.
+    posting_ids = np.repeat(np.arange(len(rows)), [len(row) for row in rows])
+    keywords = np.fromiter((keyword for row in rows for keyword, _ in row), dtype=np.intp, count=len(posting_ids))
+    weights = np.fromiter((weight for row in rows for _, weight in row), dtype=np.float64, count=len(posting_ids))
+    column_sizes = np.array([len(projects) for projects in columns], dtype=np.intp)
+    column_starts = np.concatenate(([0], np.cumsum(column_sizes)[:-1]))
+    column_projects = np.fromiter(
+        (project for projects in columns for project in projects), dtype=np.intp, count=int(column_sizes.sum())
+    )
+    fanout = column_sizes[keywords]
+    offsets = np.arange(int(fanout.sum())) - np.repeat(np.cumsum(fanout) - fanout, fanout)
+    projects = column_projects[np.repeat(column_starts[keywords], fanout) + offsets]
+    cells = np.repeat(posting_ids, fanout) * project_count + projects
+    covered = np.bincount(cells, weights=np.repeat(weights, fanout), minlength=len(rows) * project_count)
+    totals = np.bincount(posting_ids, weights=weights, minlength=len(rows))
+    coverage = covered.reshape(len(rows), project_count) / totals[:, None]
+    # A stable sort keeps ties in project order, matching the pure-Python engine.
+    order = np.argsort(-coverage, axis=1, kind="stable")[:, :top]
+    scores = np.take_along_axis(coverage, order, axis=1)
+    return [list(zip(projects, values)) for projects, values in zip(order.tolist(), scores.tolist())]
+
+
+def score_postings(
+    postings: list[dict[str, Any]], project_grams: list[set[str]], engine: str, top: int
+) -> tuple[dict[str, int], list[list[int]], list[list[tuple[int, float]]], str]:
+    vocabulary: dict[str, int] = {}
+    rows = []
+    for posting in postings:
+        keywords = posting["keywords"].items()
+        rows.append([(vocabulary.setdefault(phrase, len(vocabulary)), weight) for phrase, weight in keywords])
+    columns = keyword_matrix(vocabulary, project_grams)
+    scorable = [row for row in rows if row]
+    if engine == "auto":
+        engine = "numpy" if np is not None else "python"
+    if not scorable or not project_grams:
+        best: list[list[tuple[int, float]]] = [[] for _ in scorable]
+    elif engine == "numpy":
+        best = top_numpy(scorable, columns, len(project_grams), top)
+    else:
+        best = top_python(scorable, columns, len(project_grams), top)
+    # Postings without any keyword are listed without project scores.
+    results = iter(best)
+    return vocabulary, columns, [next(results) if row else [] for row in rows], engine
+
+
+def coverage_report(
+    slugs: list[str],
+    postings: list[dict[str, Any]],
+    labels: dict[str, str],
+    vocabulary: dict[str, int],
+    columns: list[list[int]],
+    best: list[list[tuple[int, float]]],
+    max_missing: int,
+) -> dict[str, Any]:
+    phrases = list(vocabulary)
+    demand = [0.0] * len(phrases)
+    for posting in postings:
+        for phrase, weight in posting["keywords"].items():
+            demand[vocabulary[phrase]] += weight
+    ranked = sorted(range(len(phrases)), key=lambda keyword: (-demand[keyword], phrases[keyword]))
+    covered_by: list[set[int]] = [set() for _ in slugs]
+    for keyword, projects in enumerate(columns):
+        for project in projects:
+            covered_by[project].add(keyword)
+
+    def label(keyword: int) -> str:
+        return labels.get(phrases[keyword], phrases[keyword])
+
+    projects: dict[str, Any] = {}
+    for project, slug in enumerate(slugs):
+        missing = [keyword for keyword in ranked if keyword not in covered_by[project]]
+        projects[slug] = {
+            "covered": [label(keyword) for keyword in ranked if keyword in covered_by[project]],
+            "missing": [label(keyword) for keyword in missing[:max_missing]],
+            "missing_count": len(missing),
+        }
+    scored_postings = []
+    for posting, top in zip(postings, best):
+        scored_postings.append(
+            {
+                "id": posting["id"],
+                "company": posting["company"],
+                "role_title": posting["role_title"],
+                "keywords": len(posting["keywords"]),
+                "top_projects": [{"slug": slugs[project], "coverage": round(score, 4)} for project, score in top],
+            }
+        )
+    return {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "keyword_count": len(phrases),
+        "uncovered_keywords": [label(keyword) for keyword in ranked if not columns[keyword]],
+        "projects": projects,
+        "postings": scored_postings,
+    }
+
+
+def load_postings(path: Path) -> list[dict[str, Any]]:
+    text = path.read_text(encoding="utf-8")
+    try:
+        if path.suffix.lower() in {".ndjson", ".jsonl"}:
+            postings = [json.loads(line) for line in text.splitlines() if line.strip()]
+        else:
+            postings = json.loads(text)
+    except json.JSONDecodeError as error:
+        raise SystemExit(f"Invalid postings file {path}: {error}")
+    if not isinstance(postings, list):
+        raise SystemExit(f"Postings file {path} must hold a list of postings")
+    return postings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Score keyword coverage of job postings against projects.")
+    parser.add_argument("--root", required=True, help="Path to /career")
+    parser.add_argument("--postings", help="Extra postings to score: a JSON list or NDJSON file.")
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "numpy", "python"],
+        default="auto",
+        help="Scoring engine (auto uses NumPy when it is installed).",
+    )
+    parser.add_argument("--out", help=f"Report path (default: <root>/{COVERAGE_NAME}).")
+    parser.add_argument("--top-projects", type=int, default=3, help="Best-matching projects listed per posting.")
+    parser.add_argument("--max-missing", type=int, default=25, help="Missing keywords listed per project.")
+    args = parser.parse_args()
+    if args.engine == "numpy" and np is None:
+        parser.error("--engine numpy requires NumPy to be installed")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    root = Path(args.root).expanduser().resolve()
+    if not root.exists():
+        raise SystemExit(f"Missing root path: {root}")
+
+    career = load_json(root / "career.json", fallback={})
+    extra = load_postings(Path(args.postings).expanduser()) if args.postings else []
+    postings, labels = collect_postings(career, extra)
+    max_tokens = phrase_length(phrase for posting in postings for phrase in posting["keywords"])
+    slugs: list[str] = []
+    project_grams: list[set[str]] = []
+    for project_dir in discover_project_dirs(root / "projects"):
+        md_path = project_dir / "project.md"
+        markdown = md_path.read_text(encoding="utf-8") if md_path.exists() else None
+        fragments = project_fragments(markdown, load_json(project_dir / "website.json", fallback={}))
+        slugs.append(project_dir.name)
+        project_grams.append(phrase_grams(fragments, max_tokens))
+
+    started = time.perf_counter()
+    vocabulary, columns, best, engine = score_postings(postings, project_grams, args.engine, args.top_projects)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    report = coverage_report(slugs, postings, labels, vocabulary, columns, best, args.max_missing)
+
+    out_path = Path(args.out).expanduser() if args.out else root / COVERAGE_NAME
+    write_atomic(out_path, dump_json(report))
+    prune_parse_cache()
+    print(
+        f"Scored {len(postings)} postings x {len(slugs)} projects ({len(vocabulary)} keywords) "
+        f"with {engine} in {elapsed_ms:.1f} ms"
+    )
+    print(f"Wrote: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
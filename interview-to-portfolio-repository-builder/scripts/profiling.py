@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Per-stage profiling shared by the command-line scripts (--profile / --cprofile).
+
+Stages are named once, in STAGES, so reports from different scripts can be
+compared key by key. Nothing is hooked until a profiling flag is given: only
+then are the functions listed for each stage rebound, in every loaded script
+module, to wrappers that record calls, wall time (inclusive and self), bytes
+read and written by the process (from /proc/self/io where available) and the
+tracemalloc peak above the memory in use when the stage started. Without the
+flags the scripts run their plain functions.
+
+Nested calls of the same stage (sanitize_any calling sanitize_text) count
+once. A generator stage (iter_file_issues) counts one call and is timed each
+time it is resumed, so its wall time covers producing items rather than just
+creating the generator, and excludes whatever the consumer does in between.
+Stages run in worker processes would be invisible, so profiled runs use
+--jobs 1. tracemalloc slows allocation-heavy code, which inflates wall
+times; use --cprofile for a function-level view (python3 -m pstats FILE).
+
+Usage:
+  python3 scripts/publish_safe_export.py --root /career --profile
+  python3 scripts/build_handoff.py --root /career --profile handoff_profile.json --cprofile handoff.pstats
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from publish_output import dump_json, write_atomic
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROFILE_VERSION = 1
+# Stage name -> "module.function" targets. Modules a script never imports are skipped.
+STAGES: dict[str, tuple[str, ...]] = {
+    "load_json": ("repo_records.load_json", "publish_lint.load_lint_cache"),
+    "parse_markdown": ("publish_safe_export.parse_project_markdown",),
+    "sanitize": (
+        "publish_safe_export.sanitize_text",
+        "publish_safe_export.sanitize_list",
+        "publish_safe_export.sanitize_any",
+    ),
+    "voice_variants": ("publish_safe_export.normalize_voice_variants",),
+    "export_project": ("publish_safe_export.export_project_content",),
+    "handoff": ("build_handoff.build_handoff",),
+    "backlog": ("backlog_index.load_backlog_index", "backlog_index.index_backlog"),
+    "evidence": ("evidence_index.load_evidence_index",),
+    "lint": (
+        "publish_lint.lint_file",
+        "publish_lint.iter_file_issues",
+        "publish_lint.lint_text",
+    ),
+    "bootstrap": ("bootstrap_career_repo.bootstrap_root",),
+    "hash": (
+        "repo_records.inputs_digest",
+        "repo_records.contents_digest",
+        "publish_lint.file_digest",
+    ),
+    "write": (
+        "publish_output.write_staged",
+        "publish_output.write_atomic",
+        "publish_output.write_json",
+        "publish_output.write_bundle",
+        "build_handoff.write_markdown",
+        "publish_lint.write_lint_cache",
+        "bootstrap_career_repo.write_if_missing",
+        "bootstrap_career_repo.ensure_json_file",
+    ),
+    "staging": ("publish_output.begin_staging", "publish_output.commit_staging"),
+}
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="Write a per-stage JSON profile to PATH (default: stderr). Runs with --jobs 1.",
+    )
+    parser.add_argument("--cprofile", metavar="PATH", help="Also dump cProfile stats to PATH (read with pstats).")
+
+
+def script_modules() -> list[Any]:
+    modules = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and module is not sys.modules[__name__] and Path(path).resolve().parent == SCRIPTS_DIR:
+            modules.append(module)
+    return modules
+
+
+def resolve_target(target: str, modules: list[Any]) -> Callable[..., Any] | None:
+    # A script run directly is __main__, so modules are matched by file name too.
+    module_name, name = target.rsplit(".", 1)
+    for module in modules:
+        if Path(module.__file__).stem == module_name and callable(getattr(module, name, None)):
+            return getattr(module, name)
+    return None
+
+
+def open_io_counters() -> int | None:
+    try:
+        return os.open("/proc/self/io", os.O_RDONLY)
+    except OSError:
+        return None
+
+
+def read_io(state: dict[str, Any]) -> tuple[int, int]:
+    if state["io_fd"] is None:
+        return 0, 0
+    data = os.pread(state["io_fd"], 512, 0)
+    fields = data.split()
+    # Reading the counters is itself a read, counted once the read completes;
+    # earlier probes are kept out of the stage totals.
+    read = int(fields[1]) - state["probe_bytes"]
+    state["probe_bytes"] += len(data)
+    return read, int(fields[3])
+
+
+def fold_peak(state: dict[str, Any]) -> None:
+    peak = state["tracemalloc"].get_traced_memory()[1]
+    state["peak"] = max(state["peak"], peak)
+    for frame in state["stack"]:
+        frame["peak"] = max(frame["peak"], peak)
+    state["tracemalloc"].reset_peak()
+
+
+def enter_stage(state: dict[str, Any], name: str) -> None:
+    fold_peak(state)
+    current = state["tracemalloc"].get_traced_memory()[0]
+    read, written = read_io(state)
+    state["stages"][name]["depth"] += 1
+    state["stack"].append(
+        {
+            "name": name,
+            "started": time.perf_counter(),
+            "read": read,
+            "written": written,
+            "memory": current,
+            "peak": current,
+            "children": 0.0,
+        }
+    )
+
+
+def leave_stage(state: dict[str, Any], call: bool = True) -> None:
+    finished = time.perf_counter()
+    fold_peak(state)
+    read, written = read_io(state)
+    frame = state["stack"].pop()
+    stats = state["stages"][frame["name"]]
+    elapsed = finished - frame["started"]
+    stats["depth"] -= 1
+    stats["calls"] += call
+    stats["wall_seconds"] += elapsed
+    stats["self_seconds"] += elapsed - frame["children"]
+    stats["read_bytes"] += read - frame["read"]
+    stats["written_bytes"] += written - frame["written"]
+    stats["peak_bytes"] = max(stats["peak_bytes"], frame["peak"] - frame["memory"])
+    if state["stack"]:
+        state["stack"][-1]["children"] += elapsed
+
+
+def stage_generator(state: dict[str, Any], name: str, generator: Iterator[Any]) -> Iterator[Any]:
+    # Each resume is its own enter/leave pair: a span across yields would stay
+    # open while the consumer runs other stages and break the frame stack.
+    call = True
+    while True:
+        nested = state["stages"][name]["depth"] > 0
+        if not nested:
+            enter_stage(state, name)
+        try:
+            item = next(generator)
+        except StopIteration:
+            return
+        finally:
+            if not nested:
+                leave_stage(state, call)
+                call = False
+        yield item
+
+
+def stage_wrapper(state: dict[str, Any], name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.isgeneratorfunction(function):
+
+        @functools.wraps(function)
+        def generator_wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            # Iteration only: send() and throw() are not forwarded.
+            return stage_generator(state, name, function(*args, **kwargs))
+
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if state["stages"][name]["depth"]:
+            return function(*args, **kwargs)
+        enter_stage(state, name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            leave_stage(state)
+
+    return wrapper
+
+
+def install_stages(state: dict[str, Any]) -> list[tuple[Any, str, Any]]:
+    modules = script_modules()
+    wrappers: dict[int, Callable[..., Any]] = {}
+    for name, targets in STAGES.items():
+        for target in targets:
+            function = resolve_target(target, modules)
+            if function is not None and id(function) not in wrappers:
+                wrappers[id(function)] = stage_wrapper(state, name, function)
+    # Rebind every reference, including names imported into other modules.
+    replaced = []
+    for module in modules:
+        for attribute, value in list(vars(module).items()):
+            wrapper = wrappers.get(id(value))
+            if wrapper is not None:
+                replaced.append((module, attribute, value))
+                setattr(module, attribute, wrapper)
+    return replaced
+
+
+def empty_stage() -> dict[str, Any]:
+    return {
+        "calls": 0,
+        "wall_seconds": 0.0,
+        "self_seconds": 0.0,
+        "read_bytes": 0,
+        "written_bytes": 0,
+        "peak_bytes": 0,
+        "depth": 0,
+    }
+
+
+def build_report(state: dict[str, Any], script: str, wall_seconds: float, totals: tuple[int, int]) -> dict[str, Any]:
+    stages = {}
+    for name, stats in state["stages"].items():
+        stages[name] = {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+        del stages[name]["depth"]
+    return {
+        "version": PROFILE_VERSION,
+        "script": script,
+        "argv": sys.argv[1:],
+        "python": platform.python_version(),
+        "io_counters": state["io_fd"] is not None,
+        "forced_serial": state["forced_serial"],
+        "total": {
+            "wall_seconds": round(wall_seconds, 6),
+            "read_bytes": totals[0],
+            "written_bytes": totals[1],
+            "peak_bytes": state["peak"],
+        },
+        "stages": stages,
+    }
+
+
+@contextmanager
+def profile_session(script: str, args: argparse.Namespace) -> Iterator[None]:
+    report_path, cprofile_path = args.profile, args.cprofile
+    if report_path is None and cprofile_path is None:
+        yield
+        return
+
+    # Imported here so unprofiled runs do not pay for them.
+    import cProfile
+    import tracemalloc
+
+    forced_serial = getattr(args, "jobs", 1) > 1
+    if forced_serial:
+        args.jobs = 1
+    state: dict[str, Any] = {
+        "forced_serial": forced_serial,
+        "stages": {name: empty_stage() for name in STAGES},
+        "stack": [],
+        "io_fd": open_io_counters(),
+        "probe_bytes": 0,
+        "tracemalloc": tracemalloc,
+        "peak": 0,
+    }
+    replaced = install_stages(state)
+    profiler = cProfile.Profile() if cprofile_path else None
+    tracemalloc.start()
+    started_io = read_io(state)
+    started = time.perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall_seconds = time.perf_counter() - started
+        ended_io = read_io(state)
+        fold_peak(state)
+        tracemalloc.stop()
+        for module, attribute, value in replaced:
+            setattr(module, attribute, value)
+        if state["io_fd"] is not None:
+            os.close(state["io_fd"])
+        totals = (ended_io[0] - started_io[0], ended_io[1] - started_io[1])
+        report = build_report(state, script, wall_seconds, totals)
+        if profiler is not None:
+            profiler.dump_stats(cprofile_path)
+            report["cprofile"] = str(Path(cprofile_path).resolve())
+        if report_path == "-":
+            print(json.dumps(report, indent=2), file=sys.stderr)
+        elif report_path is not None:
+            write_atomic(Path(report_path).expanduser(), dump_json(report))
@@ -3,24 +3,56 @@
 
 Usage:
   python3 scripts/publish_lint.py --path /career/public_site
+  python3 scripts/publish_lint.py --path /career/public_site --jobs 8
+  python3 scripts/publish_lint.py --path /career/public_site --no-cache
+  python3 scripts/publish_lint.py --path /career/public_site --format sarif --max-issues 500
+  python3 scripts/publish_lint.py --path /career/public_site --fail-fast
+
+Results are cached per file in <path>/.publish_lint_cache and reused while the
+file's size, mtime and content hash and the blocked-rule set are unchanged.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import mmap
+import os
 import re
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Generator, Iterable, Iterator
+
+from json_stream import iter_json_strings, iter_value_strings
+from profiling import add_profile_arguments, profile_session
+from publish_patterns import (
+    BLOCKED_BYTE_ANCHORS,
+    BLOCKED_MATCHER,
+    BLOCKED_RULE_ORDER,
+    BLOCKED_RULES,
+    blocked_tokens,
+    rules_fingerprint,
+)
 
-BLOCKED_PATTERNS = [
-    ("NEEDS_CLARIFICATION", re.compile(r"NEEDS_CLARIFICATION", re.IGNORECASE)),
-    ("PRIVATE_UNSHARED", re.compile(r"PRIVATE_UNSHARED", re.IGNORECASE)),
-    ("PRIVATE_PATH", re.compile(r"/Users/", re.IGNORECASE)),
-    ("MISSING_MARKER", re.compile(r"\bMISSING\b", re.IGNORECASE)),
-    ("CONFIDENCE_METADATA", re.compile(r"\bConfidence\s*:", re.IGNORECASE)),
-    ("EVIDENCE_METADATA", re.compile(r"\bEvidence\s*:", re.IGNORECASE)),
-]
+LINTABLE_SUFFIXES = {".json", ".ndjson", ".md", ".txt", ".yml", ".yaml"}
+LINT_CACHE_NAME = ".publish_lint_cache"
+LINT_CACHE_VERSION = 2
+STREAM_JSON_MIN_BYTES = 8 * 1024 * 1024
+MAPPED_TEXT_MIN_BYTES = 8 * 1024 * 1024
+MAPPED_WINDOW_BYTES = 1024 * 1024
+# Characters of a long line carried into its next chunk. Must exceed the longest
+# fixed-length blocked token, so a token cut by a chunk boundary is matched whole.
+LONG_LINE_CARRY_CHARS = 256
+DIGEST_CHUNK_BYTES = 1024 * 1024
+# Every boundary str.splitlines() recognises, as UTF-8 bytes.
+LINE_BREAK = re.compile(rb"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+IRREGULAR_BREAKS = (b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9")
+INVALID_JSON_RULE = "INVALID_JSON"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
 
 
 def collect_files(path: Path) -> list[Path]:
@@ -28,75 +60,444 @@ def collect_files(path: Path) -> list[Path]:
         return [path]
     if not path.exists():
         return []
-    return [candidate for candidate in path.rglob("*") if candidate.is_file()]
+    return sorted(candidate for candidate in path.rglob("*") if candidate.is_file())
+
+
+def check_string(value: str, path: Path, line: int | None = None, pointer: str | None = None) -> list[dict[str, Any]]:
+    return [
+        {"path": str(path), "line": line, "pointer": pointer, "rule": name, "snippet": value[:140]}
+        for name in blocked_tokens(value)
+    ]
+
+
+def lint_text(text: str, label: str) -> list[dict[str, Any]]:
+    path = Path(label)
+    return [
+        issue
+        for line_number, line in enumerate(text.splitlines(), start=1)
+        for issue in check_string(line, path, line=line_number)
+    ]
+
+
+def invalid_json_issue(path: Path, exc: json.JSONDecodeError) -> dict[str, Any]:
+    return {"path": str(path), "line": exc.lineno, "pointer": None, "rule": INVALID_JSON_RULE, "snippet": str(exc)}
+
 
+def format_issue(issue: dict[str, Any]) -> str:
+    if issue["rule"] == INVALID_JSON_RULE:
+        return f"{issue['path']}: invalid JSON ({issue['snippet']})"
+    location = issue["pointer"] if issue["pointer"] is not None else issue["line"]
+    return f"{issue['path']}:{location}: blocked token {issue['rule']}: {issue['snippet']}"
 
-def check_string(value: str, source: str) -> list[str]:
-    issues: list[str] = []
-    for name, pattern in BLOCKED_PATTERNS:
-        if pattern.search(value):
-            issues.append(f"{source}: blocked token {name}: {value[:140]}")
-    return issues
+
+def lint_json_stream(path: Path) -> Iterator[dict[str, Any]]:
+    # Issues are yielded as soon as their string is tokenized, so a payload that
+    # turns out to be malformed further down reports them before its parse error.
+    try:
+        with path.open(encoding="utf-8", newline="") as handle:
+            for pointer, value in iter_json_strings(handle):
+                yield from check_string(value, path, pointer=pointer)
+    except json.JSONDecodeError as exc:
+        yield invalid_json_issue(path, exc)
 
 
-def lint_json_payload(path: Path) -> list[str]:
-    issues: list[str] = []
+def lint_json_payload(path: Path) -> Iterator[dict[str, Any]]:
+    # json.loads is several times faster than the incremental tokenizer, so only
+    # large (or too deeply nested) payloads take the bounded-memory path.
+    if path.stat().st_size >= STREAM_JSON_MIN_BYTES:
+        yield from lint_json_stream(path)
+        return
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
-        return [f"{path}: invalid JSON ({exc})"]
+        yield invalid_json_issue(path, exc)
+        return
+    except RecursionError:
+        yield from lint_json_stream(path)
+        return
 
-    def walk(value: Any, pointer: str) -> None:
-        if isinstance(value, str):
-            issues.extend(check_string(value, f"{path}:{pointer}"))
-            return
-        if isinstance(value, list):
-            for index, item in enumerate(value):
-                walk(item, f"{pointer}[{index}]")
+    for pointer, value in iter_value_strings(payload):
+        yield from check_string(value, path, pointer=pointer)
+
+
+def count_line_breaks(window: bytes) -> int:
+    if any(mark in window for mark in IRREGULAR_BREAKS) or window.count(b"\r") != window.count(b"\r\n"):
+        return sum(1 for _ in LINE_BREAK.finditer(window))
+    return window.count(b"\n")
+
+
+def lint_window(window: bytes, path: Path, line_base: int) -> Iterator[dict[str, Any]]:
+    folded = window.lower()
+    hits: list[int] = []
+    for anchor in BLOCKED_BYTE_ANCHORS:
+        index = folded.find(anchor)
+        while index != -1:
+            hits.append(index)
+            index = folded.find(anchor, index + 1)
+    if not hits:
+        return
+
+    # Line offsets are only indexed for windows that actually contain a candidate.
+    breaks = list(LINE_BREAK.finditer(window))
+    break_ends = [match.end() for match in breaks]
+    last_line = -1
+    for hit in sorted(hits):
+        line = bisect_right(break_ends, hit)
+        if line == last_line:
+            continue
+        last_line = line
+        start = break_ends[line - 1] if line else 0
+        end = breaks[line].start() if line < len(breaks) else len(window)
+        yield from check_string(window[start:end].decode("utf-8"), path, line=line_base + line + 1)
+
+
+def break_end(buffer: mmap.mmap, match: re.Match[bytes]) -> int:
+    # A search bounded by endpos can stop between the two bytes of "\r\n".
+    end = match.end()
+    if match.group() == b"\r" and buffer[end : end + 1] == b"\n":
+        end += 1
+    return end
+
+
+def utf8_boundary(buffer: mmap.mmap, start: int, end: int) -> int:
+    # Moves end back past UTF-8 continuation bytes (at most three) so no
+    # character is split; invalid UTF-8 still fails when the chunk is decoded.
+    floor = max(start, end - 3)
+    while end > floor and buffer[end] & 0xC0 == 0x80:
+        end -= 1
+    return end
+
+
+def lint_long_line(
+    buffer: mmap.mmap, start: int, size: int, path: Path, line: int
+) -> Generator[dict[str, Any], None, tuple[int, int]]:
+    # A line longer than a window is scanned in chunks of MAPPED_WINDOW_BYTES.
+    # Each chunk is matched together with the tail of the previous one (runs of
+    # trailing whitespace folded to one space, as "Confidence   :" still needs
+    # its colon). A truncated tail keeps one extra leading character that is
+    # only context for \b, not searched, and a match touching the end of a chunk
+    # is re-checked with the next one, since "\bMISSING\b" depends on what
+    # follows. Returns the offset just past the line and how many line breaks
+    # ended it (0 or 1).
+    found: set[str] = set()
+    snippet = ""
+    carry = ""
+    skip = 0
+    position = start
+    while True:
+        limit = min(size, position + MAPPED_WINDOW_BYTES)
+        match = LINE_BREAK.search(buffer, position, limit + 2)
+        if match is not None:
+            chunk_end, end = match.start(), break_end(buffer, match)
+        else:
+            chunk_end = end = size if limit == size else utf8_boundary(buffer, position, limit)
+        chunk = buffer[position:chunk_end].decode("utf-8")
+        if len(snippet) < 140:
+            snippet += chunk[: 140 - len(snippet)]
+        text = carry + chunk
+        final = match is not None or end == size
+        deferred = len(text)
+        for hit in BLOCKED_MATCHER.finditer(text, skip):
+            if hit.end() == len(text) and not final:
+                deferred = hit.start()
+            else:
+                found.add(hit.lastgroup)
+        position = end
+        if final:
+            break
+        kept = text.rstrip()
+        cut = min(len(kept) - LONG_LINE_CARRY_CHARS, deferred)
+        skip = int(cut > 0)
+        carry = kept[max(cut - 1, 0) :] + (" " if len(kept) < len(text) else "")
+    for name in sorted(found, key=BLOCKED_RULE_ORDER.__getitem__):
+        yield {"path": str(path), "line": line, "pointer": None, "rule": name, "snippet": snippet}
+    return end, int(match is not None)
+
+
+def window_end(buffer: mmap.mmap, start: int, size: int) -> int | None:
+    # Windows hold MAPPED_WINDOW_BYTES to twice that and end just after a line
+    # break, so no line or anchor spans two of them. None means the line at
+    # start runs past the window and goes to lint_long_line.
+    if size - start <= 2 * MAPPED_WINDOW_BYTES:
+        return size
+    limit = start + MAPPED_WINDOW_BYTES
+    match = LINE_BREAK.search(buffer, limit, limit + MAPPED_WINDOW_BYTES)
+    if match is None:
+        # No break in the second half: end after the last break in the first.
+        for match in LINE_BREAK.finditer(buffer, start, limit + 2):
+            pass
+    return break_end(buffer, match) if match is not None else None
+
+
+def lint_text_mapped(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not size:
             return
-        if isinstance(value, dict):
-            for key, item in value.items():
-                walk(item, f"{pointer}.{key}")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            line_base = 0
+            start = 0
+            while start < size:
+                end = window_end(buffer, start, size)
+                if end is None:
+                    end, breaks = yield from lint_long_line(buffer, start, size, path, line_base + 1)
+                    line_base += breaks
+                else:
+                    window = buffer[start:end]
+                    yield from lint_window(window, path, line_base)
+                    line_base += count_line_breaks(window)
+                start = end
 
-    walk(payload, "$")
-    return issues
 
+def lint_text_payload(path: Path) -> Iterator[dict[str, Any]]:
+    if path.stat().st_size >= MAPPED_TEXT_MIN_BYTES:
+        yield from lint_text_mapped(path)
+        return
 
-def lint_text_payload(path: Path) -> list[str]:
-    issues: list[str] = []
     for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        issues.extend(check_string(line, f"{path}:{line_number}"))
-    return issues
+        yield from check_string(line, path, line=line_number)
+
+
+def iter_file_issues(path: Path) -> Iterator[dict[str, Any]]:
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        yield from lint_json_payload(path)
+    elif suffix in LINTABLE_SUFFIXES:
+        yield from lint_text_payload(path)
+
+
+def lint_file(path: Path) -> list[dict[str, Any]]:
+    return list(iter_file_issues(path))
+
+
+def cache_rules_version() -> str:
+    return f"{LINT_CACHE_VERSION}:{rules_fingerprint(BLOCKED_RULES)}"
+
+
+def file_digest(path: Path) -> str:
+    # Hashed in fixed-size chunks so the cache check stays within the memory
+    # bound of the streaming and mapped lint paths.
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(DIGEST_CHUNK_BYTES)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as handle:
+        while read := handle.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def load_lint_cache(cache_path: Path) -> dict[str, Any]:
+    empty = {"rules_version": cache_rules_version(), "written_ns": 0, "files": {}}
+    if not cache_path.exists():
+        return empty
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return empty
+    if not isinstance(cache, dict) or cache.get("rules_version") != empty["rules_version"]:
+        return empty
+    if not isinstance(cache.get("files"), dict):
+        return empty
+    return cache
+
+
+def write_lint_cache(cache_path: Path, entries: dict[str, dict[str, Any]]) -> None:
+    payload = {"rules_version": cache_rules_version(), "written_ns": time.time_ns(), "files": entries}
+    temp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+
+
+def iter_lint_results(files: list[Path], jobs: int) -> Iterator[tuple[Path, Iterable[dict[str, Any]]]]:
+    if jobs <= 1 or len(files) <= 1:
+        for file_path in files:
+            yield file_path, iter_file_issues(file_path)
+        return
+
+    workers = min(jobs, len(files))
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            # map() yields in submission order, so output matches the serial path.
+            yield from zip(files, pool.map(lint_file, files, chunksize=chunksize))
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
+def iter_cached_issues(files: list[Path], jobs: int, cache_path: Path) -> Iterator[dict[str, Any]]:
+    cache = load_lint_cache(cache_path)
+    cached_files: dict[str, Any] = cache["files"]
+    # Entries for files a stopped run never reached are kept; they are validated
+    # against the file's stat and digest again on the next run.
+    entries = {str(file_path): cached_files[str(file_path)] for file_path in files if str(file_path) in cached_files}
+    fingerprints: dict[str, dict[str, Any]] = {}
+    stale: list[Path] = []
+
+    for file_path in files:
+        key = str(file_path)
+        stat = file_path.stat()
+        entry = cached_files.get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            # Like git's racy-clean check: a file modified after the cache was
+            # written may have changed within the same mtime tick.
+            and stat.st_mtime_ns < cache["written_ns"]
+        ):
+            continue
+
+        fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": file_digest(file_path)}
+        if isinstance(entry, dict) and entry.get("digest") == fingerprint["digest"]:
+            entries[key] = {**entry, **fingerprint}
+            continue
+        fingerprints[key] = fingerprint
+        stale.append(file_path)
+
+    stale_results = iter_lint_results(stale, jobs)
+    try:
+        for file_path in files:
+            key = str(file_path)
+            if key not in fingerprints:
+                yield from entries[key]["issues"]
+                continue
+            _, file_issues = next(stale_results)
+            collected: list[dict[str, Any]] = []
+            for issue in file_issues:
+                collected.append(issue)
+                yield issue
+            entries[key] = {**fingerprints[key], "issues": collected}
+    finally:
+        stale_results.close()
+        write_lint_cache(cache_path, entries)
+
+
+def iter_issues(files: list[Path], jobs: int, cache_path: Path | None) -> Iterator[dict[str, Any]]:
+    if cache_path is not None:
+        yield from iter_cached_issues(files, jobs, cache_path)
+        return
+    for _, file_issues in iter_lint_results(files, jobs):
+        yield from file_issues
+
+
+def emit_text(issues: Iterable[dict[str, Any]], target: Path) -> int:
+    count = 0
+    for issue in issues:
+        if not count:
+            print("Publish lint failed:\n")
+        print(f"- {format_issue(issue)}")
+        count += 1
+    if not count:
+        print(f"Publish lint passed: {target}")
+    return count
+
+
+def emit_json(issues: Iterable[dict[str, Any]], target: Path) -> int:
+    write = sys.stdout.write
+    write(f'{{"target": {json.dumps(str(target))}, "issues": [')
+    count = 0
+    for issue in issues:
+        write(("," if count else "") + "\n  " + json.dumps(issue))
+        count += 1
+    write(f'\n], "issue_count": {count}, "passed": {json.dumps(not count)}}}\n')
+    return count
+
+
+def sarif_result(issue: dict[str, Any]) -> dict[str, Any]:
+    location: dict[str, Any] = {"physicalLocation": {"artifactLocation": {"uri": Path(issue["path"]).as_uri()}}}
+    if issue["line"] is not None:
+        location["physicalLocation"]["region"] = {"startLine": issue["line"]}
+    if issue["pointer"] is not None:
+        location["logicalLocations"] = [{"fullyQualifiedName": issue["pointer"], "kind": "member"}]
+    return {
+        "ruleId": issue["rule"],
+        "level": "error",
+        "message": {"text": format_issue(issue)},
+        "locations": [location],
+    }
+
+
+def emit_sarif(issues: Iterable[dict[str, Any]], target: Path) -> int:
+    rules = [{"id": name, "shortDescription": {"text": f"Blocked token {name}"}} for name, _, _ in BLOCKED_RULES]
+    rules.append({"id": INVALID_JSON_RULE, "shortDescription": {"text": "Payload is not valid JSON"}})
+    driver = {"name": "publish_lint", "rules": rules}
+    write = sys.stdout.write
+    write(f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", "runs": [{{"tool": {{"driver": {json.dumps(driver)}}}, "results": [')
+    count = 0
+    for issue in issues:
+        write(("," if count else "") + "\n  " + json.dumps(sarif_result(issue)))
+        count += 1
+    write("\n]}]}\n")
+    return count
+
+
+def limit_issues(issues: Iterator[dict[str, Any]], max_issues: int | None) -> Iterator[dict[str, Any]]:
+    if max_issues is None:
+        yield from issues
+        return
+    try:
+        for count, issue in enumerate(issues, start=1):
+            yield issue
+            if count >= max_issues:
+                return
+    finally:
+        # Stop workers and flush the cache as soon as the cap is reached.
+        issues.close()
+
+
+EMITTERS = {"text": emit_text, "json": emit_json, "sarif": emit_sarif}
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Lint publish payloads for private markers.")
     parser.add_argument("--path", required=True, help="File or directory path to lint")
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for linting files (default: CPU count; 1 lints serially).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore and do not update the {LINT_CACHE_NAME} file.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(EMITTERS),
+        default="text",
+        help="Output format; issues are streamed to stdout as they are found.",
+    )
+    parser.add_argument("--fail-fast", action="store_true", help="Stop at the first issue.")
+    parser.add_argument("--max-issues", type=int, default=None, help="Stop after reporting N issues.")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    if args.max_issues is not None and args.max_issues < 1:
+        parser.error("--max-issues must be at least 1")
+    return args
 
 
 def main() -> None:
     args = parse_args()
-    target = Path(args.path).expanduser().resolve()
+    with profile_session("publish_lint", args):
+        target = Path(args.path).expanduser().resolve()
 
-    files = collect_files(target)
-    if not files:
-        raise SystemExit(f"No files found at {target}")
+        files = collect_files(target)
+        if not files:
+            raise SystemExit(f"No files found at {target}")
 
-    issues: list[str] = []
-    for file_path in files:
-        if file_path.suffix.lower() == ".json":
-            issues.extend(lint_json_payload(file_path))
-        elif file_path.suffix.lower() in {".md", ".txt", ".yml", ".yaml"}:
-            issues.extend(lint_text_payload(file_path))
-
-    if issues:
-        print("Publish lint failed:\n")
-        for issue in issues:
-            print(f"- {issue}")
-        raise SystemExit(1)
-
-    print(f"Publish lint passed: {target}")
+        files = [path for path in files if path.suffix.lower() in LINTABLE_SUFFIXES]
+        cache_path = None
+        if not args.no_cache:
+            cache_path = (target if target.is_dir() else target.parent) / LINT_CACHE_NAME
+
+        max_issues = 1 if args.fail_fast else args.max_issues
+        issues = limit_issues(iter_issues(files, args.jobs, cache_path), max_issues)
+        if EMITTERS[args.format](issues, target):
+            raise SystemExit(1)
 
 
 if __name__ == "__main__":
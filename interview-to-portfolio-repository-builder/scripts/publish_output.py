@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Staged, crash-safe writer for public_site outputs.
+
+Scripts never write into the published directory directly. A sibling staging
+directory is seeded with hard links to the current files, new content is written
+there, and the finished tree replaces the published one. On Linux the swap is a
+single renameat2(RENAME_EXCHANGE), so readers always see a complete tree;
+elsewhere it is two renames and the published directory is briefly absent
+between them. A crash leaves the published directory untouched; the next run
+discards the leftover staging tree.
+
+Runs on the same output directory are serialized with an flock on a sibling
+lock file, held from staging until the swap (and around watch-mode writes), so
+concurrent exports, handoffs and pipelines never share a staging tree. Writes
+are buffered within a file (WRITE_BUFFER_CHARS per call); many small project
+files are only coalesced by the bundle format.
+
+Bundled exports (projects.ndjson) start with an offset table so one project can
+be read with a single seek; see write_bundle.
+
+Usage:
+  python3 scripts/publish_output.py --out-dir /career/public_site --recover
+  python3 scripts/publish_output.py --out-dir /career/public_site --slug demo-project
+"""
+
+from __future__ import annotations
+
+import argparse
+import errno
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+try:
+    import fcntl
+except ImportError:  # Windows: runs are not serialized.
+    fcntl = None
+
+STAGING_SUFFIX = ".staging"
+PREVIOUS_SUFFIX = ".previous"
+LOCK_SUFFIX = ".lock"
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+EXPORT_MANIFEST_NAME = ".publish_export_manifest"
+BUNDLE_NAME = "projects.ndjson"
+BUNDLE_VERSION = 1
+WRITE_BUFFER_CHARS = 1 << 16
+
+
+def dump_json(payload: Any, compact: bool = False, sort_keys: bool = False) -> str:
+    if compact:
+        return json.dumps(payload, separators=(",", ":"), sort_keys=sort_keys) + "\n"
+    return json.dumps(payload, indent=2, sort_keys=sort_keys) + "\n"
+
+
+def write_buffered(handle: TextIO, chunks: Iterable[str]) -> None:
+    # Encoders emit many tiny chunks; grouping them keeps write calls cheap while
+    # memory stays bounded by WRITE_BUFFER_CHARS rather than the document size.
+    buffer: list[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= WRITE_BUFFER_CHARS:
+            handle.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    handle.write("".join(buffer))
+
+
+def write_json(handle: TextIO, payload: Any, compact: bool = False, sort_keys: bool = False) -> None:
+    # Streaming counterpart of dump_json; produces byte-identical output.
+    if compact:
+        encoder = json.JSONEncoder(separators=(",", ":"), sort_keys=sort_keys)
+    else:
+        encoder = json.JSONEncoder(indent=2, sort_keys=sort_keys)
+    write_buffered(handle, encoder.iterencode(payload))
+    handle.write("\n")
+
+
+def sibling_path(target: Path, suffix: str) -> Path:
+    return target.parent / f".{target.name}{suffix}"
+
+
+@contextmanager
+def output_lock(target: Path) -> Iterator[None]:
+    # flock locks belong to the open file, so the same process must not nest
+    # two of these for one target. The lock file is never removed: deleting it
+    # would let a waiting run lock an inode nobody else can see.
+    if fcntl is None:
+        yield
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(sibling_path(target, LOCK_SUFFIX), "a") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@lru_cache(maxsize=None)
+def load_renameat2() -> Callable[..., int] | None:
+    # renameat2 is in glibc 2.28+ and needs Linux 3.15+; ctypes is imported
+    # here so scripts that never swap a tree do not pay for it.
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+
+    try:
+        return ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+
+
+def exchange_paths(first: Path, second: Path) -> bool:
+    # False when the kernel, libc or filesystem cannot swap atomically.
+    renameat2 = load_renameat2()
+    if renameat2 is None:
+        return False
+    import ctypes
+
+    if renameat2(AT_FDCWD, os.fsencode(first), AT_FDCWD, os.fsencode(second), RENAME_EXCHANGE) == 0:
+        return True
+    error = ctypes.get_errno()
+    if error in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+        return False
+    raise OSError(error, os.strerror(error), str(first), None, str(second))
+
+
+def recover_output(target: Path) -> None:
+    previous = sibling_path(target, PREVIOUS_SUFFIX)
+    staging = sibling_path(target, STAGING_SUFFIX)
+    # Interrupted between the two renames of a swap: the old tree is still whole.
+    if previous.exists() and not target.exists():
+        os.replace(previous, target)
+    for leftover in (previous, staging):
+        if leftover.exists():
+            shutil.rmtree(leftover)
+
+
+def link_tree(source: Path, destination: Path) -> None:
+    destination.mkdir(parents=True)
+    for entry in os.scandir(source):
+        target = destination / entry.name
+        if entry.is_dir(follow_symlinks=False):
+            link_tree(Path(entry.path), target)
+            continue
+        try:
+            os.link(entry.path, target, follow_symlinks=False)
+        except OSError:
+            shutil.copy2(entry.path, target, follow_symlinks=False)
+
+
+def begin_staging(target: Path) -> Path:
+    recover_output(target)
+    staging = sibling_path(target, STAGING_SUFFIX)
+    if target.exists():
+        link_tree(target, staging)
+    else:
+        staging.mkdir(parents=True)
+    return staging
+
+
+@contextmanager
+def open_staged(staging: Path, relative: str | Path) -> Iterator[TextIO]:
+    path = staging / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Staged files may be hard links into the published tree; unlinking first
+    # guarantees the new bytes land in a fresh inode instead of the live file.
+    path.unlink(missing_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        yield handle
+
+
+def write_staged(staging: Path, relative: str | Path, content: str) -> Path:
+    with open_staged(staging, relative) as handle:
+        handle.write(content)
+    return staging / relative
+
+
+def remove_staged(staging: Path, relative: str | Path) -> bool:
+    path = staging / relative
+    if not path.exists():
+        return False
+    path.unlink()
+    return True
+
+
+@contextmanager
+def open_atomic(path: Path) -> Iterator[TextIO]:
+    # Single-file replacement for incremental updates (watch mode), where
+    # restaging the whole tree would cost more than the change itself.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    scratch = path.with_name(f".{path.name}.tmp")
+    try:
+        with scratch.open("w", encoding="utf-8", newline="") as handle:
+            yield handle
+    except BaseException:
+        scratch.unlink(missing_ok=True)
+        raise
+    os.replace(scratch, path)
+
+
+def write_atomic(path: Path, content: str) -> None:
+    with open_atomic(path) as handle:
+        handle.write(content)
+
+
+def commit_staging(staging: Path, target: Path) -> None:
+    if target.exists() and exchange_paths(staging, target):
+        # The staging path now holds the old tree.
+        shutil.rmtree(staging)
+        return
+    # Two renames: target is briefly absent, and recover_output restores it if
+    # a run stops in between.
+    previous = sibling_path(target, PREVIOUS_SUFFIX)
+    if target.exists():
+        os.replace(target, previous)
+    os.replace(staging, target)
+    if previous.exists():
+        shutil.rmtree(previous)
+
+
+def write_bundle(
+    staging: Path, entries: Iterable[tuple[str, bytes]], relative: str = BUNDLE_NAME
+) -> dict[str, list[int]]:
+    # Line 1 is a header whose "offsets" map each slug to [offset, length] of its
+    # line, counted from the first byte after the header. Records are streamed to
+    # a scratch file first because the header has to be written before them.
+    path = staging / relative
+    scratch = path.with_name(path.name + ".records")
+    offsets: dict[str, list[int]] = {}
+    position = 0
+    with scratch.open("wb") as records:
+        for slug, record in entries:
+            record = record.rstrip(b"\n") + b"\n"
+            records.write(record)
+            offsets[slug] = [position, len(record)]
+            position += len(record)
+    header = {"bundle_version": BUNDLE_VERSION, "offsets": offsets}
+    path.unlink(missing_ok=True)
+    with path.open("wb") as bundle, scratch.open("rb") as records:
+        bundle.write(dump_json(header, compact=True).encode("utf-8"))
+        shutil.copyfileobj(records, bundle)
+    scratch.unlink()
+    return offsets
+
+
+def read_bundle_header(path: Path) -> tuple[dict[str, Any], int]:
+    with path.open("rb") as bundle:
+        header = json.loads(bundle.readline())
+        return header, bundle.tell()
+
+
+def read_bundle_records(path: Path, slugs: Iterable[str]) -> Iterator[tuple[str, bytes]]:
+    header, base = read_bundle_header(path)
+    offsets = header.get("offsets", {})
+    with path.open("rb") as bundle:
+        for slug in slugs:
+            offset, length = offsets[slug]
+            bundle.seek(base + offset)
+            yield slug, bundle.read(length)
+
+
+def read_bundle_entry(path: Path, slug: str) -> dict[str, Any]:
+    _, record = next(read_bundle_records(path, [slug]))
+    return json.loads(record)
+
+
+@contextmanager
+def staged_output(target: Path) -> Iterator[Path]:
+    with output_lock(target):
+        staging = begin_staging(target)
+        try:
+            yield staging
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        commit_staging(staging, target)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or repair a staged public_site output directory.")
+    parser.add_argument("--out-dir", required=True, help="Published output directory, e.g. /career/public_site")
+    parser.add_argument(
+        "--recover",
+        action="store_true",
+        help="Restore an interrupted swap and delete leftover staging directories.",
+    )
+    parser.add_argument("--slug", help=f"Print one project from <out-dir>/{BUNDLE_NAME} using its offset table.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    target = Path(args.out_dir).expanduser().resolve()
+    if args.slug:
+        print(dump_json(read_bundle_entry(target / BUNDLE_NAME, args.slug)), end="")
+        return
+    candidates = [sibling_path(target, STAGING_SUFFIX), sibling_path(target, PREVIOUS_SUFFIX)]
+    leftovers = [path for path in candidates if path.exists()]
+    for path in leftovers:
+        print(f"Leftover: {path}")
+    if args.recover:
+        with output_lock(target):
+            recover_output(target)
+        print(f"Recovered: {target}")
+    elif not leftovers:
+        print(f"Clean: {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Shared publish-safety pattern engine used by publish_lint and publish_safe_export.
+
+Each rule set is compiled into a single alternation of named groups, so a string
+is scanned once while every match can still be attributed to its rule. A lowercase
+anchor check runs first because most published text contains no marker at all.
+The per-rule reference implementations and their benchmark live in benchmarks.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+# Each rule is (name, regex, anchor). The anchor is a lowercase literal that every
+# match must contain; it lets clean ASCII strings skip the regex engine entirely.
+BLOCKED_RULES = [
+    ("NEEDS_CLARIFICATION", r"NEEDS_CLARIFICATION", "needs_clarification"),
+    ("PRIVATE_UNSHARED", r"PRIVATE_UNSHARED", "private_unshared"),
+    ("PRIVATE_PATH", r"/Users/", "/users/"),
+    ("MISSING_MARKER", r"\bMISSING\b", "missing"),
+    ("CONFIDENCE_METADATA", r"\bConfidence\s*:", "confidence"),
+    ("EVIDENCE_METADATA", r"\bEvidence\s*:", "evidence"),
+]
+
+PRIVATE_LINE_RULES = [
+    ("NEEDS_CLARIFICATION", r"NEEDS_CLARIFICATION", "needs_clarification"),
+    ("PRIVATE_UNSHARED", r"PRIVATE[_/]UNSHARED", "unshared"),
+    ("MISSING_PREFIX", r"^\s*MISSING\b", "missing"),
+    ("PRIVATE_PATH", r"/Users/", "/users/"),
+]
+
+PUBLISH_METADATA_RULES = [
+    ("CONFIDENCE_NOTE", r"\s*\(Confidence:.*$", "(confidence:"),
+    ("EVIDENCE_NOTE", r"\s*\(Evidence:.*$", "(evidence:"),
+    ("APPROVAL_NOTE", r"\s*\(publication-safe phrasing approved\)", "(publication-safe phrasing approved)"),
+]
+
+# Evidence values (claims.md "Evidence:", evidence.yml url_or_path) that mean
+# nothing usable has been recorded yet; compared after strip().upper().
+MISSING_EVIDENCE = frozenset({"", "MISSING", "NEEDS_CLARIFICATION"})
+
+PUBLISH_METADATA_PATTERNS = [re.compile(pattern, re.IGNORECASE) for _, pattern, _ in PUBLISH_METADATA_RULES]
+
+
+def combine_rules(rules: list[tuple[str, str, str]]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in rules), re.IGNORECASE)
+
+
+def rule_anchors(rules: list[tuple[str, str, str]]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(anchor for _, _, anchor in rules))
+
+
+def rules_fingerprint(rules: list[tuple[str, str, str]]) -> str:
+    return hashlib.sha256(repr(rules).encode("utf-8")).hexdigest()[:16]
+
+
+BLOCKED_MATCHER = combine_rules(BLOCKED_RULES)
+PRIVATE_LINE_MATCHER = combine_rules(PRIVATE_LINE_RULES)
+PUBLISH_METADATA_MATCHER = combine_rules(PUBLISH_METADATA_RULES)
+BLOCKED_ANCHORS = rule_anchors(BLOCKED_RULES)
+PRIVATE_LINE_ANCHORS = rule_anchors(PRIVATE_LINE_RULES)
+PUBLISH_METADATA_ANCHORS = rule_anchors(PUBLISH_METADATA_RULES)
+# Non-ASCII letters that IGNORECASE folds onto ASCII ones (İ, ı, ſ and the Kelvin
+# sign). Byte-level sweeps treat any of them as a possible hit.
+CASE_FOLD_ALIASES = "\u0130\u0131\u017f\u212a"
+BLOCKED_BYTE_ANCHORS = tuple(anchor.encode("ascii") for anchor in BLOCKED_ANCHORS) + tuple(
+    char.encode("utf-8") for char in CASE_FOLD_ALIASES
+)
+BLOCKED_RULE_ORDER = {name: index for index, (name, _, _) in enumerate(BLOCKED_RULES)}
+
+
+def may_match(value: str, anchors: tuple[str, ...]) -> bool:
+    # IGNORECASE also folds a few non-ASCII letters onto ASCII ones, so only
+    # ASCII text can be ruled out by a plain lowercase substring check.
+    if not value.isascii():
+        return True
+    folded = value.lower()
+    return any(anchor in folded for anchor in anchors)
+
+
+def blocked_tokens(value: str) -> list[str]:
+    if not may_match(value, BLOCKED_ANCHORS):
+        return []
+    found = {match.lastgroup for match in BLOCKED_MATCHER.finditer(value)}
+    return sorted(found, key=BLOCKED_RULE_ORDER.__getitem__)
+
+
+def has_private_marker(value: str) -> bool:
+    if not may_match(value, PRIVATE_LINE_ANCHORS):
+        return False
+    return PRIVATE_LINE_MATCHER.search(value) is not None
+
+
+def strip_metadata(value: str) -> str:
+    if not may_match(value, PUBLISH_METADATA_ANCHORS):
+        return value
+    if "\n" in value:
+        # The note patterns run to end-of-string, so applying them one after
+        # another differs from a single sweep once a value spans several lines.
+        return strip_metadata_sequential(value)
+    return PUBLISH_METADATA_MATCHER.sub("", value)
+
+
+def strip_metadata_sequential(value: str) -> str:
+    for pattern in PUBLISH_METADATA_PATTERNS:
+        value = pattern.sub("", value)
+    return value
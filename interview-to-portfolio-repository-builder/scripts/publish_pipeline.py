@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Run export, handoff and publish lint in one process, in one staged swap.
+
+The stages are the ones the standalone scripts run: publish_safe_export's
+incremental export (manifest, --jobs, --format bundle), build_handoff fed with
+the manifest that export just wrote (as with --from-exports), and publish_lint
+over the staged tree with its per-file cache. Everything is written into the
+staging copy of the output directory and linted there; nothing is swapped into
+place unless lint passes.
+
+Usage:
+  python3 scripts/publish_pipeline.py --root /career --voice first_person
+  python3 scripts/publish_pipeline.py --root /career --voice third_person --voices selected --compact
+  python3 scripts/publish_pipeline.py --root /career --voice first_person --format bundle --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Any
+
+from build_handoff import build_handoff, write_markdown
+from profiling import add_profile_arguments, profile_session
+from publish_lint import LINT_CACHE_NAME, LINTABLE_SUFFIXES, collect_files, format_issue, iter_issues
+from publish_output import open_staged, staged_output, write_json
+from publish_safe_export import add_export_arguments, report_export, resolve_out_dir, stage_export
+
+
+def lint_staged(staging: Path, out_dir: Path, jobs: int) -> list[dict[str, Any]]:
+    files = [path for path in collect_files(staging) if path.suffix.lower() in LINTABLE_SUFFIXES]
+    # The cache travels with the tree; its keys are staging paths, which are the
+    # same on every pipeline run, so unchanged (hard-linked) files are not re-read.
+    issues = list(iter_issues(files, jobs, staging / LINT_CACHE_NAME))
+    for issue in issues:
+        issue["path"] = str(out_dir / Path(issue["path"]).relative_to(staging))
+    return issues
+
+
+def run_pipeline(args: argparse.Namespace) -> list[dict[str, Any]]:
+    root = Path(args.root).expanduser().resolve()
+    out_dir = resolve_out_dir(args)
+    with staged_output(out_dir) as staging:
+        summary = stage_export(args, staging)
+        handoff = build_handoff(root, export_manifest=summary["manifest"])
+        with open_staged(staging, "website_handoff.json") as handle:
+            write_json(handle, handoff, args.compact)
+        with open_staged(staging, "website_handoff.md") as handle:
+            write_markdown(handle, handoff)
+        issues = lint_staged(staging, out_dir, args.jobs)
+        for issue in issues:
+            print(format_issue(issue))
+        if issues and not args.allow_lint_issues:
+            # Raised inside staged_output, so the staging tree is discarded.
+            raise SystemExit(f"Publish lint failed: {len(issues)} issue(s); nothing was written to {out_dir}")
+    report_export(args, out_dir, summary)
+    print(f"Publish pipeline wrote: {out_dir}")
+    return issues
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export, build handoff and lint /career in a single process.")
+    add_export_arguments(parser)
+    parser.add_argument(
+        "--allow-lint-issues",
+        action="store_true",
+        help="Write outputs even when publish lint finds blocked tokens (still exits 1).",
+    )
+    add_profile_arguments(parser)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with profile_session("publish_pipeline", args):
+        root = Path(args.root).expanduser().resolve()
+        if not root.exists():
+            raise SystemExit(f"Missing root path: {root}")
+        if run_pipeline(args):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
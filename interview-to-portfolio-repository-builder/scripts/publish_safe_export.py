@@ -3,31 +3,103 @@
 
 Usage:
   python3 scripts/publish_safe_export.py --root /career --voice first_person
+  python3 scripts/publish_safe_export.py --root /career --voice first_person --jobs 8
+  python3 scripts/publish_safe_export.py --root /career --voice first_person --force
+  python3 scripts/publish_safe_export.py --root /career --voice third_person --voices selected
+  python3 scripts/publish_safe_export.py --root /career --voice first_person --compact
+  python3 scripts/publish_safe_export.py --root /career --voice first_person --format bundle
+  python3 scripts/publish_safe_export.py --root /career --voice first_person --watch
+
+Exports are incremental: <out-dir>/.publish_export_manifest records a hash of each
+project's inputs, and projects whose inputs, voice options, display name and exporter
+version are unchanged are not re-exported. The manifest also records each input's size
+and mtime, so inputs that still match are not read at all; only changed projects are
+hashed again. Projects that are re-exported reuse the parse of any byte-identical
+project.md seen before, from any project or tenant, via the shared content cache
+(content_cache.py). Output is staged and swapped into
+place in one step (see publish_output.py), so an interrupted export never leaves
+<out-dir> half written. With --watch, edits are picked up by polling file stats
+and only the affected project files, index.json and the website handoff are
+rewritten, each atomically. Each export ends with an evidence coverage summary
+built from every project's evidence.yml (see evidence_index.py).
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from build_handoff import build_handoff, order_project_payloads, parse_backlog_high_priority, write_handoff
+from content_cache import cached_value, prune_cache
+from evidence_index import EVIDENCE_NAME, evidence_gaps, format_gap_counts, load_evidence_index
+from profiling import add_profile_arguments, profile_session
+from publish_output import (
+    BUNDLE_NAME,
+    EXPORT_MANIFEST_NAME,
+    dump_json,
+    output_lock,
+    read_bundle_header,
+    read_bundle_records,
+    remove_staged,
+    staged_output,
+    write_atomic,
+    write_bundle,
+    write_staged,
+)
+from publish_patterns import (
+    PRIVATE_LINE_RULES,
+    PUBLISH_METADATA_RULES,
+    has_private_marker,
+    rules_fingerprint,
+    strip_metadata,
+)
+from repo_records import (
+    PROJECT_INPUTS,
+    handoff_record,
+    inputs_digest,
+    load_export_manifest,
+    load_json,
+    project_inputs,
+    record_entry,
+    stat_inputs,
+    write_export_manifest,
+)
 
 DEFAULT_VOICE = "first_person"
 DEFAULT_NAME = "The candidate"
-PRIVATE_LINE_PATTERNS = [
-    re.compile(r"NEEDS_CLARIFICATION", re.IGNORECASE),
-    re.compile(r"PRIVATE_UNSHARED", re.IGNORECASE),
-    re.compile(r"PRIVATE/UNSHARED", re.IGNORECASE),
-    re.compile(r"^\s*MISSING\b", re.IGNORECASE),
-    re.compile(r"/Users/", re.IGNORECASE),
-]
-
-PUBLISH_METADATA_PATTERNS = [
-    re.compile(r"\s*\(Confidence:.*$", re.IGNORECASE),
-    re.compile(r"\s*\(Evidence:.*$", re.IGNORECASE),
-    re.compile(r"\s*\(publication-safe phrasing approved\)", re.IGNORECASE),
-]
+VOICES = ("first_person", "third_person")
+VOICE_LIST_FIELDS = ("highlights", "outcomes", "what_i_built", "impact_highlights")
+# Lines opening with a verb already in third person singular ("Builds ...") keep their wording in first person.
+KEEPS_OPENING_VERB = re.compile(r"[A-Z][a-z]+s\b").match
+# Bump whenever export_project or export_career output changes shape or content.
+EXPORTER_VERSION = "1"
+# Bump whenever parse_project_markdown output changes; cached parses (see content_cache.py) then stop matching.
+PARSER_VERSION = "1"
+PARSE_CACHE_NAMESPACE = "project_md"
+PARSE_CACHE_STATS = {"hits": 0, "misses": 0}
+BUNDLE_PARTS_DIR = ".bundle_parts"
+WATCHED_ROOT_FILES = ("career.json", "backlog_questions.md")
+# Distinct lines kept by the sanitize cache; enough for thousands of projects
+# while keeping memory bounded in long-running processes.
+SANITIZE_CACHE_SIZE = 1 << 16
+WORKER_SANITIZE_STATS = {"hits": 0, "misses": 0}
+
+META_PATTERNS = {
+    label: re.compile(rf"\*\*{re.escape(label)}:\*\*\s*(.+)") for label in ["When", "Context", "My role"]
+}
+SECTION_KEY_CHARS = re.compile(r"[^a-z0-9]+")
+# Separators str.splitlines() honours besides \n. The ASCII ones are checked with
+# plain substring tests because a character-class scan is slow on large files.
+ASCII_EXTRA_LINE_BREAKS = "\r\x0b\x0c\x1c\x1d\x1e"
+EXTRA_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 PUBLIC_SECTION_DEFAULTS = {
     "context": "public",
@@ -43,42 +115,43 @@ PUBLIC_SECTION_DEFAULTS = {
 
 
 def section_key(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "_", value.strip().lower()).strip("_")
+    return SECTION_KEY_CHARS.sub("_", value.strip().lower()).strip("_")
 
 
 def is_public_line(value: str) -> bool:
     line = value.strip()
     if not line:
         return False
-    return not any(pattern.search(line) for pattern in PRIVATE_LINE_PATTERNS)
+    return not has_private_marker(line)
 
 
 def strip_publish_metadata(value: str) -> str:
-    text = value
-    for pattern in PUBLISH_METADATA_PATTERNS:
-        text = pattern.sub("", text)
-    return text.strip()
+    return strip_metadata(value).strip()
 
 
-def sanitize_text(value: str) -> str:
-    lines = [strip_publish_metadata(line.strip()) for line in value.splitlines()]
-    kept = [line for line in lines if is_public_line(line)]
-    return "\n".join(kept).strip()
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def sanitize_line(value: str) -> str:
+    # Returns "" for lines that must not be published. The same highlight or
+    # summary line is sanitized for structured fields and again for every voice.
+    cleaned = strip_publish_metadata(value.strip())
+    return cleaned if is_public_line(cleaned) else ""
 
 
-def sanitize_list(values: list[str]) -> list[str]:
-    cleaned = [strip_publish_metadata(item.strip()) for item in values]
-    return [item for item in cleaned if is_public_line(item)]
+def sanitize_cache_stats() -> dict[str, int]:
+    info = sanitize_line.cache_info()
+    return {
+        "hits": info.hits + WORKER_SANITIZE_STATS["hits"],
+        "misses": info.misses + WORKER_SANITIZE_STATS["misses"],
+    }
 
 
-def load_json(path: Path, fallback: dict[str, Any] | None = None) -> dict[str, Any]:
-    if not path.exists():
-        return fallback or {}
+def sanitize_text(value: str) -> str:
+    kept = [line for line in map(sanitize_line, value.splitlines()) if line]
+    return "\n".join(kept).strip()
+
 
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return fallback or {}
+def sanitize_list(values: list[str]) -> list[str]:
+    return [item for item in map(sanitize_line, values) if item]
 
 
 def strip_frontmatter(markdown: str) -> str:
@@ -92,56 +165,109 @@ def strip_frontmatter(markdown: str) -> str:
     return markdown[end + 5 :]
 
 
+def has_extra_line_breaks(value: str) -> bool:
+    if value.isascii():
+        return any(char in value for char in ASCII_EXTRA_LINE_BREAKS)
+    return EXTRA_LINE_BREAKS.search(value) is not None
+
+
+def opens_block(lines: list[str], index: int, marker: str) -> bool:
+    # Mirrors ^<marker>\s+ : the marker must be followed by whitespace, and a bare
+    # marker line only qualifies when more lines follow it.
+    line = lines[index]
+    if not line.startswith(marker):
+        return False
+    if len(line) == len(marker):
+        return index + 1 < len(lines)
+    return line[len(marker)].isspace()
+
+
+def next_text_line(lines: list[str], index: int) -> int:
+    # A marker followed only by whitespace takes its text from the next non-blank
+    # line, as the multi-line \s+ in the original regexes did.
+    while not lines[index].strip():
+        index += 1
+    return index
+
+
+def title_text(lines: list[str], index: int) -> str:
+    return lines[index][1:].strip() or lines[next_text_line(lines, index + 1)].strip()
+
+
+def parse_section_body(lines: list[str], has_extra_breaks: bool) -> tuple[str, list[str]]:
+    if has_extra_breaks:
+        # Bodies were historically split with str.splitlines(), which also breaks
+        # on \r, \x0b, \x85, \u2028 and friends; headings only split on \n.
+        lines = [piece for line in lines for piece in line.splitlines()]
+    bullets: list[str] = []
+    prose: list[str] = []
+    for line, stripped in zip(lines, map(str.strip, lines)):
+        if stripped[:2] == "- ":
+            bullets.append(stripped[2:].strip())
+        elif stripped:
+            prose.append(line)
+    return "\n".join(prose).strip(), bullets
+
+
 def parse_project_markdown(markdown: str) -> dict[str, Any]:
     clean_markdown = strip_frontmatter(markdown.replace("\r\n", "\n")).strip()
-    title_match = re.search(r"^#\s+(.+)$", clean_markdown, flags=re.MULTILINE)
-
-    first_section_match = re.search(r"^##\s+", clean_markdown, flags=re.MULTILINE)
-    preface = clean_markdown[: first_section_match.start()] if first_section_match else clean_markdown
+    lines = clean_markdown.split("\n")
+    has_extra_breaks = has_extra_line_breaks(clean_markdown)
+
+    title = ""
+    preface_end: int | None = None
+    headings: list[tuple[str, int]] = []
+    body_ends: list[int] = []
+
+    # One linear walk over the lines; only lines starting with "#" need any
+    # attention, everything else is sliced out per section afterwards.
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if line[:1] != "#":
+            index += 1
+            continue
+        if not title and opens_block(lines, index, "#"):
+            title = title_text(lines, index)
+        if opens_block(lines, index, "##"):
+            if preface_end is None:
+                preface_end = index
+            else:
+                body_ends.append(index)
+            heading = line[2:].strip()
+            if not heading:
+                # A bare "##" takes its heading from the next non-blank line,
+                # which is consumed and cannot open a section of its own.
+                index = next_text_line(lines, index + 1)
+                heading = lines[index].strip()
+                if not title and opens_block(lines, index, "#"):
+                    title = title_text(lines, index)
+            headings.append((heading, index + 1))
+        index += 1
+    body_ends.append(len(lines))
+
+    preface = clean_markdown if preface_end is None else "".join(line + "\n" for line in lines[:preface_end])
 
     def extract_meta(label: str) -> str:
-        pattern = re.compile(rf"\*\*{re.escape(label)}:\*\*\s*(.+)")
-        match = pattern.search(preface)
+        match = META_PATTERNS[label].search(preface)
         return match.group(1).strip() if match else ""
 
-    stack_match = re.search(r"\*\*Stack:\*\*[\s\S]*?(?=\n##\s+|$)", preface)
     stack = []
-    if stack_match:
+    stack_start = preface.find("**Stack:**")
+    if stack_start != -1:
         stack = [
             line.strip()[2:].strip()
-            for line in stack_match.group(0).splitlines()
+            for line in preface[stack_start:].splitlines()
             if line.strip().startswith("- ")
         ]
 
-    section_matches = list(re.finditer(r"^##\s+(.+)$", clean_markdown, flags=re.MULTILINE))
     sections: list[dict[str, Any]] = []
-    for index, match in enumerate(section_matches):
-        heading = match.group(1).strip()
-        body_start = match.end()
-        body_end = section_matches[index + 1].start() if index + 1 < len(section_matches) else len(clean_markdown)
-        body = clean_markdown[body_start:body_end].strip()
-
-        bullets = [
-            line.strip()[2:].strip()
-            for line in body.splitlines()
-            if line.strip().startswith("- ")
-        ]
-
-        prose = "\n".join(
-            line for line in body.splitlines() if line.strip() and not line.strip().startswith("- ")
-        ).strip()
-
-        sections.append(
-            {
-                "heading": heading,
-                "key": section_key(heading),
-                "body": prose,
-                "bullets": bullets,
-            }
-        )
+    for (heading, body_start), body_end in zip(headings, body_ends):
+        body, bullets = parse_section_body(lines[body_start:body_end], has_extra_breaks)
+        sections.append({"heading": heading, "key": section_key(heading), "body": body, "bullets": bullets})
 
     return {
-        "title": title_match.group(1).strip() if title_match else "Untitled Project",
+        "title": title or "Untitled Project",
         "when": extract_meta("When"),
         "context": extract_meta("Context"),
         "my_role": extract_meta("My role"),
@@ -150,81 +276,97 @@ def parse_project_markdown(markdown: str) -> dict[str, Any]:
     }
 
 
+def cached_parse_project_markdown(markdown: str) -> dict[str, Any]:
+    return cached_value(
+        PARSE_CACHE_NAMESPACE,
+        PARSER_VERSION,
+        markdown.encode("utf-8"),
+        partial(parse_project_markdown, markdown),
+        PARSE_CACHE_STATS,
+    )
+
+
+def prune_parse_cache() -> None:
+    # Only runs that stored new parses can have grown the cache past its bound.
+    if PARSE_CACHE_STATS["misses"]:
+        prune_cache(current={PARSE_CACHE_NAMESPACE: PARSER_VERSION})
+
+
+# Per item on purpose: a substitution over the joined list would split items that
+# contain newlines (summaries may), and still needs a per-item lowercasing callback.
+def first_person_list(items: list[str]) -> list[str]:
+    output = []
+    for item in items:
+        cleaned = item.strip()
+        if cleaned and not cleaned.startswith("I ") and not KEEPS_OPENING_VERB(cleaned):
+            cleaned = f"I {cleaned[0].lower()}{cleaned[1:]}"
+        output.append(cleaned)
+    return output
+
+
+def third_person_list(items: list[str], display_name: str) -> list[str]:
+    output = []
+    for item in items:
+        cleaned = item.strip()
+        if cleaned and not cleaned.startswith(display_name):
+            if cleaned.startswith("I "):
+                cleaned = f"{display_name} {cleaned[2:]}"
+            else:
+                cleaned = f"{display_name} {cleaned[0].lower()}{cleaned[1:]}"
+        output.append(cleaned)
+    return output
+
+
 def first_person(text: str) -> str:
-    cleaned = text.strip()
-    if not cleaned:
-        return cleaned
-    if cleaned.startswith("I "):
-        return cleaned
-    if re.match(r"^[A-Z][a-z]+s\b", cleaned):
-        return cleaned
-    return f"I {cleaned[0].lower()}{cleaned[1:]}"
+    return first_person_list([text])[0]
 
 
 def third_person(text: str, display_name: str) -> str:
-    cleaned = text.strip()
-    if not cleaned:
-        return cleaned
-    if cleaned.startswith(display_name):
-        return cleaned
-    if cleaned.startswith("I "):
-        return f"{display_name} {cleaned[2:]}"
-    return f"{display_name} {cleaned[0].lower()}{cleaned[1:]}"
+    return third_person_list([text], display_name)[0]
 
 
-def normalize_voice_variants(website: dict[str, Any], structured: dict[str, Any], display_name: str) -> dict[str, Any]:
+def normalize_voice_variants(
+    website: dict[str, Any], structured: dict[str, Any], display_name: str, voices: tuple[str, ...] = VOICES
+) -> dict[str, Any]:
     variants = website.get("voice_variants") if isinstance(website.get("voice_variants"), dict) else {}
-
     base_summary = str(structured.get("public_summary", "")).strip()
-    base_highlights = structured.get("highlights", [])
-    base_outcomes = structured.get("outcomes", [])
-    base_built = structured.get("what_i_built", [])
-    base_impact = structured.get("impact_highlights", [])
-
-    first = variants.get("first_person") if isinstance(variants.get("first_person"), dict) else {}
-    third = variants.get("third_person") if isinstance(variants.get("third_person"), dict) else {}
 
     def clean_summary(value: Any) -> str:
         text = str(value or "").strip()
         return text if is_public_line(text) else ""
 
-    first_summary = clean_summary(first.get("public_summary")) or clean_summary(base_summary)
-    third_summary = clean_summary(third.get("public_summary")) or clean_summary(base_summary)
-
-    first_payload = {
-        "public_summary": first_person(first_summary),
-        "highlights": [first_person(item) for item in sanitize_list(list(first.get("highlights") or base_highlights))],
-        "outcomes": [first_person(item) for item in sanitize_list(list(first.get("outcomes") or base_outcomes))],
-        "what_i_built": [first_person(item) for item in sanitize_list(list(first.get("what_i_built") or base_built))],
-        "impact_highlights": [
-            first_person(item) for item in sanitize_list(list(first.get("impact_highlights") or base_impact))
-        ],
-    }
-
-    third_payload = {
-        "public_summary": third_person(third_summary, display_name),
-        "highlights": [third_person(item, display_name) for item in sanitize_list(list(third.get("highlights") or base_highlights))],
-        "outcomes": [third_person(item, display_name) for item in sanitize_list(list(third.get("outcomes") or base_outcomes))],
-        "what_i_built": [third_person(item, display_name) for item in sanitize_list(list(third.get("what_i_built") or base_built))],
-        "impact_highlights": [
-            third_person(item, display_name)
-            for item in sanitize_list(list(third.get("impact_highlights") or base_impact))
-        ],
-    }
-
-    return {
-        "first_person": first_payload,
-        "third_person": third_payload,
-    }
-
-
-def export_project(project_dir: Path, voice: str, display_name: str) -> dict[str, Any] | None:
+    def transform(voice: str, items: list[str]) -> list[str]:
+        if voice == "first_person":
+            return first_person_list(items)
+        return third_person_list(items, display_name)
+
+    # Only the requested voices are built; each list is sanitized and transformed once.
+    output: dict[str, Any] = {}
+    for voice in voices:
+        overrides = variants.get(voice) if isinstance(variants.get(voice), dict) else {}
+        summary = clean_summary(overrides.get("public_summary")) or clean_summary(base_summary)
+        payload = {"public_summary": transform(voice, [summary])[0]}
+        for field in VOICE_LIST_FIELDS:
+            items = sanitize_list(list(overrides.get(field) or structured.get(field, [])))
+            payload[field] = transform(voice, items)
+        output[voice] = payload
+    return output
+
+
+def export_project(project_dir: Path, voice: str, display_name: str, voices: str = "all") -> dict[str, Any] | None:
     project_md = project_dir / "project.md"
     if not project_md.exists():
         return None
-
-    parsed = parse_project_markdown(project_md.read_text(encoding="utf-8"))
     website = load_json(project_dir / "website.json", fallback={})
+    return export_project_content(
+        project_dir.name, project_md.read_text(encoding="utf-8"), website, voice, display_name, voices
+    )
+
+
+def export_project_content(
+    slug: str, markdown: str, website: dict[str, Any], voice: str, display_name: str, voices: str = "all"
+) -> dict[str, Any]:
+    parsed = cached_parse_project_markdown(markdown)
     display = website.get("display") if isinstance(website.get("display"), dict) else {}
 
     visibility = dict(PUBLIC_SECTION_DEFAULTS)
@@ -288,14 +430,15 @@ def export_project(project_dir: Path, voice: str, display_name: str) -> dict[str
         "stack": sanitize_list(list(structured_input.get("stack", parsed["stack"]))),
     }
 
-    voice_variants = normalize_voice_variants(website, structured, display_name)
+    built_voices = VOICES if voices == "all" else (voice,)
+    voice_variants = normalize_voice_variants(website, structured, display_name, built_voices)
 
     timeline_display = str(display.get("timeline_display") or "hide")
     title = sanitize_text(str(display.get("title") or parsed["title"]))
     when = sanitize_text(parsed["when"]) if timeline_display != "hide" else ""
 
     return {
-        "slug": project_dir.name,
+        "slug": slug,
         "title": title,
         "when": when,
         "context": sanitize_text(parsed["context"]),
@@ -306,7 +449,7 @@ def export_project(project_dir: Path, voice: str, display_name: str) -> dict[str
         "structured_fields": structured,
         "voice_variants": voice_variants,
         "selected_voice": voice,
-        "selected_content": voice_variants.get(voice, voice_variants[DEFAULT_VOICE]),
+        "selected_content": voice_variants[voice] if voice in voice_variants else voice_variants[DEFAULT_VOICE],
     }
 
 
@@ -322,8 +465,10 @@ def sanitize_any(value: Any) -> Any:
 
 
 def export_career(career_root: Path, voice: str) -> dict[str, Any]:
-    career = load_json(career_root / "career.json", fallback={})
+    return export_career_content(load_json(career_root / "career.json", fallback={}), voice)
+
 
+def export_career_content(career: dict[str, Any], voice: str) -> dict[str, Any]:
     public_fields = {
         "name": career.get("name", DEFAULT_NAME),
         "headline": career.get("headline", ""),
@@ -353,8 +498,97 @@ def export_career(career_root: Path, voice: str) -> dict[str, Any]:
     return sanitized
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Export publish-safe portfolio payloads from a /career repository.")
+def write_project_export(
+    project_dir: Path,
+    voice: str,
+    display_name: str,
+    out_projects_dir: Path,
+    voices: str = "all",
+    compact: bool = False,
+) -> str | None:
+    project_payload = export_project(project_dir, voice, display_name, voices)
+    if not project_payload:
+        return None
+    write_staged(out_projects_dir, f"{project_payload['slug']}.json", dump_json(project_payload, compact))
+    return project_payload["slug"]
+
+
+def write_project_export_counted(
+    project_dir: Path, **kwargs: Any
+) -> tuple[str | None, dict[str, int], dict[str, int]]:
+    before = sanitize_line.cache_info()
+    parses = dict(PARSE_CACHE_STATS)
+    slug = write_project_export(project_dir, **kwargs)
+    after = sanitize_line.cache_info()
+    return (
+        slug,
+        {"hits": after.hits - before.hits, "misses": after.misses - before.misses},
+        {name: PARSE_CACHE_STATS[name] - parses[name] for name in parses},
+    )
+
+
+def export_projects(
+    project_dirs: list[Path],
+    voice: str,
+    display_name: str,
+    out_projects_dir: Path,
+    jobs: int,
+    voices: str = "all",
+    compact: bool = False,
+) -> list[str]:
+    options = {
+        "voice": voice,
+        "display_name": display_name,
+        "out_projects_dir": out_projects_dir,
+        "voices": voices,
+        "compact": compact,
+    }
+    if jobs <= 1 or len(project_dirs) <= 1:
+        slugs = [write_project_export(project_dir, **options) for project_dir in project_dirs]
+    else:
+        workers = min(jobs, len(project_dirs))
+        chunksize = max(1, len(project_dirs) // (workers * 4))
+        export_one = partial(write_project_export_counted, **options)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Workers write their own project files; map() keeps slugs in directory order.
+            results = list(pool.map(export_one, project_dirs, chunksize=chunksize))
+        slugs = [slug for slug, _, _ in results]
+        # Each worker has its own sanitize cache and counters; fold them into this process.
+        for _, stats, parses in results:
+            WORKER_SANITIZE_STATS["hits"] += stats["hits"]
+            WORKER_SANITIZE_STATS["misses"] += stats["misses"]
+            PARSE_CACHE_STATS["hits"] += parses["hits"]
+            PARSE_CACHE_STATS["misses"] += parses["misses"]
+    return [slug for slug in slugs if slug]
+
+
+def bundle_records(
+    parts_dir: Path, bundle_path: Path, slugs: list[str], rebuilt: set[str]
+) -> Iterator[tuple[str, bytes]]:
+    # Rebuilt projects come from their freshly written part; everything else is
+    # copied byte-for-byte out of the previous bundle without being parsed.
+    reused = read_bundle_records(bundle_path, [slug for slug in slugs if slug not in rebuilt])
+    try:
+        for slug in slugs:
+            yield (slug, (parts_dir / f"{slug}.json").read_bytes()) if slug in rebuilt else next(reused)
+    finally:
+        reused.close()
+
+
+def export_settings(voice: str, voices: str, compact: bool, export_format: str, display_name: str) -> dict[str, Any]:
+    return {
+        "exporter_version": EXPORTER_VERSION,
+        # Editing the sanitizing rules invalidates every export, like the lint cache.
+        "rules": rules_fingerprint(PRIVATE_LINE_RULES + PUBLISH_METADATA_RULES),
+        "voice": voice,
+        "voices": voices,
+        "compact": compact,
+        "format": export_format,
+        "display_name": display_name,
+    }
+
+
+def add_export_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--root", required=True, help="Path to /career")
     parser.add_argument(
         "--voice",
@@ -362,55 +596,318 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_VOICE,
         help="Select voice variant for selected content.",
     )
+    parser.add_argument(
+        "--voices",
+        choices=["selected", "all"],
+        default="all",
+        help="Build voice_variants for every voice (all) or only the --voice one (selected).",
+    )
     parser.add_argument(
         "--out-dir",
         default="public_site",
         help="Output directory name (relative to --root) or absolute path.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for exporting projects (default: CPU count; 1 exports serially).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"Ignore {EXPORT_MANIFEST_NAME} and re-export every project.",
+    )
+    parser.add_argument("--compact", action="store_true", help="Write minified JSON instead of indented JSON.")
+    parser.add_argument(
+        "--format",
+        choices=["files", "bundle"],
+        default="files",
+        help=f"Write one JSON file per project (files) or a single seekable {BUNDLE_NAME} (bundle).",
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export publish-safe portfolio payloads from a /career repository.")
+    add_export_arguments(parser)
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After exporting, keep polling /career and re-export only what changed (also refreshes the handoff).",
+    )
+    parser.add_argument("--poll-interval", type=float, default=0.025, help="Seconds between --watch polls.")
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.025,
+        help="Seconds the inputs must stay unchanged before --watch re-exports.",
+    )
+    add_profile_arguments(parser)
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
+def stage_export(args: argparse.Namespace, staging: Path) -> dict[str, Any]:
+    # Exports into a staging copy of the output directory (see staged_output) and
+    # returns the manifest it wrote with the counts export_site reports.
     career_root = Path(args.root).expanduser().resolve()
-    out_dir = Path(args.out_dir)
-    if not out_dir.is_absolute():
-        out_dir = career_root / out_dir
-
     projects_dir = career_root / "projects"
-    out_projects_dir = out_dir / "projects"
-    out_projects_dir.mkdir(parents=True, exist_ok=True)
-
     career_public = export_career(career_root, args.voice)
     display_name = str(career_public.get("name", DEFAULT_NAME))
+    settings = export_settings(args.voice, args.voices, args.compact, args.format, display_name)
+    project_dirs = sorted([path for path in projects_dir.iterdir() if path.is_dir()]) if projects_dir.exists() else []
+
+    bundle = args.format == "bundle"
+    manifest = {"projects": {}} if args.force else load_export_manifest(staging / EXPORT_MANIFEST_NAME)
+    reusable = manifest["projects"] if manifest.get("settings") == settings else {}
+    bundle_path = staging / BUNDLE_NAME
+    previous_offsets = {}
+    if bundle and reusable and bundle_path.exists():
+        previous_offsets = read_bundle_header(bundle_path)[0].get("offsets", {})
+
+    # Bundled projects are exported one file each into a scratch directory
+    # and then streamed into the bundle, so workers still write in parallel.
+    out_projects_dir = staging / (BUNDLE_PARTS_DIR if bundle else "projects")
+    out_projects_dir.mkdir(exist_ok=True)
+
+    def has_output(slug: str) -> bool:
+        return slug in previous_offsets if bundle else (out_projects_dir / f"{slug}.json").exists()
+
+    entries: dict[str, dict[str, Any]] = {}
+    rebuild: list[Path] = []
+    for project_dir in project_dirs:
+        slug = project_dir.name
+        previous = reusable.get(slug)
+        digest, inputs = project_inputs(project_dir, previous, stat_inputs(project_dir))
+        # Readiness from the private website.json, for build_handoff --from-exports.
+        record = handoff_record(project_dir, previous.get("handoff") if isinstance(previous, dict) else None)
+        if (
+            isinstance(previous, dict)
+            and previous.get("digest") == digest
+            and (not previous.get("exported") or has_output(slug))
+        ):
+            entries[slug] = {**previous, "inputs": inputs, "handoff": record}
+            continue
+        entries[slug] = {"digest": digest, "exported": False, "inputs": inputs, "handoff": record}
+        rebuild.append(project_dir)
 
-    project_payloads = []
-    if projects_dir.exists():
-        for project_dir in sorted([path for path in projects_dir.iterdir() if path.is_dir()]):
-            project_payload = export_project(project_dir, args.voice, display_name)
-            if not project_payload:
-                continue
-            project_payloads.append(project_payload)
-            (out_projects_dir / f"{project_payload['slug']}.json").write_text(
-                json.dumps(project_payload, indent=2) + "\n",
-                encoding="utf-8",
-            )
-
-    (out_dir / "career.public.json").write_text(json.dumps(career_public, indent=2) + "\n", encoding="utf-8")
-    (out_dir / "index.json").write_text(
-        json.dumps(
-            {
-                "voice": args.voice,
-                "career_file": "career.public.json",
-                "projects": [payload["slug"] for payload in project_payloads],
-            },
-            indent=2,
-        )
-        + "\n",
-        encoding="utf-8",
+    exported = export_projects(
+        rebuild, args.voice, display_name, out_projects_dir, args.jobs, args.voices, args.compact or bundle
     )
+    for slug in exported:
+        entries[slug]["exported"] = True
+    exported_slugs = [slug for slug, entry in entries.items() if entry["exported"]]
+
+    removed = 0
+    if bundle:
+        removed = len(set(previous_offsets) - set(exported_slugs))
+        write_bundle(staging, bundle_records(out_projects_dir, bundle_path, exported_slugs, set(exported)))
+        shutil.rmtree(out_projects_dir)
+        # Left over from a previous per-file export.
+        shutil.rmtree(staging / "projects", ignore_errors=True)
+    else:
+        for slug, previous in manifest["projects"].items():
+            stale = isinstance(previous, dict) and previous.get("exported")
+            if stale and not entries.get(slug, {}).get("exported"):
+                removed += remove_staged(out_projects_dir, f"{slug}.json")
+        remove_staged(staging, BUNDLE_NAME)
+
+    career_digest = inputs_digest([career_root / "career.json"])
+    if (
+        manifest.get("settings") != settings
+        or manifest.get("career_digest") != career_digest
+        or not (staging / "career.public.json").exists()
+    ):
+        write_staged(staging, "career.public.json", dump_json(career_public, args.compact))
+
+    index = {
+        "voice": args.voice,
+        "career_file": "career.public.json",
+        "projects": exported_slugs,
+    }
+    if bundle:
+        index["bundle_file"] = BUNDLE_NAME
+    write_staged(staging, "index.json", dump_json(index, args.compact))
+    written = {"settings": settings, "career_digest": career_digest, "projects": entries}
+    write_export_manifest(staging, written)
+    return {"manifest": written, "projects": len(project_dirs), "rebuilt": len(rebuild), "removed": removed}
 
+
+def report_export(args: argparse.Namespace, out_dir: Path, summary: dict[str, Any]) -> None:
+    rebuilt = summary["rebuilt"]
     print(f"Publish-safe payload exported to: {out_dir}")
+    print(f"Projects rebuilt: {rebuilt}, skipped: {summary['projects'] - rebuilt}, removed: {summary['removed']}")
+    cache_stats = sanitize_cache_stats()
+    print(f"Sanitize cache: hits {cache_stats['hits']}, misses {cache_stats['misses']}")
+    print(f"Parse cache: hits {PARSE_CACHE_STATS['hits']}, misses {PARSE_CACHE_STATS['misses']}")
+    prune_parse_cache()
+    career_root = Path(args.root).expanduser().resolve()
+    print(format_gap_counts(load_evidence_index(career_root, list(summary["manifest"]["projects"]))))
+
+
+def export_site(args: argparse.Namespace) -> None:
+    out_dir = resolve_out_dir(args)
+    # Everything is written into a staging copy of out_dir that replaces it only
+    # once the export is complete, so readers never see a half-written site.
+    with staged_output(out_dir) as staging:
+        summary = stage_export(args, staging)
+    report_export(args, out_dir, summary)
+
+
+def resolve_out_dir(args: argparse.Namespace) -> Path:
+    out_dir = Path(args.out_dir)
+    return out_dir if out_dir.is_absolute() else Path(args.root).expanduser().resolve() / out_dir
+
+
+def snapshot_inputs(career_root: Path) -> dict[str, tuple[int, int]]:
+    stats: dict[str, tuple[int, int]] = {}
+    for name in WATCHED_ROOT_FILES:
+        try:
+            stat = os.stat(career_root / name)
+        except FileNotFoundError:
+            continue
+        stats[name] = (stat.st_mtime_ns, stat.st_size)
+    try:
+        project_entries = list(os.scandir(career_root / "projects"))
+    except FileNotFoundError:
+        return stats
+    for project_entry in project_entries:
+        if not project_entry.is_dir():
+            continue
+        # The directory itself is tracked so that projects without inputs still
+        # appear in (and disappear from) the handoff.
+        project_stats = {f"projects/{project_entry.name}": (0, 0)}
+        try:
+            with os.scandir(project_entry.path) as files:
+                for entry in files:
+                    if entry.name in PROJECT_INPUTS or entry.name == EVIDENCE_NAME:
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        project_stats[f"projects/{project_entry.name}/{entry.name}"] = (stat.st_mtime_ns, stat.st_size)
+        except (FileNotFoundError, NotADirectoryError):
+            # Removed (or replaced by a file) since the projects listing; the next poll sees it gone.
+            continue
+        stats.update(project_stats)
+    return stats
+
+
+def changed_inputs(before: dict[str, tuple[int, int]], after: dict[str, tuple[int, int]]) -> set[str]:
+    return {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+
+
+def apply_project_changes(
+    args: argparse.Namespace,
+    career_root: Path,
+    out_dir: Path,
+    manifest: dict[str, Any],
+    handoff: dict[str, Any],
+    slugs: set[str],
+) -> None:
+    settings = manifest["settings"]
+    entries = manifest["projects"]
+    featured_order = handoff.get("featured_project_order", [])
+    handoff_entries = {item["slug"]: item for item in handoff.get("projects", [])}
+
+    for slug in slugs:
+        project_dir = career_root / "projects" / slug
+        output = out_dir / "projects" / f"{slug}.json"
+        if not project_dir.is_dir():
+            entries.pop(slug, None)
+            handoff_entries.pop(slug, None)
+            output.unlink(missing_ok=True)
+            continue
+        payload = export_project(project_dir, args.voice, settings["display_name"], args.voices)
+        if payload:
+            write_atomic(output, dump_json(payload, args.compact))
+        else:
+            output.unlink(missing_ok=True)
+        previous = entries.get(slug)
+        record = handoff_record(project_dir, previous.get("handoff") if isinstance(previous, dict) else None)
+        digest, inputs = project_inputs(project_dir, None, stat_inputs(project_dir))
+        entries[slug] = {"digest": digest, "exported": bool(payload), "inputs": inputs, "handoff": record}
+        handoff_entries[slug] = record_entry(record, set(featured_order))
+
+    manifest["projects"] = dict(sorted(entries.items()))
+    index = {
+        "voice": args.voice,
+        "career_file": "career.public.json",
+        "projects": [slug for slug, entry in manifest["projects"].items() if entry["exported"]],
+    }
+    write_atomic(out_dir / "index.json", dump_json(index, args.compact))
+    write_atomic(out_dir / EXPORT_MANIFEST_NAME, dump_json(manifest, sort_keys=True))
+    handoff["projects"] = order_project_payloads(
+        [handoff_entries[slug] for slug in sorted(handoff_entries)], featured_order
+    )
+
+
+def watch_site(args: argparse.Namespace) -> None:
+    career_root = Path(args.root).expanduser().resolve()
+    out_dir = resolve_out_dir(args)
+    handoff_dir = career_root / "public_site"
+
+    def load_state() -> tuple[dict[str, Any], dict[str, Any]]:
+        handoff = build_handoff(career_root)
+        write_handoff(handoff_dir, handoff, args.compact)
+        return load_export_manifest(out_dir / EXPORT_MANIFEST_NAME), handoff
+
+    manifest, handoff = load_state()
+    snapshot = snapshot_inputs(career_root)
+    pending: set[str] = set()
+    last_change = 0.0
+    print(f"Watching {career_root} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(args.poll_interval)
+            current = snapshot_inputs(career_root)
+            if current != snapshot:
+                pending |= changed_inputs(snapshot, current)
+                snapshot = current
+                last_change = time.monotonic()
+                continue
+            if not pending or time.monotonic() - last_change < args.debounce:
+                continue
+
+            started = time.perf_counter()
+            # career.json feeds every project (display name, voice) and the bundle
+            # layout cannot be patched in place, so both fall back to a full run.
+            if "career.json" in pending or args.format == "bundle":
+                export_site(args)
+                manifest, handoff = load_state()
+                label = "full export"
+            else:
+                touched = {key.split("/")[1] for key in pending if key.startswith("projects/")}
+                # evidence.yml is not an export input; it only feeds the handoff's evidence gaps.
+                slugs = {
+                    key.split("/")[1]
+                    for key in pending
+                    if key.startswith("projects/") and not key.endswith(f"/{EVIDENCE_NAME}")
+                }
+                if slugs:
+                    # Held so a concurrent export or handoff cannot swap out_dir mid-update.
+                    with output_lock(out_dir):
+                        apply_project_changes(args, career_root, out_dir, manifest, handoff, slugs)
+                if touched:
+                    handoff["evidence_gaps"] = evidence_gaps(
+                        load_evidence_index(career_root, [item["slug"] for item in handoff["projects"]])
+                    )
+                if "backlog_questions.md" in pending:
+                    handoff.update(parse_backlog_high_priority(career_root / "backlog_questions.md"))
+                handoff["generated_at_utc"] = datetime.now(timezone.utc).isoformat()
+                write_handoff(handoff_dir, handoff, args.compact)
+                label = ", ".join(sorted(touched)) or "backlog"
+            pending.clear()
+            print(f"Updated {label} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+
+
+def main() -> None:
+    args = parse_args()
+    with profile_session("publish_safe_export", args):
+        export_site(args)
+        if args.watch:
+            watch_site(args)
 
 
 if __name__ == "__main__":
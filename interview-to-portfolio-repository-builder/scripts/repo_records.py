@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Readers and manifest records shared by the export, handoff and pipeline scripts.
+
+load_json and discover_project_dirs read a /career repository. The rest keeps
+public_site/.publish_export_manifest: per project, the digest of its inputs
+with each input's size and mtime, and a handoff record (the project's handoff
+entry with the stat of the website.json it came from). Both are reused while
+index_cache.is_fresh holds, so unchanged projects are not read at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from index_cache import is_fresh
+from publish_output import EXPORT_MANIFEST_NAME, dump_json, write_staged
+
+HANDOFF_ENTRY_KEYS = (
+    "slug",
+    "title",
+    "bucket",
+    "timeline_display",
+    "public_summary",
+    "highlights_count",
+    "outcomes_count",
+    "ready_for_site",
+)
+PROJECT_INPUTS = ("project.md", "website.json")
+
+
+def load_json(path: Path, fallback: dict[str, Any] | None = None) -> dict[str, Any]:
+    if not path.exists():
+        return fallback or {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return fallback or {}
+
+
+def discover_project_dirs(projects_dir: Path) -> list[Path]:
+    try:
+        with os.scandir(projects_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir())
+    except FileNotFoundError:
+        return []
+    return [projects_dir / name for name in names]
+
+
+def slug_to_title(slug: str) -> str:
+    return " ".join(part.capitalize() for part in slug.split("-"))
+
+
+def handoff_entry(slug: str, website: dict[str, Any], featured_set: set[str]) -> dict[str, Any]:
+    structured = website.get("structured_fields") if isinstance(website.get("structured_fields"), dict) else {}
+    display = website.get("display") if isinstance(website.get("display"), dict) else {}
+
+    title = str(display.get("title") or slug_to_title(slug))
+    summary = str(structured.get("public_summary") or "").strip()
+    highlights = [item for item in structured.get("highlights", []) if isinstance(item, str)]
+    outcomes = [item for item in structured.get("outcomes", []) if isinstance(item, str)]
+    if not highlights:
+        highlights = [item for item in structured.get("what_i_built", []) if isinstance(item, str)]
+    if not outcomes:
+        outcomes = [item for item in structured.get("impact_highlights", []) if isinstance(item, str)]
+
+    has_placeholder = any(
+        marker in (title + " " + summary).upper() for marker in ["NEEDS_CLARIFICATION", "MISSING"]
+    )
+
+    return {
+        "slug": slug,
+        "title": title,
+        "bucket": "featured" if slug in featured_set else "archive",
+        "timeline_display": str(display.get("timeline_display") or "hide"),
+        "public_summary": summary,
+        "highlights_count": len(highlights),
+        "outcomes_count": len(outcomes),
+        "ready_for_site": bool((summary or highlights or outcomes) and not has_placeholder),
+    }
+
+
+def handoff_record(project_dir: Path, previous: Any = None) -> dict[str, Any]:
+    # The project's handoff entry (bucket aside) with the stat of the website.json
+    # it was computed from; the export manifest keeps one per project.
+    path = project_dir / "website.json"
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        stat = None
+    if record_is_fresh(previous, stat):
+        return previous
+    website = load_json(path, fallback={})
+    record: dict[str, Any] = {"entry": handoff_entry(project_dir.name, website, set())}
+    if stat is not None:
+        record.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, recorded_ns=time.time_ns())
+    return record
+
+
+def record_is_fresh(record: Any, stat: os.stat_result | None) -> bool:
+    if not isinstance(record, dict) or not isinstance(record.get("entry"), dict):
+        return False
+    if record["entry"].keys() != set(HANDOFF_ENTRY_KEYS):
+        return False
+    if stat is None:
+        return "size" not in record
+    return is_fresh(record, stat.st_size, stat.st_mtime_ns)
+
+
+def record_entry(record: dict[str, Any], featured_set: set[str]) -> dict[str, Any]:
+    # The manifest is written with sorted keys; entries keep handoff_entry's order.
+    entry = {**record["entry"], "bucket": "featured" if record["entry"]["slug"] in featured_set else "archive"}
+    return {key: entry[key] for key in HANDOFF_ENTRY_KEYS}
+
+
+def stat_inputs(project_dir: Path) -> dict[str, os.stat_result | None]:
+    stats: dict[str, os.stat_result | None] = {}
+    for name in PROJECT_INPUTS:
+        try:
+            stats[name] = (project_dir / name).stat()
+        except FileNotFoundError:
+            stats[name] = None
+    return stats
+
+
+def input_is_fresh(recorded: dict[str, Any], name: str, stat: os.stat_result | None) -> bool:
+    if stat is None:
+        return name in recorded and recorded[name] is None
+    return is_fresh(recorded.get(name), stat.st_size, stat.st_mtime_ns)
+
+
+def project_inputs(
+    project_dir: Path, previous: Any, stats: dict[str, os.stat_result | None]
+) -> tuple[str, dict[str, dict[str, int] | None]]:
+    # The previous digest stands while every input still matches its recorded
+    # size and mtime (index_cache.is_fresh); otherwise the inputs are read again.
+    if isinstance(previous, dict) and isinstance(previous.get("inputs"), dict) and "digest" in previous:
+        recorded = previous["inputs"]
+        if all(input_is_fresh(recorded, name, stat) for name, stat in stats.items()):
+            return previous["digest"], recorded
+    recorded_ns = time.time_ns()
+    digest = inputs_digest([project_dir / name for name in PROJECT_INPUTS])
+    inputs = {
+        name: None if stat is None else {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "recorded_ns": recorded_ns}
+        for name, stat in stats.items()
+    }
+    return digest, inputs
+
+
+def inputs_digest(paths: list[Path]) -> str:
+    return contents_digest([(path.name, path.read_bytes() if path.exists() else None) for path in paths])
+
+
+def contents_digest(contents: list[tuple[str, bytes | None]]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for name, content in contents:
+        if content is None:
+            digest.update(f"{name}:-\n".encode("utf-8"))
+        else:
+            digest.update(f"{name}:{len(content)}\n".encode("utf-8"))
+            digest.update(content)
+    return digest.hexdigest()
+
+
+def load_export_manifest(path: Path) -> dict[str, Any]:
+    manifest = load_json(path, fallback={})
+    if not isinstance(manifest.get("projects"), dict):
+        manifest["projects"] = {}
+    return manifest
+
+
+def write_export_manifest(staging: Path, manifest: dict[str, Any]) -> None:
+    write_staged(staging, EXPORT_MANIFEST_NAME, dump_json(manifest, sort_keys=True))
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The scripts are standalone and import their siblings directly.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "interview-to-portfolio-repository-builder" / "scripts"))
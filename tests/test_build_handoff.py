@@ -0,0 +1,50 @@
+"""The handoff lists open HIGH backlog questions that pass publish lint and counts the rest."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from build_handoff import build_handoff, render_markdown
+from publish_lint import lint_text
+from publish_output import dump_json
+
+BACKLOG = """## Missing details
+- [ ] Add missing resume fields: full dates, metrics, and project evidence. (priority: HIGH) (related: general)
+- [ ] Which team owned the billing rewrite? (priority: HIGH) (related: alpha)
+- [ ] Confirm the latency numbers (Confidence: LOW, Evidence: MISSING) (priority: HIGH)
+- [ ] Clarify the NEEDS_CLARIFICATION note in beta (priority: high) (related: beta)
+- [ ] What was the launch date? (priority: MED)
+- [x] Who sponsored the migration? (priority: HIGH)
+"""
+
+
+def handoff_for(tmp_path: Path, backlog: str | None) -> dict:
+    if backlog is not None:
+        (tmp_path / "backlog_questions.md").write_text(backlog, encoding="utf-8")
+    return build_handoff(tmp_path)
+
+
+def test_backlog_lists_publishable_questions_and_counts_withheld(tmp_path: Path) -> None:
+    handoff = handoff_for(tmp_path, BACKLOG)
+    assert handoff["high_priority_backlog"] == [
+        "Which team owned the billing rewrite?",
+        "Confirm the latency numbers",
+    ]
+    assert handoff["high_priority_backlog_withheld"] == 2
+    markdown = render_markdown(handoff)
+    assert (
+        "## High Priority Backlog\n"
+        "- Which team owned the billing rewrite?\n"
+        "- Confirm the latency numbers\n"
+        "- 2 more item(s) withheld from this handoff; see backlog_questions.md\n"
+    ) in markdown
+    assert not lint_text(dump_json(handoff), "website_handoff.json")
+    assert not lint_text(markdown, "website_handoff.md")
+
+
+def test_backlog_without_high_items(tmp_path: Path) -> None:
+    for backlog in (None, "- [ ] What was the launch date? (priority: MED)\n"):
+        handoff = handoff_for(tmp_path, backlog)
+        assert handoff["high_priority_backlog"] == []
+        assert handoff["high_priority_backlog_withheld"] == 0
+        assert "## High Priority Backlog\n- NONE\n" in render_markdown(handoff)
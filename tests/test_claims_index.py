@@ -0,0 +1,134 @@
+"""Incremental claims.md updates must produce exactly the index a full parse produces."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from claims_index import empty_index, load_claims_index, parse_claims, prefix_digest, query_claims, update_index
+
+CLAIM_A = b'- Claim: "Cut costs by 30%"\n  Confidence: HIGH\n  Evidence: https://example.com/a\n  Related: alpha\n'
+CLAIM_B = b"- Claim: Led the migration\n  Confidence: MED\n  Evidence: MISSING\n  Related: alpha, beta\n"
+CLAIM_C = b"- Claim: Shipped search\n  Confidence: LOW\n  Evidence: notes/c.md\n"
+
+LINES = [
+    b"- Claim: Built the pipeline\n",
+    b'- claim: "Quoted claim"\n',
+    b"- Claim:\n",
+    b"  Confidence: HIGH\n",
+    b"  Confidence: medium\n",
+    b"\tEvidence: MISSING\n",
+    b"  Evidence: https://example.com/x\n",
+    b"  Evidence: docs/x.md\n",
+    b"  Related: alpha\n",
+    b"  Related: beta, general\n",
+    b"  stray indented note\n",
+    b"Confidence: HIGH\n",
+    b"## Heading\n",
+    b"Some prose.\n",
+    b"\n",
+    b"   \n",
+    b"\r\n",
+    b"\r",
+]
+
+
+def full_index(content: bytes) -> dict[str, Any]:
+    return parse_claims(content, empty_index())
+
+
+def incremental_indexes(contents: list[bytes]) -> list[dict[str, Any]]:
+    # Mirrors load_claims_index: each version is updated from the previous
+    # cache entry, round-tripped through JSON as it would be on disk.
+    cache = None
+    indexes = []
+    for content in contents:
+        index = update_index(content, cache)
+        indexes.append(index)
+        cache = {
+            "index": json.loads(json.dumps(index)),
+            "prefix_digest": prefix_digest(content, index["tail_offset"]),
+        }
+    return indexes
+
+
+def claims_of(index: dict[str, Any]) -> list[str]:
+    return [claim["claim"] for claim in query_claims(index)]
+
+
+def edited(rng: random.Random, lines: list[bytes]) -> list[bytes]:
+    lines = list(lines)
+    action = rng.choice(["append", "append", "truncate", "edit_last", "edit", "insert", "delete"])
+    if action == "append" or not lines:
+        lines.extend(rng.choice(LINES) for _ in range(rng.randint(1, 6)))
+    elif action == "truncate":
+        del lines[rng.randrange(len(lines)) :]
+    elif action == "edit_last":
+        lines[-1] = rng.choice(LINES)
+    elif action == "edit":
+        lines[rng.randrange(len(lines))] = rng.choice(LINES)
+    elif action == "insert":
+        lines.insert(rng.randrange(len(lines) + 1), rng.choice(LINES))
+    else:
+        del lines[rng.randrange(len(lines))]
+    return lines
+
+
+def test_shrinking_to_the_prefix_keeps_earlier_claims() -> None:
+    contents = [CLAIM_A + CLAIM_B, CLAIM_A, CLAIM_A + CLAIM_C]
+    final = incremental_indexes(contents)[-1]
+    assert claims_of(final) == ["Cut costs by 30%", "Shipped search"]
+    assert final == full_index(contents[-1])
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        [CLAIM_A, CLAIM_A + CLAIM_B, CLAIM_A + CLAIM_B + CLAIM_C],
+        [CLAIM_A + CLAIM_B, CLAIM_A + CLAIM_B.replace(b"MED", b"HIGH")],
+        [CLAIM_A + CLAIM_B, CLAIM_A + b"## Notes\n" + CLAIM_C],
+        [CLAIM_A + CLAIM_B, CLAIM_A + b"\n  Confidence: LOW\n"],
+        [CLAIM_A + CLAIM_B, CLAIM_A[:-1] + b"\r", CLAIM_A[:-1] + b"\r\n" + CLAIM_C],
+        [CLAIM_A + CLAIM_B, b"", CLAIM_C],
+    ],
+)
+def test_edit_sequences_match_full_parse(contents: list[bytes]) -> None:
+    for content, index in zip(contents, incremental_indexes(contents)):
+        assert index == full_index(content), content
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_edits_match_full_parse(seed: int) -> None:
+    rng = random.Random(seed)
+    lines: list[bytes] = []
+    contents = []
+    for _ in range(2000):
+        lines = edited(rng, lines)
+        contents.append(b"".join(lines))
+    for content, index in zip(contents, incremental_indexes(contents)):
+        assert index == full_index(content), content
+
+
+def test_cached_index_survives_shrink_and_regrow(tmp_path: Path) -> None:
+    claims_path = tmp_path / "claims.md"
+    for step, content in enumerate([CLAIM_A + CLAIM_B, CLAIM_A, CLAIM_A + CLAIM_C], start=1):
+        claims_path.write_bytes(content)
+        # Distinct, old mtimes so every step is re-read rather than served as fresh.
+        os.utime(claims_path, ns=(step * 10**9, step * 10**9))
+        index = load_claims_index(claims_path)
+    assert claims_of(index) == ["Cut costs by 30%", "Shipped search"]
+
+
+def test_evidence_filter_matches_record_status() -> None:
+    index = full_index(CLAIM_A + CLAIM_B + CLAIM_C)
+    for status in ("missing", "url", "path"):
+        expected = [claim for claim in query_claims(index) if claim["evidence_status"] == status]
+        assert query_claims(index, evidence=status) == expected
+        assert query_claims(index, related="alpha", evidence=status) == [
+            claim for claim in expected if "alpha" in claim["related"]
+        ]
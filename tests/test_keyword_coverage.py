@@ -0,0 +1,47 @@
+"""Keywords are matched on casefolded Unicode words, so non-ASCII keywords are scored, not dropped."""
+
+from __future__ import annotations
+
+from keyword_coverage import (
+    collect_postings,
+    coverage_report,
+    normalize_phrase,
+    phrase_grams,
+    phrase_length,
+    project_fragments,
+    score_postings,
+)
+
+KEYWORDS = ["日本語", "Café Analytics", "naïve Bayes", "C++"]
+PROJECTS = {
+    "search": {"structured_fields": {"highlights": ["Shipped 日本語 search", "Owned CAFÉ ANALYTICS dashboards"]}},
+    "ranking": {"structured_fields": {"highlights": ["Trained a NAÏVE BAYES baseline in C++"]}},
+}
+
+
+def coverage() -> dict:
+    career = {"targeting_profile": {"keyword_bank": {"must_have": KEYWORDS}}}
+    postings, labels = collect_postings(career, [])
+    max_tokens = phrase_length(phrase for posting in postings for phrase in posting["keywords"])
+    slugs = list(PROJECTS)
+    grams = [phrase_grams(project_fragments(None, website), max_tokens) for website in PROJECTS.values()]
+    vocabulary, columns, best, _ = score_postings(postings, grams, "python", 3)
+    return coverage_report(slugs, postings, labels, vocabulary, columns, best, 25)
+
+
+def test_non_ascii_keywords_keep_their_letters() -> None:
+    assert normalize_phrase("日本語") == "日本語"
+    assert normalize_phrase("Café") == "café"
+    assert normalize_phrase("naïve Bayes") == "naïve bayes"
+    assert normalize_phrase("C++ / C#") == "c++ c#"
+
+
+def test_non_ascii_keywords_are_covered_and_missing() -> None:
+    report = coverage()
+    assert report["keyword_count"] == len(KEYWORDS)
+    # Equal demand, so keywords are listed in phrase order.
+    assert report["projects"]["search"]["covered"] == ["Café Analytics", "日本語"]
+    assert report["projects"]["search"]["missing"] == ["C++", "naïve Bayes"]
+    assert report["projects"]["ranking"]["covered"] == ["C++", "naïve Bayes"]
+    assert report["projects"]["ranking"]["missing"] == ["Café Analytics", "日本語"]
+    assert report["uncovered_keywords"] == []
@@ -0,0 +1,104 @@
+"""parse_project_markdown must return exactly what the original regex-based parser returned."""
+
+from __future__ import annotations
+
+import random
+import re
+from typing import Any
+
+import pytest
+
+from bootstrap_career_repo import PROJECT_MD_TEMPLATE
+from publish_safe_export import parse_project_markdown, section_key, strip_frontmatter
+
+
+def reference_parse_project_markdown(markdown: str) -> dict[str, Any]:
+    # The parser as it was before the single-pass rewrite, kept verbatim.
+    clean_markdown = strip_frontmatter(markdown.replace("\r\n", "\n")).strip()
+    title_match = re.search(r"^#\s+(.+)$", clean_markdown, flags=re.MULTILINE)
+
+    first_section_match = re.search(r"^##\s+", clean_markdown, flags=re.MULTILINE)
+    preface = clean_markdown[: first_section_match.start()] if first_section_match else clean_markdown
+
+    def extract_meta(label: str) -> str:
+        pattern = re.compile(rf"\*\*{re.escape(label)}:\*\*\s*(.+)")
+        match = pattern.search(preface)
+        return match.group(1).strip() if match else ""
+
+    stack_match = re.search(r"\*\*Stack:\*\*[\s\S]*?(?=\n##\s+|$)", preface)
+    stack = []
+    if stack_match:
+        stack = [
+            line.strip()[2:].strip() for line in stack_match.group(0).splitlines() if line.strip().startswith("- ")
+        ]
+
+    section_matches = list(re.finditer(r"^##\s+(.+)$", clean_markdown, flags=re.MULTILINE))
+    sections: list[dict[str, Any]] = []
+    for index, match in enumerate(section_matches):
+        heading = match.group(1).strip()
+        body_start = match.end()
+        body_end = section_matches[index + 1].start() if index + 1 < len(section_matches) else len(clean_markdown)
+        body = clean_markdown[body_start:body_end].strip()
+        bullets = [line.strip()[2:].strip() for line in body.splitlines() if line.strip().startswith("- ")]
+        prose = "\n".join(
+            line for line in body.splitlines() if line.strip() and not line.strip().startswith("- ")
+        ).strip()
+        sections.append({"heading": heading, "key": section_key(heading), "body": prose, "bullets": bullets})
+
+    return {
+        "title": title_match.group(1).strip() if title_match else "Untitled Project",
+        "when": extract_meta("When"),
+        "context": extract_meta("Context"),
+        "my_role": extract_meta("My role"),
+        "stack": stack,
+        "sections": sections,
+    }
+
+
+CORPUS = [
+    "",
+    "   \n\n",
+    PROJECT_MD_TEMPLATE.format(project_name="Fraud Detection v2"),
+    "---\ntitle: x\n---\n# Alpha\n**When:** 2021\n**Stack:**\n- Python\n- Postgres\n\n## What I built\n- One\nProse.\n",
+    "---\nunterminated frontmatter\n# Title\n## Section\nbody",
+    "# Title only, no sections\n**Context:** Built a thing\n- stray bullet",
+    "## Section before any title\n- a\n# Late title\n## Next\ntext",
+    "#\nTitle on the next line\n##\n\nHeading on a later line\n- bullet",
+    "#NoSpace\n##AlsoNoSpace\n# Real title\n## Real section\nbody",
+    "# T\r\n## Windows\r\n- bullet\r\nprose\r\n",
+    "# T\n## Odd breaks\n- a\rb\x0bc\x0c- d\x1c- e\x85- f - g tail",
+    "# T\n**Stack:**\n-  spaced\n-\ttabbed\n  - nested\n## S\n-   - double\n- \n-",
+    "# T\n## Café ünïcode\n- naïve bullet\n - non-breaking indent\n",
+    "# T\n## Same\n- one\n## Same\n- two\n### Deeper heading\n- three",
+    "# T\n##\n",
+    "# T\n## Trailing heading",
+]
+
+ATOMS = [
+    "#", "##", "###", " ", "\t", "\n", "\n", "\n", "\r", "\r\n", "\x0b", "\x0c", "\x1c", "\x85", " ",
+    "\xa0", "\x1f", "- ", "-", "foo", "Bar baz", "**When:**", "**Context:**", "**My role:**", "**Stack:**",
+    "---", "x", "  - item",
+]
+
+
+def generated_documents(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        if rng.random() < 0.3:
+            lines = ("".join(rng.choice(ATOMS) for _ in range(rng.randint(0, 5))) for _ in range(rng.randint(0, 12)))
+            documents.append("\n".join(lines))
+        else:
+            documents.append("".join(rng.choice(ATOMS) for _ in range(rng.randint(0, 40))))
+    return documents
+
+
+@pytest.mark.parametrize("markdown", CORPUS)
+def test_corpus_matches_reference(markdown: str) -> None:
+    assert parse_project_markdown(markdown) == reference_parse_project_markdown(markdown)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_generated_documents_match_reference(seed: int) -> None:
+    for markdown in generated_documents(5000, seed):
+        assert parse_project_markdown(markdown) == reference_parse_project_markdown(markdown), repr(markdown)
@@ -0,0 +1,79 @@
+"""The memory-mapped text lint must report exactly what the line-by-line lint reports, in bounded memory."""
+
+from __future__ import annotations
+
+import random
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import publish_lint
+from publish_lint import lint_text, lint_text_mapped
+
+ATOMS = [
+    "a", "word ", "Zürich ", "東京", " ", "   ", "\t", "\n", "\r", "\r\n", "\x0c", " ", "\x85",
+    "MISSING", "missing.", "xMISSINGx", "NEEDS_CLARIFICATION", "PRIVATE_UNSHARED", "/Users/", "Confidence",
+    ":", "Confidence:", "Evidence", "evidence  :", "İ",
+]
+
+
+def generated_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 60)):
+        atom = rng.choice(ATOMS)
+        parts.append(atom * rng.randint(1, 40) if rng.random() < 0.1 else atom)
+    return "".join(parts)
+
+
+def reference_issues(path: Path) -> list[dict]:
+    return lint_text(path.read_text(encoding="utf-8"), str(path))
+
+
+@pytest.mark.parametrize("window", [8, 16, 64])
+def test_small_windows_match_line_lint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, window: int) -> None:
+    monkeypatch.setattr(publish_lint, "MAPPED_WINDOW_BYTES", window)
+    monkeypatch.setattr(publish_lint, "LONG_LINE_CARRY_CHARS", 24)
+    rng = random.Random(window)
+    path = tmp_path / "notes.md"
+    for _ in range(1500):
+        text = generated_text(rng)
+        path.write_bytes(text.encode("utf-8"))
+        assert list(lint_text_mapped(path)) == reference_issues(path), repr(text)
+
+
+def test_tokens_split_across_long_line_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(publish_lint, "MAPPED_WINDOW_BYTES", 32)
+    path = tmp_path / "notes.md"
+    filler = "x" * 29
+    for text in [
+        filler + "MISSING tail" * 5,
+        "MISSI" + "NG" + filler * 4,
+        filler + "Confidence" + " " * 500 + ": HIGH",
+        "y" * 31 + "MISSING" + filler * 3,
+        "line one\r" + filler * 3 + "/Users/\rlast",
+    ]:
+        path.write_bytes(text.encode("utf-8"))
+        assert list(lint_text_mapped(path)) == reference_issues(path), repr(text)
+
+
+def test_large_file_without_newline_stays_bounded(tmp_path: Path) -> None:
+    path = tmp_path / "minified.md"
+    size_mb = 24
+    block = ("publishable text " * 60 + "\n").replace("\n", " ")
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("start " + block)
+        for index in range(size_mb * 1024 * 1024 // len(block)):
+            handle.write("NEEDS_CLARIFICATION " if index == 9000 else block)
+        handle.write("Evidence: MISSING")
+    window = publish_lint.MAPPED_WINDOW_BYTES
+    tracemalloc.start()
+    try:
+        issues = list(lint_text_mapped(path))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert [issue["rule"] for issue in issues] == ["NEEDS_CLARIFICATION", "MISSING_MARKER", "EVIDENCE_METADATA"]
+    assert {issue["line"] for issue in issues} == {1}
+    assert issues[0]["snippet"] == ("start " + block)[:140]
+    assert peak < 8 * window